@@ -0,0 +1,122 @@
+"""Background autosave for the API servers.
+
+Request handlers call ``AutosaveWorker.request()`` while they still hold the
+server lock. That only marks what changed (``GameFacade.note_save``) and wakes
+the worker thread. The worker waits ``delay`` seconds so a burst of requests
+becomes one save, then takes the lock just long enough to capture a
+``DeltaSnapshot`` (the dirty chunks as immutable ``marshal`` blobs) and
+encodes and writes it after releasing the lock. Chunk files and the manifest
+are written to temp files and renamed into place.
+
+``flush()`` writes anything still pending and waits for it. The servers call it
+on shutdown and from the parent watchdog before exiting. Never call it while
+holding the server lock: the worker needs that lock to take its snapshot.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Optional
+
+AUTOSAVE_DELAY_SECONDS = 0.25
+AUTOSAVE_FLUSH_TIMEOUT_SECONDS = 30.0
+
+
+class AutosaveWorker:
+    """Coalescing background writer of delta saves for one save path.
+
+    ``facade`` is a callable returning the server's current GameFacade, since the
+    servers (and their tests) may swap the facade out after construction.
+    """
+
+    def __init__(
+        self,
+        facade: Callable[[], Any],
+        save_path: str,
+        lock: Any,
+        delay: float = AUTOSAVE_DELAY_SECONDS,
+    ) -> None:
+        self.facade = facade
+        self.save_path = save_path
+        self.lock = lock
+        self.delay = delay
+        self.saves = 0
+        self._cond = threading.Condition()
+        self._pending = False
+        self._busy = False
+        self._hurry = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def request(self, scoped: bool = False) -> None:
+        """Queue an autosave of the change the caller just made (call with the lock held)."""
+        self.facade().note_save(scoped)
+        with self._cond:
+            if self._stopped:
+                return
+            self._pending = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    @property
+    def pending(self) -> bool:
+        with self._cond:
+            return self._pending or self._busy
+
+    def flush(self, timeout: Optional[float] = AUTOSAVE_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """Write any pending autosave now; returns False if it did not finish in ``timeout``."""
+        with self._cond:
+            if self._thread is None:
+                return True
+            self._hurry = True
+            self._cond.notify_all()
+            done = self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+            self._hurry = False
+            return done
+
+    def stop(self, timeout: Optional[float] = AUTOSAVE_FLUSH_TIMEOUT_SECONDS) -> bool:
+        """Flush, then stop the worker thread."""
+        done = self.flush(timeout)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        return done
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending or self._stopped)
+                if not self._pending:
+                    return
+                # Let a burst of requests settle into one save.
+                self._cond.wait_for(lambda: self._hurry or self._stopped, self.delay)
+                self._pending = False
+                self._busy = True
+            try:
+                self._save()
+            except Exception:
+                logging.exception("Autosave failed: %s", self.save_path)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _save(self) -> None:
+        with self.lock:
+            facade = self.facade()
+            snapshot = facade.snapshot_save(self.save_path)
+        try:
+            snapshot.write()
+        except Exception:
+            with self.lock:
+                league = getattr(facade, "league", None)
+                if league is not None:
+                    league.mark_dirty()
+            raise
+        self.saves += 1
@@ -11,6 +11,7 @@ import time
 import urllib.parse
 from typing import Any, Dict, Tuple
 
+from gridiron_gm_pkg.api.autosave import AutosaveWorker
 from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
 from gridiron_gm_pkg.simulation.persistence.savegame import SCHEMA_VERSION
 from gridiron_gm_pkg.api import schemas
@@ -73,6 +74,7 @@ class RpcServer:
         self.save_path = save_path
         self.parent_pid = parent_pid
         self.lock = threading.Lock()
+        self.autosave = AutosaveWorker(lambda: self.facade, save_path, self.lock) if save_path else None
         self._shutdown_requested = False
         self._out = sys.stdout
         sys.stdout = sys.stderr
@@ -89,18 +91,29 @@ class RpcServer:
                 logging.exception("Watchdog error")
                 return
             logging.info("Parent process exited. Shutting down.")
+            self.flush_autosave()
             os._exit(0)
 
         threading.Thread(target=watch, daemon=True).start()
 
-    def _maybe_autosave_locked(self) -> None:
-        if not self.save_path:
+    def _maybe_autosave_locked(self, scoped: bool = False) -> None:
+        if self.autosave is None:
             return
         try:
-            self.facade.save(self.save_path)
+            self.autosave.request(scoped=scoped)
         except Exception:
             logging.exception("Autosave failed: %s", self.save_path)
 
+    def flush_autosave(self) -> None:
+        """Write any queued autosave and wait for it (must not be called holding the lock)."""
+        if self.autosave is None:
+            return
+        try:
+            if not self.autosave.flush():
+                logging.error("Autosave flush timed out: %s", self.save_path)
+        except Exception:
+            logging.exception("Autosave flush failed: %s", self.save_path)
+
     def serve(self) -> None:
         self._start_parent_watchdog()
         while not self._shutdown_requested:
@@ -229,6 +242,13 @@ class RpcServer:
             return 500, {"ok": False, "error": error}
 
     def dispatch(self, method: str, path: str, json_body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        if method == "GET":
+            # Reads share the facade with the autosave worker's snapshots.
+            with self.lock:
+                return self._dispatch(method, path, json_body)
+        return self._dispatch(method, path, json_body)
+
+    def _dispatch(self, method: str, path: str, json_body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
         try:
             parsed = urllib.parse.urlparse(path)
             path_only = parsed.path
@@ -503,7 +523,7 @@ class RpcServer:
                     team_id = json_body.get("team_id")
                     with self.lock:
                         resp = self.facade.auto_fill_depth_chart(team_id)
-                        self._maybe_autosave_locked()
+                        self._maybe_autosave_locked(scoped=True)
                         return 200, resp
                 if path_only == "/update_depth_chart":
                     with self.lock:
@@ -513,7 +533,7 @@ class RpcServer:
                             json_body.get("action", ""),
                             json_body.get("team_id"),
                         )
-                        self._maybe_autosave_locked()
+                        self._maybe_autosave_locked(scoped=True)
                         return 200, resp
                 if path_only == "/stop_continue":
                     with self.lock:
@@ -563,7 +583,7 @@ class RpcServer:
                         resp = self.facade.mark_inbox_read(
                             message_id, team_id, include_messages=bool(include_messages)
                         )
-                        self._maybe_autosave_locked()
+                        self._maybe_autosave_locked(scoped=True)
                         return 200, resp
                 if path_only == "/inbox/acknowledge":
                     notification_id = json_body.get("notification_id")
@@ -581,7 +601,7 @@ class RpcServer:
                             team_id,
                             include_messages=bool(include_messages),
                         )
-                        self._maybe_autosave_locked()
+                        self._maybe_autosave_locked(scoped=True)
                         return 200, resp
                 if path_only == "/new_game":
                     with self.lock:
@@ -613,6 +633,7 @@ class RpcServer:
                         self._maybe_autosave_locked()
                         return 200, resp
                 if path_only == "/reset_save":
+                    self.flush_autosave()
                     with self.lock:
                         resp = self.facade.reset_save(self.save_path)
                         self._maybe_autosave_locked()
@@ -658,7 +679,10 @@ def run(save_path: str, parent_pid: int = 0) -> None:
                 logging.exception("Fallback new_game failed; will rely on lazy init")
     else:
         logging.info("No savegame found at %s; starting fresh", save_path)
-    server.serve()
+    try:
+        server.serve()
+    finally:
+        server.flush_autosave()
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ from typing import Any, Dict
 import logging
 import traceback
 
+from gridiron_gm_pkg.api.autosave import AutosaveWorker
 from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
 from gridiron_gm_pkg.simulation.persistence.savegame import SCHEMA_VERSION
 from gridiron_gm_pkg.api import schemas  # new: strict schemas
@@ -24,10 +25,42 @@ logging.basicConfig(
 )
 
 
+# POST endpoints that change the league and so queue an autosave when enabled.
+_AUTOSAVE_PATHS = frozenset(
+    {
+        "/advance_day",
+        "/advance_to_next_event",
+        "/advance_to_end_of_day",
+        "/advance_one_week",
+        "/advance_hour",
+        "/advance_to_milestone",
+        "/continue_until_pause",
+        "/continue",
+        "/auto_fill_depth_chart",
+        "/update_depth_chart",
+        "/sim_until",
+        "/simulate_user_game",
+        "/inbox/mark_read",
+        "/inbox/acknowledge",
+        "/inbox/mark_all_read",
+        "/new_game",
+        "/roster/review",
+        "/transactions/sign_free_agent",
+        "/transactions/release_player",
+        "/decisions/resolve",
+        "/set_user_team",
+        "/reset_save",
+    }
+)
+
+
 class _Handler(BaseHTTPRequestHandler):
     facade: GameFacade = GameFacade()
     lock = threading.Lock()
     save_path: str = "./savegame.json"
+    autosave: AutosaveWorker | None = None
+    # Whether the last response sent reported success; gates the autosave after a POST.
+    response_ok = False
 
     def _shutdown_server(self) -> None:
         print("[API] Shutdown requested.")
@@ -47,6 +80,7 @@ class _Handler(BaseHTTPRequestHandler):
             error_payload = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
             data = json.dumps(error_payload).encode("utf-8")
             status = 500
+        self.response_ok = status < 400 and not (isinstance(payload, dict) and payload.get("ok") is False)
         try:
             self.close_connection = True
             self.send_response(status)
@@ -415,7 +449,18 @@ class _Handler(BaseHTTPRequestHandler):
             duration = time.time() - start
             logging.info("GET %s completed in %.3fs", getattr(self, "path", ""), duration)
 
+    def _flush_autosave(self) -> None:
+        if self.autosave is not None and not self.autosave.flush():
+            logging.error("Autosave flush timed out: %s", self.save_path)
+
     def do_POST(self) -> None:
+        self.response_ok = False
+        self._handle_post()
+        if self.autosave is not None and self.response_ok and self.path in _AUTOSAVE_PATHS:
+            with self.lock:
+                self.autosave.request()
+
+    def _handle_post(self) -> None:
         start = time.time()
         try:
             if self.path == "/advance_day":
@@ -671,6 +716,7 @@ class _Handler(BaseHTTPRequestHandler):
                     self._send_json(200, self.facade.set_user_team(team_id))
                 return
             if self.path == "/reset_save":
+                self._flush_autosave()
                 with self.lock:
                     self._send_json(200, self.facade.reset_save(self.save_path))
                 return
@@ -690,6 +736,7 @@ class _Handler(BaseHTTPRequestHandler):
                     return
                 if not path:
                     path = self.save_path
+                self._flush_autosave()
                 with self.lock:
                     if self.path == "/save":
                         self._send_json(200, self.facade.save(path))
@@ -761,6 +808,8 @@ def _start_parent_watchdog(server: ThreadingHTTPServer, parent_pid: int) -> None
             print(f"[API] Watchdog error: {exc}")
             return
         print("[API] Parent process exited. Shutting down.")
+        if _Handler.autosave is not None:
+            _Handler.autosave.flush()
         try:
             server.shutdown()
         except Exception as exc:
@@ -774,11 +823,15 @@ def make_server(
     port: int = 8000,
     facade: GameFacade | None = None,
     save_path: str | None = None,
+    autosave: bool = False,
 ) -> ThreadingHTTPServer:
     if facade is not None:
         _Handler.facade = facade
     if save_path is not None:
         _Handler.save_path = save_path
+    _Handler.autosave = None
+    if autosave and _Handler.save_path:
+        _Handler.autosave = AutosaveWorker(lambda: _Handler.facade, _Handler.save_path, _Handler.lock)
     return ThreadingHTTPServer((host, port), _Handler)
 
 
@@ -788,8 +841,9 @@ def run(
     facade: GameFacade | None = None,
     save_path: str | None = None,
     parent_pid: int = 0,
+    autosave: bool = False,
 ) -> None:
-    server = make_server(host, port, facade, save_path)
+    server = make_server(host, port, facade, save_path, autosave=autosave)
     logging.info(
         "Starting backend; repo_root=%s cwd=%s save_path=%s host=%s port=%s",
         os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")),
@@ -806,6 +860,8 @@ def run(
     finally:
         server.shutdown()
         server.server_close()
+        if _Handler.autosave is not None:
+            _Handler.autosave.stop()
 
 
 def _parse_args() -> argparse.Namespace:
@@ -814,9 +870,10 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--port", type=int, default=8765)
     parser.add_argument("--save-path", default="./savegame.json")
     parser.add_argument("--parent-pid", type=int, default=0)
+    parser.add_argument("--autosave", action="store_true", help="Save in the background after each change")
     return parser.parse_args()
 
 
 if __name__ == "__main__":
     args = _parse_args()
-    run(args.host, args.port, save_path=args.save_path, parent_pid=args.parent_pid)
+    run(args.host, args.port, save_path=args.save_path, parent_pid=args.parent_pid, autosave=args.autosave)
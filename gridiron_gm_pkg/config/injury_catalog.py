@@ -1,3 +1,6 @@
+# Entries may also set "frequency" (relative likelihood, default 1.0) and
+# "position_weights" ({position: multiplier}, default 1.0 each); see
+# simulation/systems/player/injury_sampler.py.
 INJURY_CATALOG = {
     # -- MUSCLE & SOFT TISSUE INJURIES --
     "Hamstring Strain": {
@@ -3,6 +3,7 @@
 __all__ = [
     "game_engine",
     "penalty_engine",
+    "play_record",
     "play_time_model",
     "stat_utils",
 ]
@@ -6,6 +6,10 @@ from gridiron_gm_pkg.simulation.systems.roster.depth_chart import generate_depth
 from gridiron_gm_pkg.config.formations import FORMATION_SCHEMES
 from gridiron_gm_pkg.simulation.systems.player.fatigue import FatigueSystem
 from gridiron_gm_pkg.simulation.engine.stat_utils import merge_player_stats, get_top_performers
+from gridiron_gm_pkg.simulation.engine import play_record as pr
+from gridiron_gm_pkg.simulation.engine.play_time_model import estimate_play_seconds
+from gridiron_gm_pkg.simulation.systems.player.injury_status import assign_catalog_injury
+from gridiron_gm_pkg.simulation.engine.penalty_engine import PenaltyProfileCache
 
 # ==== Simulation Factor Stubs ====
 # These functions are placeholders for more advanced simulation logic.
@@ -35,6 +39,25 @@ def apply_home_field_advantage(home_team: Any, away_team: Any, play_context: Dic
     """Stub: Returns a modifier for home field advantage."""
     return 1.0
 
+# ---- Play-by-play detail levels ----
+# stats_only skips every log string, summary keeps one line per drive, full_pbp logs each play.
+DETAIL_STATS_ONLY = "stats_only"
+DETAIL_SUMMARY = "summary"
+DETAIL_FULL_PBP = "full_pbp"
+DETAIL_LEVELS = (DETAIL_STATS_ONLY, DETAIL_SUMMARY, DETAIL_FULL_PBP)
+
+def resolve_detail_level(detail_level: Optional[str] = None, context: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Returns a valid detail level, falling back to context["detail_level"] and then full_pbp.
+    """
+    if detail_level is None and isinstance(context, dict):
+        detail_level = context.get("detail_level")
+    if detail_level is None:
+        return DETAIL_FULL_PBP
+    if detail_level not in DETAIL_LEVELS:
+        raise ValueError(f"Unknown detail_level {detail_level!r}; expected one of {DETAIL_LEVELS}")
+    return detail_level
+
 # ---- Fatigue Integration (updated) ----
 
 fatigue_system = FatigueSystem()
@@ -89,11 +112,11 @@ def get_injury_risk_modifier(player: Any) -> float:
 
 # ---- Player Selection & Play Simulation ----
 
-def select_fresh_player(depth_chart_list, threshold: float = 0.7, last_used=None):
+def select_fresh_player(depth_chart_list, threshold: float = 0.7, last_used=None, detail_level: str = DETAIL_FULL_PBP):
     """
     Selects the freshest (least fatigued) player from a depth chart list, above a threshold.
     If all are fatigued, returns the primary (first) player.
-    Optionally logs a substitution if last_used is provided.
+    Optionally logs a substitution if last_used is provided and detail_level is full_pbp.
     """
     if not depth_chart_list:
         return None
@@ -104,41 +127,102 @@ def select_fresh_player(depth_chart_list, threshold: float = 0.7, last_used=None
             selected = player
             break
     selected = selected or primary
-    if last_used and getattr(selected, "name", None) != getattr(last_used, "name", None):
+    if detail_level == DETAIL_FULL_PBP and last_used and getattr(selected, "name", None) != getattr(last_used, "name", None):
         selected.subbed_in = f"[SUB] {getattr(last_used, 'name', 'Unknown')} (fatigue {getattr(last_used, 'fatigue', 0.0):.2f}) → {getattr(selected, 'name', 'Unknown')}"
     return selected
 
-def simulate_pass_play(qb: Any, wr_list: List[Any], depth: str, context: Dict[str, Any]) -> Dict[str, Any]:
+def resolve_player_speed(player: Any) -> float:
+    """
+    Returns a player's effective speed, falling back to the raw attribute and then overall.
+    """
+    speed_method = getattr(player, "get_effective_attribute", None)
+    speed = speed_method("speed") if speed_method else getattr(player, "speed", None)
+    return speed or getattr(player, "overall", 85)
+
+class PlayContext:
+    """
+    Per-drive cache for simulate_pass_play.
+    Holds the matchup modifier, resolved player speeds and the depth lookup tables,
+    so each snap only pays for RNG draws and arithmetic.
+    """
+    COMPLETION_CHANCE = {"short": 0.78, "medium": 0.62, "deep": 0.38}
+    BASE_RANGE = {"short": (3, 8), "medium": (8, 18), "deep": (18, 40)}
+    BIG_PLAY_CHANCE = {"short": 0.03, "medium": 0.03, "deep": 0.08}
+    RECEIVER_FATIGUE = {"short": 4 + 0 * 1.5, "medium": 4 + 1 * 1.5, "deep": 4 + 2 * 1.5}
+
+    __slots__ = ("context", "offense", "defense", "modifier", "current_date", "_speeds")
+
+    def __init__(self, context: Dict[str, Any]):
+        self.context = context
+        self.offense = context.get("offense")
+        self.defense = context.get("defense")
+        self.modifier = (
+            apply_roster_skill(context["offense"], context["defense"], context) *
+            apply_coaching(context["offense"], context["defense"], context) *
+            apply_player_matchups(context["offense"], context["defense"], context) *
+            apply_schemes(context["offense"], context["defense"], context) *
+            apply_weather(context.get("weather"), context) *
+            apply_home_field_advantage(context.get("home_team"), context.get("away_team"), context)
+        )
+        self.current_date = context.get("current_date") or context.get("game_date")
+        self._speeds: Dict[int, float] = {}
+
+    @classmethod
+    def for_context(cls, context: Dict[str, Any]) -> "PlayContext":
+        """
+        Returns the PlayContext cached on context, rebuilding it when the offense or defense changes.
+        """
+        cached = context.get("play_context")
+        if (
+            isinstance(cached, cls)
+            and cached.offense is context.get("offense")
+            and cached.defense is context.get("defense")
+        ):
+            return cached
+        cached = cls(context)
+        context["play_context"] = cached
+        return cached
+
+    def speed(self, player: Any) -> float:
+        key = id(player)
+        speed = self._speeds.get(key)
+        if speed is None:
+            speed = resolve_player_speed(player)
+            self._speeds[key] = speed
+        return speed
+
+def simulate_pass_play(
+    qb: Any,
+    wr_list: List[Any],
+    depth: str,
+    context: Dict[str, Any],
+    play_context: Optional[PlayContext] = None,
+) -> Dict[str, Any]:
     """
     Simulates a pass play with realistic NFL yardage and big-play chance.
+    Pass a PlayContext shared across the drive to skip per-snap modifier and speed lookups.
     """
+    if play_context is None:
+        play_context = PlayContext(context)
     # NFL average pass: 6.5 yards/attempt, but allow for big plays and incompletions
-    completion_chance = {"short": 0.78, "medium": 0.62, "deep": 0.38}[depth]
-    base_range = {"short": (3, 8), "medium": (8, 18), "deep": (18, 40)}[depth]
-    big_play_chance = 0.08 if depth == "deep" else 0.03
-
-    modifier = (
-        apply_roster_skill(context["offense"], context["defense"], context) *
-        apply_coaching(context["offense"], context["defense"], context) *
-        apply_player_matchups(context["offense"], context["defense"], context) *
-        apply_schemes(context["offense"], context["defense"], context) *
-        apply_weather(context.get("weather"), context) *
-        apply_home_field_advantage(context.get("home_team"), context.get("away_team"), context)
-    )
-    completion_chance *= modifier
+    completion_chance = PlayContext.COMPLETION_CHANCE[depth] * play_context.modifier
+    base_range = PlayContext.BASE_RANGE[depth]
+    big_play_chance = PlayContext.BIG_PLAY_CHANCE[depth]
+    log_play = resolve_detail_level(context=context) == DETAIL_FULL_PBP
 
     receiver = select_fresh_player(wr_list)
     wr_name = getattr(receiver, "name", "Unknown")
     qb_name = getattr(qb, "name", "Unknown")
 
     apply_fatigue(qb, 2)
-    apply_fatigue(receiver, 4 + {"short": 0, "medium": 1, "deep": 2}[depth] * 1.5)
+    apply_fatigue(receiver, PlayContext.RECEIVER_FATIGUE[depth])
     qb_perf = get_performance_modifier(qb)
     wr_perf = get_performance_modifier(receiver)
     completion_chance *= (qb_perf + wr_perf) / 2
 
     is_complete = random.random() < completion_chance
     sub_log = getattr(receiver, "subbed_in", "")
+    avg_speed = (play_context.speed(qb) + play_context.speed(receiver)) / 2
 
     if is_complete:
         if random.random() < big_play_chance:
@@ -146,38 +230,20 @@ def simulate_pass_play(qb: Any, wr_list: List[Any], depth: str, context: Dict[st
         else:
             yards = random.randint(base_range[0], base_range[1])
         yards = int(yards * wr_perf)
-        log = f"{sub_log + ' ' if sub_log else ''}{qb_name} completed a {depth} pass to {wr_name} for {yards} yards"
+        log = f"{sub_log + ' ' if sub_log else ''}{qb_name} completed a {depth} pass to {wr_name} for {yards} yards" if log_play else ""
         stats = {
             qb_name: {"pass_attempts": 1, "completions": 1, "pass_yards": yards, "player_obj": qb},
             wr_name: {"receptions": 1, "rec_yards": yards, "player_obj": receiver}
         }
-        from .play_time_model import estimate_play_seconds
-        qb_speed = getattr(qb, "get_effective_attribute", None)
-        qb_speed = qb_speed("speed") if qb_speed else getattr(qb, "speed", None)
-        qb_speed = qb_speed or getattr(qb, "overall", 85)
-        rec_speed = getattr(receiver, "get_effective_attribute", None)
-        rec_speed = rec_speed("speed") if rec_speed else getattr(receiver, "speed", None)
-        rec_speed = rec_speed or getattr(receiver, "overall", 85)
-        avg_speed = (qb_speed + rec_speed) / 2
         time = estimate_play_seconds("pass", yards, completed=True, player_speed=avg_speed)
     else:
         yards = 0
-        log = f"{sub_log + ' ' if sub_log else ''}{qb_name} attempted a {depth} pass to {wr_name} — incomplete"
+        log = f"{sub_log + ' ' if sub_log else ''}{qb_name} attempted a {depth} pass to {wr_name} — incomplete" if log_play else ""
         stats = {qb_name: {"pass_attempts": 1, "completions": 0, "player_obj": qb}}
-        from .play_time_model import estimate_play_seconds
-        qb_speed = getattr(qb, "get_effective_attribute", None)
-        qb_speed = qb_speed("speed") if qb_speed else getattr(qb, "speed", None)
-        qb_speed = qb_speed or getattr(qb, "overall", 85)
-        rec_speed = getattr(receiver, "get_effective_attribute", None)
-        rec_speed = rec_speed("speed") if rec_speed else getattr(receiver, "speed", None)
-        rec_speed = rec_speed or getattr(receiver, "overall", 85)
-        avg_speed = (qb_speed + rec_speed) / 2
         time = estimate_play_seconds("pass", 0, completed=False, player_speed=avg_speed)
 
-    from gridiron_gm_pkg.simulation.systems.player.injury_status import assign_catalog_injury
-
     # --- Injury logic for QB and WR ---
-    for player in [qb, receiver]:
+    for player in (qb, receiver):
         fatigue = getattr(player, "fatigue", 0.0)
         risk_mod = get_injury_risk_modifier(player)
         # Lower base injury chance, scale up for severe fatigue
@@ -189,10 +255,7 @@ def simulate_pass_play(qb: Any, wr_list: List[Any], depth: str, context: Dict[st
         injury_chance = base_injury_chance * (1 + fatigue) * risk_mod
 
         if random.random() < injury_chance:
-            current_date = None
-            if isinstance(context, dict):
-                current_date = context.get("current_date") or context.get("game_date")
-            injury_payload = assign_catalog_injury(player, current_date, context="game", rng=random)
+            injury_payload = assign_catalog_injury(player, play_context.current_date, context="game", rng=random)
             if injury_payload and "game_injuries" in context:
                 context["game_injuries"].append({
                     "player": getattr(player, "name", "Unknown"),
@@ -238,13 +301,9 @@ def simulate_run_play(runner: Any, gap: str, context: Dict[str, Any]) -> Dict[st
 
     name = getattr(runner, "name", "Unknown")
     sub_note = getattr(runner, "subbed_in", "")
-    log = f"{sub_note} {name} ran {gap} for {yards} yards".strip()
+    log = f"{sub_note} {name} ran {gap} for {yards} yards".strip() if resolve_detail_level(context=context) == DETAIL_FULL_PBP else ""
     stats = {name: {"carries": 1, "rush_yards": yards, "player_obj": runner}}
-    from .play_time_model import estimate_play_seconds
-    speed_method = getattr(runner, "get_effective_attribute", None)
-    speed = speed_method("speed") if speed_method else getattr(runner, "speed", None)
-    speed = speed or getattr(runner, "overall", 85)
-    time = estimate_play_seconds("run", yards, player_speed=speed)
+    time = estimate_play_seconds("run", yards, player_speed=resolve_player_speed(runner))
     return {"yards": yards, "log": log, "player_stats": stats, "seconds_burned": time}
 
 # Rename run_play to sim_play
@@ -264,8 +323,9 @@ def sim_play(offense, defense, down, to_go, yardline, sub_manager, fatigue_log,
         for player in players:
             apply_fatigue(player, 1.0)
 
-    for log in sub_log:
-        fatigue_log.append(f"[SUB] {log}")
+    if resolve_detail_level(context=context) == DETAIL_FULL_PBP:
+        for log in sub_log:
+            fatigue_log.append(f"[SUB] {log}")
 
     # --- Intelligent play selection ---
     play_type = choose_play_type_intelligent(
@@ -299,7 +359,9 @@ def sim_play(offense, defense, down, to_go, yardline, sub_manager, fatigue_log,
         if isinstance(wr, list):
             wr = wr[0] if wr else None
         if qb and wr:
-            play_result = simulate_pass_play(qb, [wr], depth="short", context=context)
+            play_result = simulate_pass_play(
+                qb, [wr], depth="short", context=context, play_context=PlayContext.for_context(context)
+            )
             # Apply weather modifier to pass completion/yards
             if "yards" in play_result:
                 play_result["yards"] = int(play_result["yards"] * weather_mod)
@@ -309,7 +371,8 @@ def sim_play(offense, defense, down, to_go, yardline, sub_manager, fatigue_log,
                 # Chance to turn a completion into an incompletion
                 if random.random() > weather_mod:
                     play_result["yards"] = 0
-                    play_result["log"] = f"{getattr(qb, 'name', 'QB')} pass to {getattr(wr, 'name', 'WR')} fell incomplete due to weather"
+                    if play_result.get("log"):
+                        play_result["log"] = f"{getattr(qb, 'name', 'QB')} pass to {getattr(wr, 'name', 'WR')} fell incomplete due to weather"
         else:
             play_result = {"desc": "Missing QB or WR", "yards": 0}
 
@@ -374,22 +437,33 @@ def apply_weather_enhanced(weather, play_type):
     return max(mod, 0.7)  # Don't reduce below 70% effectiveness
 
 # Rename run_drive to sim_drive
-def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=25):
+def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=25, detail_level=None, play_record=None):
     """
     Simulates a drive with NFL-like play-by-play logic and realistic drive-ending conditions.
     Drives end only on: touchdown, field goal (made/missed), punt, turnover (INT/fumble), turnover on downs, safety, or time expiration.
     There is no arbitrary play cap; drives can be as long or short as real NFL drives.
+    detail_level controls the drive log only (see DETAIL_LEVELS); stats and RNG draws are identical at every level.
+    When a PlayRecord is passed, every snap is appended to it as a columnar row instead: at full_pbp the
+    drive log is then left empty, since PlayRecord.render_drive rebuilds it on demand.
     """
     from gridiron_gm_pkg.simulation.engine.penalty_engine import simulate_play as simulate_penalty_play
 
-    def to_penalty_player(player):
-        # Map your player object to the penalty engine's expected Player dataclass
-        return type("PenaltyPlayer", (), {
-            "name": getattr(player, "name", "Unknown"),
-            "position": getattr(player, "position", "UNK"),
-            "discipline_rating": getattr(player, "discipline_rating", 75),
-            "traits": sum([v for v in getattr(player, "traits", {}).values() if isinstance(v, list)], [])
-        })()
+    # simulate_game shares one cache across drives; a bare sim_drive call gets its own
+    penalty_profiles = context.get("penalty_profiles")
+    if penalty_profiles is None:
+        penalty_profiles = PenaltyProfileCache()
+    penalty_profiles.begin_drive()
+
+    # Speeds for the play clock are resolved once per player for the whole drive
+    context["offense"] = offense
+    context["defense"] = defense
+    play_context = PlayContext.for_context(context)
+
+    detail_level = resolve_detail_level(detail_level, context)
+    if play_record is not None and detail_level == DETAIL_FULL_PBP:
+        detail_level = context["detail_level"] = DETAIL_STATS_ONLY
+    log_plays = detail_level == DETAIL_FULL_PBP
+    log_summary = detail_level != DETAIL_STATS_ONLY
 
     drive_log = []
     player_stats = {}
@@ -434,19 +508,29 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
     drive_seconds = 0
     max_drive_seconds = context.get("max_drive_seconds", 600)  # e.g., 10 minutes max for a drive (rarely reached)
 
+    drive_end = pr.END_NONE
+    drive_end_value = 0
+    snap = -1
+    if play_record is not None:
+        play_record.begin_drive(getattr(offense, "abbreviation", ""), start_field_pos)
+
     # Main drive loop: ends only on NFL drive-ending conditions
     while True:
         # --- Build 11-man lineups for both sides using depth chart and SubstitutionManagerV2 ---
         package = getattr(offense, "package", "standard")
         scheme = {"QB": 1, "RB": 1, "WR": 2, "TE": 1, "LT": 1, "LG": 1, "C": 1, "RG": 1, "RT": 1}
         formation = scheme.get("formation", {})
-        lineup, sub_log = sub_mgr.get_active_lineup_with_bench_log(formation, offense, fatigue_log, scheme)
+        lineup, sub_log = sub_mgr.get_active_lineup_with_bench_log(
+            formation, offense, fatigue_log, scheme, record_log=log_plays
+        )
         offense_lineup = lineup.get("offense")
         defense_lineup = lineup.get("defense")
 
         # Defensive: Ensure lineups are valid lists of player objects
         if offense_lineup is None or defense_lineup is None:
-            drive_log.append("[ERROR] sim_drive: offense_lineup or defense_lineup is None! Aborting drive.")
+            drive_end = pr.END_ERROR_MISSING
+            if log_summary:
+                drive_log.append("[ERROR] sim_drive: offense_lineup or defense_lineup is None! Aborting drive.")
             break
         if not isinstance(offense_lineup, list):
             offense_lineup = list(offense_lineup.values()) if hasattr(offense_lineup, "values") else [offense_lineup]
@@ -454,11 +538,16 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
             defense_lineup = list(defense_lineup.values()) if hasattr(defense_lineup, "values") else [defense_lineup]
 
         if not offense_lineup or not defense_lineup:
-            drive_log.append("[ERROR] sim_drive: offense_lineup or defense_lineup is empty! Aborting drive.")
+            drive_end = pr.END_ERROR_EMPTY
+            if log_summary:
+                drive_log.append("[ERROR] sim_drive: offense_lineup or defense_lineup is empty! Aborting drive.")
             break
 
+        if play_record is not None:
+            snap = play_record.add_snap(down, to_go, field_pos)
+
         # --- Penalty simulation for all on-field players ---
-        on_field_players = offense_lineup + defense_lineup
+        on_field_players = penalty_profiles.profiles(offense_lineup + defense_lineup)
         penalty_events = simulate_penalty_play(
             on_field_players,
             offense=offense,
@@ -473,17 +562,21 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
             for pen in penalty_events:
                 pen_team = pen.get("team", "offense")
                 pen_player = pen.get("player")
+                pen_player = getattr(pen_player, "player", pen_player)  # unwrap the PenaltyProfile
                 pen_type = pen.get("penalty_type", pen.get("type", "?"))
                 pen_yards = pen.get("yards", 0)
                 auto_first_down = pen.get("auto_first", False)
                 replay_down = pen.get("replay_down", False)
                 injury = pen.get("injury", None)
-                drive_log.append(
-                    f"PENALTY: {pen_type} on {getattr(pen_player, 'position', '?')} ({getattr(pen_player, 'name', '?')}), {pen_yards:+} yards"
-                    + (" [Auto 1st down]" if auto_first_down else "")
-                    + (" [Replay down]" if replay_down else "")
-                    + (f" [INJURY: {injury}]" if injury else "")
-                )
+                if play_record is not None:
+                    play_record.add_penalty(snap, pen_type, pen_player, pen_yards, auto_first_down, replay_down, injury)
+                if log_plays:
+                    drive_log.append(
+                        f"PENALTY: {pen_type} on {getattr(pen_player, 'position', '?')} ({getattr(pen_player, 'name', '?')}), {pen_yards:+} yards"
+                        + (" [Auto 1st down]" if auto_first_down else "")
+                        + (" [Replay down]" if replay_down else "")
+                        + (f" [INJURY: {injury}]" if injury else "")
+                    )
                 penalties += 1
                 penalty_yards += abs(pen_yards)
                 drive_team_stats['penalties'] += 1
@@ -499,7 +592,7 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                     penalty_applied = True
             if penalty_applied:
                 continue  # Redo play after replay-down penalty
-        else:
+        elif log_plays:
             drive_log.append("No penalties this play.")
 
         # --- Play selection: weighted, but can be replaced with attribute logic ---
@@ -508,6 +601,17 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
         red_zone = field_pos >= 60
         goal_to_go = field_pos >= 70
         play_type = "pass" if (down in [2, 3] and to_go > 7) or (random.random() < 0.56) else "run"
+        if play_record is not None:
+            play_record.set_spot(snap, down, to_go, field_pos)
+            if play_type == "run":
+                play_record.set_play(snap, play_type, next((p for p in offense_lineup if getattr(p, "position", "") == "RB"), None))
+            else:
+                play_record.set_play(
+                    snap,
+                    play_type,
+                    next((p for p in offense_lineup if getattr(p, "position", "") == "QB"), None),
+                    next((p for p in offense_lineup if getattr(p, "position", "") == "WR"), None),
+                )
 
         yards_gained = 0
         play_desc = ""
@@ -520,19 +624,26 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
             # Explosive run: ~4% of all runs
             if random.random() < 0.04:
                 yards_gained = random.randint(10, 45)
-                play_desc = f"Explosive run for {yards_gained} yards"
+                play_desc = f"Explosive run for {yards_gained} yards" if log_plays else ""
                 explosive_plays += 1
+                if play_record is not None:
+                    play_record.flag(snap, pr.EXPLOSIVE)
             else:
                 # Normal run: mean 5.2, stddev 2.5, clamp -2 to 13 (NFL avg ~4.7 ypc, +10% boost)  # [BOOSTED]
                 yards_gained = int(random.gauss(5.2, 2.5))  # was 4.7
                 yards_gained = max(-2, min(yards_gained, 13))  # was -3,12
-                play_desc = f"Run for {yards_gained} yards"
+                play_desc = f"Run for {yards_gained} yards" if log_plays else ""
             drive_team_stats["rush_yards"] += yards_gained
+            if play_record is not None:
+                play_record.set_yards(snap, yards_gained)
             # Fumble lost: ~1.2% of runs (+20% from 0.01)  # [BOOSTED]
             if random.random() < 0.012:
                 fumbles += 1
                 drive_team_stats["fumbles_lost"] += 1
-                drive_log.append(f"Fumble lost on run! Turnover.")
+                if play_record is not None:
+                    play_record.flag(snap, pr.FUMBLE)
+                if log_plays:
+                    drive_log.append(f"Fumble lost on run! Turnover.")
                 turnover = True
                 stalled = True
             # Rushing TD: heavily weighted to inside 10, rare outside
@@ -540,9 +651,12 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                 td_chance = 0.40 if field_pos >= 70 else 0.045  # was 0.35/0.04, +~15% [BOOSTED]
                 if random.random() < td_chance:
                     drive_team_stats["rush_td"] += 1
-                    play_desc += " (Rushing touchdown!)"
+                    if log_plays:
+                        play_desc += " (Rushing touchdown!)"
                     td_type = "rush"
                     score = 7
+                    if play_record is not None:
+                        play_record.flag(snap, pr.RUSH_TD)
                     break
         else:  # pass
             drive_team_stats["pass_attempts"] += 1
@@ -552,7 +666,10 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                 sack_yards = max(1, min(sack_yards, 15))
                 yards_gained = -sack_yards
                 sacks += 1
-                play_desc = f"QB sacked for -{sack_yards} yards"
+                if play_record is not None:
+                    play_record.set_yards(snap, yards_gained)
+                    play_record.flag(snap, pr.SACK)
+                play_desc = f"QB sacked for -{sack_yards} yards" if log_plays else ""
             else:
                 # Completion: ~66% NFL average (unchanged)
                 if random.random() < 0.66:
@@ -560,28 +677,39 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                     # Explosive pass: ~5% of passes
                     if random.random() < 0.05:
                         yards_gained = random.randint(20, 60)
-                        play_desc = f"Explosive pass complete for {yards_gained} yards"
+                        play_desc = f"Explosive pass complete for {yards_gained} yards" if log_plays else ""
                         explosive_plays += 1
+                        if play_record is not None:
+                            play_record.flag(snap, pr.EXPLOSIVE)
                     else:
                         # Normal pass: mean 10, stddev 7, clamp 0 to 30 (NFL avg ~10 ypc)
                         yards_gained = int(random.gauss(10, 7))
                         yards_gained = max(0, min(yards_gained, 30))
-                        play_desc = f"Pass complete for {yards_gained} yards"
+                        play_desc = f"Pass complete for {yards_gained} yards" if log_plays else ""
                     drive_team_stats["pass_yards"] += yards_gained
+                    if play_record is not None:
+                        play_record.set_yards(snap, yards_gained)
+                        play_record.flag(snap, pr.COMPLETE)
                     # Interception: ~2.7% of passes (+~23% from 0.022)  # [BOOSTED]
                     if random.random() < 0.027:
                         ints += 1
                         drive_team_stats["interceptions"] += 1
+                        if play_record is not None:
+                            play_record.flag(snap, pr.INTERCEPTION)
                         # Rare pick-six: ~10% of INTs
                         if random.random() < 0.10:
-                            drive_log.append(f"Intercepted! Pick-six! Defensive touchdown.")
+                            if log_plays:
+                                drive_log.append(f"Intercepted! Pick-six! Defensive touchdown.")
                             defensive_tds += 1
                             drive_team_stats["def_td"] += 1
                             score = 0
                             td_type = "def"
+                            if play_record is not None:
+                                play_record.flag(snap, pr.PICK_SIX)
                             break
                         else:
-                            drive_log.append(f"Intercepted! Turnover.")
+                            if log_plays:
+                                drive_log.append(f"Intercepted! Turnover.")
                             turnover = True
                             stalled = True
                     # Passing TD: ~60% of all TDs, weighted to inside 20 (unchanged)
@@ -589,24 +717,33 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                         td_chance = 0.60 if field_pos >= 60 else 0.03
                         if random.random() < td_chance:
                             drive_team_stats["pass_td"] += 1
-                            play_desc += " (Passing touchdown!)"
+                            if log_plays:
+                                play_desc += " (Passing touchdown!)"
                             td_type = "pass"
                             score = 7
+                            if play_record is not None:
+                                play_record.flag(snap, pr.PASS_TD)
                             break
                 else:
-                    play_desc = "Incomplete pass"
+                    play_desc = "Incomplete pass" if log_plays else ""
                     yards_gained = 0
 
         # Rare defensive/special teams TDs (1–2% of drives)
         if not td_type and not turnover and random.random() < 0.012:
             if random.random() < 0.7:
-                drive_log.append("Fumble return for touchdown! Defensive TD.")
+                if log_plays:
+                    drive_log.append("Fumble return for touchdown! Defensive TD.")
                 defensive_tds += 1
                 drive_team_stats["def_td"] += 1
+                if play_record is not None:
+                    play_record.flag(snap, pr.DEF_RETURN_TD)
             else:
-                drive_log.append("Kick/punt return for touchdown! Special teams TD.")
+                if log_plays:
+                    drive_log.append("Kick/punt return for touchdown! Special teams TD.")
                 special_tds += 1
                 drive_team_stats["ret_td"] += 1
+                if play_record is not None:
+                    play_record.flag(snap, pr.SPECIAL_RETURN_TD)
             score = 7
             td_type = "def"
             break
@@ -615,13 +752,17 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
         prev_field_pos = field_pos
         field_pos += yards_gained
         field_pos = max(1, min(field_pos, 99))
-        drive_log.append(f"Play {plays+1}: {play_type.upper()} - {play_desc} | Ball at {field_pos}")
+        if log_plays:
+            drive_log.append(f"Play {plays+1}: {play_type.upper()} - {play_desc} | Ball at {field_pos}")
 
         # 3rd/4th down conversion logic
         if yards_gained >= to_go:
             down = 1
             to_go = 10
-            drive_log.append(f"First down!")
+            if play_record is not None:
+                play_record.flag(snap, pr.FIRST_DOWN)
+            if log_plays:
+                drive_log.append(f"First down!")
         elif yards_gained > 0:
             to_go -= yards_gained
             down += 1
@@ -640,16 +781,21 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
             if random.random() < 0.18:
                 if random.random() < 0.6:
                     drive_team_stats["pass_td"] += 1
-                    drive_log.append("Passing touchdown!")
+                    drive_end = pr.END_TD_PASS
+                    if log_plays:
+                        drive_log.append("Passing touchdown!")
                     td_type = "pass"
                 else:
                     drive_team_stats["rush_td"] += 1
-                    drive_log.append("Rushing touchdown!")
+                    drive_end = pr.END_TD_RUSH
+                    if log_plays:
+                        drive_log.append("Rushing touchdown!")
                     td_type = "rush"
                 score = 7
             else:
                 fg_attempted = True
                 fg_distance = 100 - field_pos
+                drive_end_value = fg_distance
                 # Reduce long FG attempts and lower make chance from 40+ yards
                 if fg_distance < 40:
                     fg_chance = 0.93
@@ -661,16 +807,21 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                     fg_chance = 0.20  # Very low chance for 55+ yards
                 # Only attempt FG if distance < 55
                 if fg_distance < 55 and random.random() < fg_chance:
-                    drive_log.append(f"Field Goal is good! ({fg_distance} yards)")
+                    if log_plays:
+                        drive_log.append(f"Field Goal is good! ({fg_distance} yards)")
                     fg_made = True
                     score = 3
+                    drive_end = pr.END_FG_GOOD
                 else:
-                    drive_log.append(f"Field Goal missed from {fg_distance} yards.")
+                    drive_end = pr.END_FG_MISSED
+                    if log_plays:
+                        drive_log.append(f"Field Goal missed from {fg_distance} yards.")
             break
 
         # Fourth down logic (outside red zone)
         if down > 4:
             fg_distance = 100 - field_pos
+            drive_end_value = fg_distance
             # Go for it logic: trailing late, short distance, or aggressive team (stub: random for now)
             go_for_it = False
             if field_pos >= 65 and to_go <= 2 and random.random() < 0.25:
@@ -681,10 +832,15 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                 if random.random() < conversion_chance:
                     down = 1
                     to_go = 10
-                    drive_log.append("4th down conversion successful!")
+                    if play_record is not None:
+                        play_record.flag(snap, pr.FOURTH_DOWN_CONVERSION)
+                    if log_plays:
+                        drive_log.append("4th down conversion successful!")
                     continue
                 else:
-                    drive_log.append("Turnover on downs.")
+                    drive_end = pr.END_DOWNS
+                    if log_plays:
+                        drive_log.append("Turnover on downs.")
                     break
             elif field_pos >= 45:
                 # Reduce long FG attempts and lower make chance from 40+ yards
@@ -699,36 +855,42 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
                 fg_attempted = True
                 # Only attempt FG if distance < 55
                 if fg_distance < 55 and random.random() < fg_chance:
-                    drive_log.append(f"Field Goal is good! ({fg_distance} yards)")
+                    if log_plays:
+                        drive_log.append(f"Field Goal is good! ({fg_distance} yards)")
                     fg_made = True
                     score = 3
+                    drive_end = pr.END_FG_GOOD
                 else:
-                    drive_log.append(f"Field Goal missed from {fg_distance} yards.")
+                    drive_end = pr.END_FG_MISSED
+                    if log_plays:
+                        drive_log.append(f"Field Goal missed from {fg_distance} yards.")
                 break
             else:
                 net_punt = int(random.gauss(41, 5))
                 net_punt = max(20, min(net_punt, 60))
                 inside_20 = random.random() < 0.35
                 punts += 1
-                drive_log.append(f"Punt: {net_punt} yards{' (inside 20)' if inside_20 else ''}.")
+                drive_end = pr.END_PUNT_INSIDE_20 if inside_20 else pr.END_PUNT
+                drive_end_value = net_punt
+                if log_plays:
+                    drive_log.append(f"Punt: {net_punt} yards{' (inside 20)' if inside_20 else ''}.")
                 field_pos = 100 - (field_pos + net_punt)
                 break
 
         # Safety (ball behind own goal line)
         if field_pos <= 0:
-            drive_log.append("Safety! Defense scores 2 points.")
+            drive_end = pr.END_SAFETY
+            if log_plays:
+                drive_log.append("Safety! Defense scores 2 points.")
             score = -2
             safety = 1
             break
 
         # End of half/game (optional: use drive_seconds if simulating clock)
-        from .play_time_model import estimate_play_seconds
         if play_type == "run":
             runner = next((p for p in offense_lineup if getattr(p, "position", "") == "RB"), None)
             if runner:
-                speed_method = getattr(runner, "get_effective_attribute", None)
-                speed = speed_method("speed") if speed_method else getattr(runner, "speed", None)
-                speed = speed or getattr(runner, "overall", 85)
+                speed = play_context.speed(runner)
             else:
                 speed = 85
             play_seconds = estimate_play_seconds("run", yards_gained, player_speed=speed)
@@ -737,31 +899,36 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
             wr = next((p for p in offense_lineup if getattr(p, "position", "") == "WR"), None)
             if qb or wr:
                 if qb:
-                    q_m = getattr(qb, "get_effective_attribute", None)
-                    qb_speed = q_m("speed") if q_m else getattr(qb, "speed", None)
-                    qb_speed = qb_speed or getattr(qb, "overall", 85)
+                    qb_speed = play_context.speed(qb)
                 else:
                     qb_speed = 85
                 if wr:
-                    w_m = getattr(wr, "get_effective_attribute", None)
-                    wr_speed = w_m("speed") if w_m else getattr(wr, "speed", None)
-                    wr_speed = wr_speed or getattr(wr, "overall", 85)
+                    wr_speed = play_context.speed(wr)
                 else:
                     wr_speed = 85
                 avg_speed = (qb_speed + wr_speed) / 2
             else:
                 avg_speed = 85
-            completed = yards_gained > 0 and "Incomplete" not in play_desc
+            # Incomplete passes always gain 0 yards, so this no longer needs the play text.
+            completed = yards_gained > 0
             play_seconds = estimate_play_seconds("pass", yards_gained, completed=completed, player_speed=avg_speed)
         drive_seconds += play_seconds
+        if play_record is not None:
+            play_record.set_seconds(snap, play_seconds)
         if drive_seconds >= max_drive_seconds:
-            drive_log.append("End of half/game: drive stopped by clock.")
+            drive_end = pr.END_CLOCK
+            if log_plays:
+                drive_log.append("End of half/game: drive stopped by clock.")
             break
 
+    if play_record is not None:
+        play_record.end_drive(drive_end, field_pos, score, drive_seconds, drive_end_value)
+
     # Track drive summary
-    drive_log.append(f"Drive summary: {plays} plays, {field_pos - start_field_pos} yards, "
-                     f"{'TD' if score == 7 else 'FG' if score == 3 else 'No score'}, "
-                     f"{ints} INT, {fumbles} FUM, {sacks} SACK, {punts} PUNT, {penalties} PEN, {explosive_plays} EXP")
+    if log_summary:
+        drive_log.append(f"Drive summary: {plays} plays, {field_pos - start_field_pos} yards, "
+                         f"{'TD' if score == 7 else 'FG' if score == 3 else 'No score'}, "
+                         f"{ints} INT, {fumbles} FUM, {sacks} SACK, {punts} PUNT, {penalties} PEN, {explosive_plays} EXP")
 
     # Attach drive_team_stats to player_stats for aggregation in simulate_game
     player_stats["_drive_team_stats"] = drive_team_stats
@@ -786,13 +953,17 @@ def sim_drive(offense, defense, sub_mgr, fatigue_log, context, start_field_pos=2
         "drive_seconds": drive_seconds
     }
 
-def simulate_game(home_team, away_team, week=1, context=None):
+def simulate_game(home_team, away_team, week=1, context=None, detail_level=None, play_record=None):
     """
     Simulates a full NFL game between home_team and away_team.
     Alternates possessions, tracks score and stats, and returns (home_stats, away_stats).
+    With detail_level="stats_only" the returned "log" lists stay empty.
+    Pass a PlayRecord to collect every drive as columnar play-by-play. At full_pbp the
+    "log" lists then stay empty too; play_record.render(team) gives the same lines.
     """
     if context is None:
         context = {}
+    detail_level = resolve_detail_level(detail_level, context)
     from gridiron_gm_pkg.simulation.systems.roster.substitution_manager import SubstitutionManagerV2
 
     # Game parameters
@@ -818,6 +989,9 @@ def simulate_game(home_team, away_team, week=1, context=None):
     home_fatigue_log = []
     away_fatigue_log = []
 
+    # Penalty profiles are built once per player per game
+    penalty_profiles = PenaltyProfileCache()
+
     # Stats
     home_stats = defaultdict(int)
     away_stats = defaultdict(int)
@@ -852,13 +1026,17 @@ def simulate_game(home_team, away_team, week=1, context=None):
         # Simulate drive
         drive_context = dict(context)
         drive_context["clock"] = clock
+        drive_context["detail_level"] = detail_level
+        drive_context["penalty_profiles"] = penalty_profiles
         drive_result = sim_drive(
             offense=current_pos_team,
             defense=other_team,
             sub_mgr=current_sub_mgr,
             fatigue_log=current_fatigue_log,
             context=drive_context,
-            start_field_pos=field_pos
+            start_field_pos=field_pos,
+            detail_level=detail_level,
+            play_record=play_record,
         )
 
         # Update stats
@@ -876,7 +1054,8 @@ def simulate_game(home_team, away_team, week=1, context=None):
         current_stats["rush_yards"] += drive_result.get("player_stats", {}).get("_drive_team_stats", {}).get("rush_yards", 0)
         current_stats["pass_yards"] += drive_result.get("player_stats", {}).get("_drive_team_stats", {}).get("pass_yards", 0)
         current_stats["safety"] += drive_result.get("safety", 0)
-        current_stats["log"].extend(drive_result.get("log", []))
+        if detail_level != DETAIL_STATS_ONLY:
+            current_stats["log"].extend(drive_result.get("log", []))
 
         # Advance clock by the seconds actually burned during the drive
         drive_seconds = drive_result.get("drive_seconds", drive_result.get("plays", 0) * 40)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from collections.abc import Mapping
 import random
-from typing import List
+from typing import Any, Dict, FrozenSet, List, Tuple
 from gridiron_gm import VERBOSE_SIM_OUTPUT
 
 @dataclass
@@ -54,7 +55,7 @@ def resolve_player_discipline_rating(player: Player, default: int = 50) -> int:
     attributes = getattr(player, "attributes", None)
     if hasattr(attributes, "core"):
         core = getattr(attributes, "core", None)
-        if isinstance(core, dict):
+        if isinstance(core, Mapping):
             candidates.append(core.get("discipline"))
     if isinstance(attributes, dict):
         core = attributes.get("core")
@@ -73,6 +74,76 @@ def resolve_player_discipline_rating(player: Player, default: int = 50) -> int:
             continue
     return max(0, min(99, int(default)))
 
+def _trait_keys(player: Any) -> FrozenSet[Any]:
+    """What ``trait in player.traits`` tests: dict keys or list items, as a set."""
+    traits = getattr(player, "traits", None)
+    if isinstance(traits, (dict, list, tuple, set, frozenset)):
+        return frozenset(traits)
+    return frozenset()
+
+
+class PenaltyProfile:
+    """Immutable view of the fields the penalty engine reads from a player."""
+
+    __slots__ = ("player", "name", "position", "discipline_rating", "traits")
+
+    def __init__(self, player: Any, discipline_rating: int, traits: FrozenSet[Any]):
+        object.__setattr__(self, "player", player)
+        object.__setattr__(self, "name", getattr(player, "name", "Unknown"))
+        object.__setattr__(self, "position", getattr(player, "position", "UNK"))
+        object.__setattr__(self, "discipline_rating", discipline_rating)
+        object.__setattr__(self, "traits", traits)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PenaltyProfile is immutable")
+
+    def resolve_discipline_rating(self, default: int = 50) -> int:
+        return self.discipline_rating
+
+
+class PenaltyProfileCache:
+    """Per-game PenaltyProfiles keyed by player id.
+
+    Nothing changes a player's discipline or traits mid-drive, so each cached
+    profile is checked at most once per drive (see begin_drive) and rebuilt
+    only when the discipline rating or trait keys have changed.
+    """
+
+    __slots__ = ("_profiles", "_generation")
+
+    def __init__(self):
+        self._profiles: Dict[int, Tuple[int, int, PenaltyProfile]] = {}
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def begin_drive(self) -> None:
+        self._generation += 1
+
+    def profile(self, player: Any) -> PenaltyProfile:
+        key = id(player)
+        cached = self._profiles.get(key)
+        if cached is not None and cached[0] == self._generation and cached[2].player is player:
+            return cached[2]
+        discipline = resolve_player_discipline_rating(player)
+        traits = _trait_keys(player)
+        if (
+            cached is not None
+            and cached[1] == discipline
+            and cached[2].traits == traits
+            and cached[2].player is player
+        ):
+            profile = cached[2]
+        else:
+            profile = PenaltyProfile(player, discipline, traits)
+        self._profiles[key] = (self._generation, discipline, profile)
+        return profile
+
+    def profiles(self, players: List[Any]) -> List[PenaltyProfile]:
+        return [self.profile(player) for player in players]
+
+
 def simulate_penalty(player: Player, discipline_modifier: float = 0.0) -> str | None:
     for penalty, data in PENALTIES.items():
         if player.position not in data["positions"]:
@@ -0,0 +1,411 @@
+"""Columnar play-by-play record for ``sim_drive``.
+
+Each snap is one row spread across parallel ``array`` columns instead of a
+formatted string. ``render_drive`` rebuilds the exact ``full_pbp`` drive log
+on demand, ``drive_chart`` summarises drives without any text, and
+``to_dict``/``from_dict`` give a compact JSON-safe encoding for saves.
+"""
+from array import array
+import base64
+import sys
+from typing import Any, Dict, List, Optional
+
+PLAY_NONE = 0  # snap replayed after a penalty
+PLAY_RUN = 1
+PLAY_PASS = 2
+PLAY_TYPE_NAMES = {PLAY_NONE: None, PLAY_RUN: "run", PLAY_PASS: "pass"}
+
+# Snap flags
+EXPLOSIVE = 1 << 0
+SACK = 1 << 1
+COMPLETE = 1 << 2
+FUMBLE = 1 << 3
+INTERCEPTION = 1 << 4
+PICK_SIX = 1 << 5
+RUSH_TD = 1 << 6
+PASS_TD = 1 << 7
+DEF_RETURN_TD = 1 << 8
+SPECIAL_RETURN_TD = 1 << 9
+FIRST_DOWN = 1 << 10
+FOURTH_DOWN_CONVERSION = 1 << 11
+PENALTY = 1 << 12
+# Snaps carrying one of these end the drive before the "Play N" line is logged.
+_DRIVE_ENDING_FLAGS = RUSH_TD | PASS_TD | PICK_SIX | DEF_RETURN_TD | SPECIAL_RETURN_TD
+
+# Penalty flags
+PENALTY_AUTO_FIRST = 1 << 0
+PENALTY_REPLAY_DOWN = 1 << 1
+
+# Drive endings
+END_NONE = 0  # turnover or a touchdown scored during the play
+END_TD_PASS = 1
+END_TD_RUSH = 2
+END_FG_GOOD = 3
+END_FG_MISSED = 4
+END_DOWNS = 5
+END_PUNT = 6
+END_PUNT_INSIDE_20 = 7
+END_SAFETY = 8
+END_CLOCK = 9
+END_ERROR_MISSING = 10
+END_ERROR_EMPTY = 11
+END_NAMES = {
+    END_NONE: "turnover",
+    END_TD_PASS: "touchdown",
+    END_TD_RUSH: "touchdown",
+    END_FG_GOOD: "field_goal",
+    END_FG_MISSED: "missed_field_goal",
+    END_DOWNS: "downs",
+    END_PUNT: "punt",
+    END_PUNT_INSIDE_20: "punt",
+    END_SAFETY: "safety",
+    END_CLOCK: "clock",
+    END_ERROR_MISSING: "error",
+    END_ERROR_EMPTY: "error",
+}
+
+ENCODING_VERSION = 1
+
+# name -> array typecode; every column is a plain array so it encodes with tobytes().
+SNAP_COLUMNS = {
+    "down": "b",
+    "distance": "h",
+    "yardline": "h",
+    "play_type": "B",
+    "yards": "h",
+    "flags": "H",
+    "player": "h",
+    "target": "h",
+    "seconds": "f",
+}
+PENALTY_COLUMNS = {
+    "pen_snap": "I",
+    "pen_name": "H",
+    "pen_player": "h",
+    "pen_position": "H",
+    "pen_yards": "h",
+    "pen_flags": "B",
+    "pen_injury": "h",
+}
+DRIVE_COLUMNS = {
+    "drive_first_snap": "I",
+    "drive_first_penalty": "I",
+    "drive_team": "H",
+    "drive_start": "h",
+    "drive_end_pos": "h",
+    "drive_score": "b",
+    "drive_end": "B",
+    "drive_end_value": "h",
+    "drive_seconds": "f",
+}
+_ALL_COLUMNS = {**SNAP_COLUMNS, **PENALTY_COLUMNS, **DRIVE_COLUMNS}
+
+
+class PlayRecord:
+    """Parallel-array play-by-play for one or more drives."""
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array] = {name: array(code) for name, code in _ALL_COLUMNS.items()}
+        self.players: List[Optional[str]] = []
+        self.strings: List[str] = []
+        self._player_index: Dict[int, int] = {}
+        self._string_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.columns["down"])
+
+    @property
+    def drive_count(self) -> int:
+        return len(self.columns["drive_first_snap"])
+
+    # ---- Recording ----
+
+    def player_ref(self, player: Any) -> int:
+        """Index of ``player`` in the record's player table (-1 for None)."""
+        if player is None:
+            return -1
+        key = id(player)
+        index = self._player_index.get(key)
+        if index is None:
+            index = len(self.players)
+            name = getattr(player, "name", None)
+            self.players.append(None if name is None else str(name))
+            self._player_index[key] = index
+        return index
+
+    def string_ref(self, text: Any) -> int:
+        text = str(text)
+        index = self._string_index.get(text)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(text)
+            self._string_index[text] = index
+        return index
+
+    def begin_drive(self, team: Any, start_field_pos: int) -> None:
+        cols = self.columns
+        cols["drive_first_snap"].append(len(self))
+        cols["drive_first_penalty"].append(len(cols["pen_snap"]))
+        cols["drive_team"].append(self.string_ref(team))
+        cols["drive_start"].append(start_field_pos)
+        for name in ("drive_end_pos", "drive_score", "drive_end", "drive_end_value"):
+            cols[name].append(0)
+        cols["drive_seconds"].append(0.0)
+
+    def add_snap(self, down: int, distance: int, yardline: int) -> int:
+        cols = self.columns
+        cols["down"].append(down)
+        cols["distance"].append(distance)
+        cols["yardline"].append(yardline)
+        cols["play_type"].append(PLAY_NONE)
+        cols["yards"].append(0)
+        cols["flags"].append(0)
+        cols["player"].append(-1)
+        cols["target"].append(-1)
+        cols["seconds"].append(0.0)
+        return len(self) - 1
+
+    def set_spot(self, snap: int, down: int, distance: int, yardline: int) -> None:
+        cols = self.columns
+        cols["down"][snap] = down
+        cols["distance"][snap] = distance
+        cols["yardline"][snap] = yardline
+
+    def set_play(self, snap: int, play_type: str, player: Any = None, target: Any = None) -> None:
+        cols = self.columns
+        cols["play_type"][snap] = PLAY_RUN if play_type == "run" else PLAY_PASS
+        cols["player"][snap] = self.player_ref(player)
+        cols["target"][snap] = self.player_ref(target)
+
+    def set_yards(self, snap: int, yards: int) -> None:
+        self.columns["yards"][snap] = yards
+
+    def flag(self, snap: int, flags: int) -> None:
+        self.columns["flags"][snap] |= flags
+
+    def set_seconds(self, snap: int, seconds: float) -> None:
+        self.columns["seconds"][snap] = seconds
+
+    def add_penalty(
+        self,
+        snap: int,
+        name: Any,
+        player: Any,
+        yards: int,
+        auto_first: bool = False,
+        replay_down: bool = False,
+        injury: Any = None,
+    ) -> None:
+        cols = self.columns
+        cols["pen_snap"].append(snap)
+        cols["pen_name"].append(self.string_ref(name))
+        cols["pen_player"].append(self.player_ref(player))
+        cols["pen_position"].append(self.string_ref(getattr(player, "position", "?")))
+        cols["pen_yards"].append(yards)
+        cols["pen_flags"].append(
+            (PENALTY_AUTO_FIRST if auto_first else 0) | (PENALTY_REPLAY_DOWN if replay_down else 0)
+        )
+        cols["pen_injury"].append(self.string_ref(injury) if injury else -1)
+        self.flag(snap, PENALTY)
+
+    def end_drive(self, end: int, end_field_pos: int, score: int, seconds: float, value: int = 0) -> None:
+        cols = self.columns
+        cols["drive_end"][-1] = end
+        cols["drive_end_pos"][-1] = end_field_pos
+        cols["drive_score"][-1] = score
+        cols["drive_end_value"][-1] = value
+        cols["drive_seconds"][-1] = seconds
+
+    # ---- Reading ----
+
+    def _drive_bounds(self, drive: int) -> tuple:
+        cols = self.columns
+        first_snap = cols["drive_first_snap"][drive]
+        first_pen = cols["drive_first_penalty"][drive]
+        if drive + 1 < self.drive_count:
+            return first_snap, cols["drive_first_snap"][drive + 1], first_pen, cols["drive_first_penalty"][drive + 1]
+        return first_snap, len(self), first_pen, len(cols["pen_snap"])
+
+    def _player_name(self, index: int, default: Optional[str] = None) -> Optional[str]:
+        name = self.players[index] if index >= 0 else None
+        return default if name is None else name
+
+    def snaps(self, drive: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Row dictionaries for one drive (or every drive)."""
+        cols = self.columns
+        start, stop = (0, len(self)) if drive is None else self._drive_bounds(drive)[:2]
+        return [
+            {
+                "down": cols["down"][i],
+                "distance": cols["distance"][i],
+                "yardline": cols["yardline"][i],
+                "play_type": PLAY_TYPE_NAMES[cols["play_type"][i]],
+                "yards": cols["yards"][i],
+                "flags": cols["flags"][i],
+                "player": self._player_name(cols["player"][i]),
+                "target": self._player_name(cols["target"][i]),
+                "seconds": cols["seconds"][i],
+            }
+            for i in range(start, stop)
+        ]
+
+    def drive_chart(self) -> List[Dict[str, Any]]:
+        """One summary dictionary per drive, suitable for a drive chart."""
+        cols = self.columns
+        chart = []
+        for drive in range(self.drive_count):
+            first, stop, _, _ = self._drive_bounds(drive)
+            plays = sum(
+                1
+                for i in range(first, stop)
+                if cols["play_type"][i] != PLAY_NONE and not cols["flags"][i] & _DRIVE_ENDING_FLAGS
+            )
+            start = cols["drive_start"][drive]
+            end_pos = cols["drive_end_pos"][drive]
+            chart.append(
+                {
+                    "team": self.strings[cols["drive_team"][drive]],
+                    "start_yardline": start,
+                    "end_yardline": end_pos,
+                    "plays": plays,
+                    "yards": end_pos - start,
+                    "points": cols["drive_score"][drive],
+                    "result": END_NAMES[cols["drive_end"][drive]],
+                    "seconds": round(cols["drive_seconds"][drive], 1),
+                }
+            )
+        return chart
+
+    def render_drive(self, drive: int) -> List[str]:
+        """Rebuild the ``full_pbp`` log lines ``sim_drive`` would have produced."""
+        cols = self.columns
+        first, stop, pen_first, pen_stop = self._drive_bounds(drive)
+        penalties_by_snap: Dict[int, List[int]] = {}
+        for p in range(pen_first, pen_stop):
+            penalties_by_snap.setdefault(cols["pen_snap"][p], []).append(p)
+
+        lines: List[str] = []
+        plays = ints = fumbles = sacks = explosive = 0
+        for i in range(first, stop):
+            for p in penalties_by_snap.get(i, ()):
+                pen_flags = cols["pen_flags"][p]
+                injury_ref = cols["pen_injury"][p]
+                player = self._player_name(cols["pen_player"][p], "?")
+                position = self.strings[cols["pen_position"][p]]
+                lines.append(
+                    f"PENALTY: {self.strings[cols['pen_name'][p]]} on {position} ({player}), {cols['pen_yards'][p]:+} yards"
+                    + (" [Auto 1st down]" if pen_flags & PENALTY_AUTO_FIRST else "")
+                    + (" [Replay down]" if pen_flags & PENALTY_REPLAY_DOWN else "")
+                    + (f" [INJURY: {self.strings[injury_ref]}]" if injury_ref >= 0 else "")
+                )
+            if i not in penalties_by_snap:
+                lines.append("No penalties this play.")
+            play_type = cols["play_type"][i]
+            if play_type == PLAY_NONE:
+                continue
+            flags = cols["flags"][i]
+            yards = cols["yards"][i]
+            explosive += bool(flags & EXPLOSIVE)
+            sacks += bool(flags & SACK)
+            fumbles += bool(flags & FUMBLE)
+            ints += bool(flags & INTERCEPTION)
+            if play_type == PLAY_RUN:
+                desc = f"Explosive run for {yards} yards" if flags & EXPLOSIVE else f"Run for {yards} yards"
+                if flags & FUMBLE:
+                    lines.append("Fumble lost on run! Turnover.")
+            elif flags & SACK:
+                desc = f"QB sacked for -{-yards} yards"
+            elif flags & COMPLETE:
+                desc = f"Explosive pass complete for {yards} yards" if flags & EXPLOSIVE else f"Pass complete for {yards} yards"
+                if flags & PICK_SIX:
+                    lines.append("Intercepted! Pick-six! Defensive touchdown.")
+                elif flags & INTERCEPTION:
+                    lines.append("Intercepted! Turnover.")
+            else:
+                desc = "Incomplete pass"
+            if flags & DEF_RETURN_TD:
+                lines.append("Fumble return for touchdown! Defensive TD.")
+            elif flags & SPECIAL_RETURN_TD:
+                lines.append("Kick/punt return for touchdown! Special teams TD.")
+            if flags & _DRIVE_ENDING_FLAGS:
+                break
+            ball_at = max(1, min(cols["yardline"][i] + yards, 99))
+            label = "RUN" if play_type == PLAY_RUN else "PASS"
+            lines.append(f"Play {plays+1}: {label} - {desc} | Ball at {ball_at}")
+            if flags & FIRST_DOWN:
+                lines.append("First down!")
+            plays += 1
+            if flags & FOURTH_DOWN_CONVERSION:
+                lines.append("4th down conversion successful!")
+
+        end = cols["drive_end"][drive]
+        value = cols["drive_end_value"][drive]
+        end_lines = {
+            END_TD_PASS: "Passing touchdown!",
+            END_TD_RUSH: "Rushing touchdown!",
+            END_FG_GOOD: f"Field Goal is good! ({value} yards)",
+            END_FG_MISSED: f"Field Goal missed from {value} yards.",
+            END_DOWNS: "Turnover on downs.",
+            END_PUNT: f"Punt: {value} yards.",
+            END_PUNT_INSIDE_20: f"Punt: {value} yards (inside 20).",
+            END_SAFETY: "Safety! Defense scores 2 points.",
+            END_CLOCK: "End of half/game: drive stopped by clock.",
+            END_ERROR_MISSING: "[ERROR] sim_drive: offense_lineup or defense_lineup is None! Aborting drive.",
+            END_ERROR_EMPTY: "[ERROR] sim_drive: offense_lineup or defense_lineup is empty! Aborting drive.",
+        }
+        if end in end_lines:
+            lines.append(end_lines[end])
+
+        score = cols["drive_score"][drive]
+        punts = 1 if end in (END_PUNT, END_PUNT_INSIDE_20) else 0
+        lines.append(
+            f"Drive summary: {plays} plays, {cols['drive_end_pos'][drive] - cols['drive_start'][drive]} yards, "
+            f"{'TD' if score == 7 else 'FG' if score == 3 else 'No score'}, "
+            f"{ints} INT, {fumbles} FUM, {sacks} SACK, {punts} PUNT, {pen_stop - pen_first} PEN, {explosive} EXP"
+        )
+        return lines
+
+    def render(self, team: Any = None) -> List[str]:
+        """Full log for every drive, optionally limited to one offense."""
+        lines: List[str] = []
+        for drive in range(self.drive_count):
+            if team is not None and self.strings[self.columns["drive_team"][drive]] != str(team):
+                continue
+            lines.extend(self.render_drive(drive))
+        return lines
+
+    # ---- Encoding ----
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Compact JSON-safe form: each column is base64 of its little-endian bytes."""
+        encoded = {}
+        for name, column in self.columns.items():
+            if sys.byteorder != "little":
+                column = array(column.typecode, column)
+                column.byteswap()
+            encoded[name] = base64.b64encode(column.tobytes()).decode("ascii")
+        return {
+            "version": ENCODING_VERSION,
+            "players": list(self.players),
+            "strings": list(self.strings),
+            "columns": encoded,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlayRecord":
+        version = int(data.get("version", 0))
+        if version != ENCODING_VERSION:
+            raise ValueError(f"Unsupported play record version: {version}")
+        record = cls()
+        record.players = list(data.get("players", []))
+        record.strings = list(data.get("strings", []))
+        record._string_index = {text: idx for idx, text in enumerate(record.strings)}
+        for name, payload in (data.get("columns") or {}).items():
+            if name not in _ALL_COLUMNS:
+                continue
+            column = array(_ALL_COLUMNS[name])
+            column.frombytes(base64.b64decode(payload))
+            if sys.byteorder != "little":
+                column.byteswap()
+            record.columns[name] = column
+        return record
@@ -4,17 +4,24 @@ import random
 import datetime
 from gridiron_gm_pkg.simulation.entities.team import Team
 from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.prospect import PROSPECT_POOLS, Prospect, load_prospects
 from gridiron_gm_pkg.simulation.career.decision_item import DecisionItem
 from gridiron_gm_pkg.simulation.career.gm_profile import GMProfile
 from gridiron_gm_pkg.simulation.utils.calendar import Calendar  # Update if calendar is moved elsewhere
 from gridiron_gm_pkg.simulation.systems.game.season_manager import SeasonManager  # Update if season_manager is moved elsewhere
+from gridiron_gm_pkg.simulation.systems.player.attribute_store import AttributeStore
+from gridiron_gm_pkg.simulation.systems.player.injury_index import InjuryExpiryIndex
+from gridiron_gm_pkg.simulation.persistence.json_stream import StreamDict, StreamList
+from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import TeamRatingIndex
+from gridiron_gm_pkg.simulation.utils.lazy_sections import LazySections, pending_payload
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
 
-class LeagueManager:
+class LeagueManager(LazySections):
     def __init__(self):
         self.teams = []
         self.free_agents = []
-        self.draft_prospects = []  # <-- Add this line
+        self.draft_prospects = []  # Compact Prospect records until promoted
+        self.college_db = []
         self.calendar = Calendar()
         self.user_team_id = None
         self.controlled_team_id = None
@@ -36,6 +43,36 @@ class LeagueManager:
         self.id_to_team = {}  # Use team.id as universal key
         self.id_to_abbr = {}  # For display
         self.abbr_to_id = {}  # For legacy conversion
+        self.rating_index = TeamRatingIndex()  # Per-team overall/position/health aggregates
+        self.attribute_store = AttributeStore()  # Columnar ratings read by decay and progression
+        self.injury_index = InjuryExpiryIndex()  # Injury end dates for daily healing
+        self.dirty_chunks = None  # Save chunks changed since the last delta save; None = all
+        self.delta_base = None  # Manifest path the clean chunks were last saved to
+
+    def enable_attribute_store(self):
+        """Move every league player's ratings into the league's AttributeStore now.
+
+        Without this, players join the store when decay or progression first reads them.
+        """
+        from gridiron_gm_pkg.simulation.systems.player.injury_status import iter_league_players
+
+        if self.attribute_store is None:
+            self.attribute_store = AttributeStore()
+        self.attribute_store.attach_all(iter_league_players(self))
+        return self.attribute_store
+
+    def promote_prospect(self, prospect):
+        """Replace a compact prospect record (or its id) with a full Player and return it."""
+        for group in PROSPECT_POOLS + ("free_agents",):
+            pool = getattr(self, group, None) or []
+            for idx, entry in enumerate(pool):
+                if entry is prospect or getattr(entry, "id", None) == prospect:
+                    if isinstance(entry, Prospect):
+                        pool[idx] = entry.promote()
+                    return pool[idx]
+        if isinstance(prospect, Prospect):
+            return prospect.promote()
+        return None
 
     def _rebuild_team_maps(self):
         """Ensure all team mappings are up-to-date and complete."""
@@ -81,6 +118,8 @@ class LeagueManager:
         for team in self.teams:
             while len(team.roster) < minimum_roster_size and self.free_agents:
                 player = self.free_agents.pop(0)
+                if isinstance(player, Prospect):
+                    player = player.promote()
                 team.add_player(player)
 
     def generate_schedule(self, weeks=14):
@@ -168,54 +207,99 @@ class LeagueManager:
         # Universal lookup by team ID
         return self.id_to_team.get(team_id)
 
-    def to_dict(self):
-        team_dicts = []
-        for team in self.teams:
-            if hasattr(team, "to_dict"):
-                t = team.to_dict()
-                t["conference"] = getattr(team, "conference", t.get("conference", None))
-                t["team_name"] = getattr(team, "team_name", t.get("team_name", None))
-                t["abbreviation"] = getattr(team, "abbreviation", t.get("abbreviation", None))
-                team_dicts.append(t)
-            else:
-                t = dict(team.__dict__)
-                t["conference"] = getattr(team, "conference", t.get("conference", None))
-                t["team_name"] = getattr(team, "team_name", t.get("team_name", None))
-                t["abbreviation"] = getattr(team, "abbreviation", t.get("abbreviation", None))
-                team_dicts.append(t)
-        # Debug print before returning/writing the league dict
-        print("[LeagueManager.to_dict] Teams to be serialized:")
-        for team in self.teams:
-            abbr = getattr(team, "abbreviation", None)
-            name = getattr(team, "team_name", None)
-            conf = getattr(team, "conference", None)
+    def mark_dirty(self, *chunks):
+        """Record which save chunks changed since the last delta save.
+
+        Chunk names are the ones ``persistence.savegame.league_chunks`` produces;
+        calling this with no names marks the whole league.
+        """
+        if not chunks:
+            self.dirty_chunks = None
+        elif self.dirty_chunks is not None:
+            self.dirty_chunks.update(chunks)
+
+    def _serialize_team(self, team, serialize_players=None):
+        if not hasattr(team, "to_dict"):
+            t = dict(team.__dict__)
+        elif serialize_players is None:
+            t = team.to_dict()
+        else:
+            t = team.to_dict(serialize_players)
+        t["conference"] = getattr(team, "conference", t.get("conference", None))
+        t["team_name"] = getattr(team, "team_name", t.get("team_name", None))
+        t["abbreviation"] = getattr(team, "abbreviation", t.get("abbreviation", None))
+        return t
+
+    def _serialize_pool(self, name, stream=False):
+        """Player dicts for a player pool; a pool never loaded from a lazy save is copied as saved."""
+        payload = pending_payload(self, name)
+        if payload is not None:
+            return payload
+        players = getattr(self, name, []) or []
+        if stream:
+            return StreamList(player.to_dict() for player in players)
+        return [player.to_dict() for player in players]
+
+    def _serialize_time_engine(self, include_inboxes=True):
+        state = {
+            "user_team_id": self.user_team_id,
+            "controlled_team_id": self.controlled_team_id,
+            "base_seed": self.base_seed,
+            "rng_state": self.rng_state if isinstance(self.rng_state, dict) else {},
+            "clock": self._serialize_clock(),
+            "event_queue": self._serialize_queue(),
+            "inboxes": self._serialize_inboxes() if include_inboxes else None,
+            "decisions": self._serialize_decisions() if include_inboxes else None,
+            "last_agenda_date": self._serialize_date(self.last_agenda_date),
+            "simulated_games": sorted(self.simulated_games) if isinstance(self.simulated_games, set) else list(self.simulated_games or []),
+            "last_weekly_decay": getattr(self, "last_weekly_decay", None),
+            "last_season_progression": getattr(self, "last_season_progression", None),
+        }
+        if not include_inboxes:
+            del state["inboxes"], state["decisions"]
+        return state
+
+    def _serialize_summary(self):
+        """Everything in to_dict except teams, player pools, results and time-engine state."""
         return {
-            "teams": team_dicts,
-            "free_agents": [player.to_dict() for player in self.free_agents],
-            "draft_prospects": [player.to_dict() for player in self.draft_prospects],  # <-- Add this line
             "calendar": self.calendar.serialize(),
             "standings": self.standings,
             "schedule": self.schedule,
-            "results_by_week": getattr(self, "results_by_week", {}),
             "transaction_log": list(getattr(self, "transaction_log", []) or []),
             "controlled_team_id": self.controlled_team_id,
             "user_gm": self.user_gm.to_dict() if hasattr(self.user_gm, "to_dict") else self.user_gm,
-            "time_engine": {
-                "user_team_id": self.user_team_id,
-                "controlled_team_id": self.controlled_team_id,
-                "base_seed": self.base_seed,
-                "rng_state": self.rng_state if isinstance(self.rng_state, dict) else {},
-                "clock": self._serialize_clock(),
-                "event_queue": self._serialize_queue(),
-                "inboxes": self._serialize_inboxes(),
-                "decisions": self._serialize_decisions(),
-                "last_agenda_date": self._serialize_date(self.last_agenda_date),
-                "simulated_games": sorted(self.simulated_games) if isinstance(self.simulated_games, set) else list(self.simulated_games or []),
-                "last_weekly_decay": getattr(self, "last_weekly_decay", None),
-                "last_season_progression": getattr(self, "last_season_progression", None),
-            },
         }
 
+    def _dict_items(self, stream=False):
+        """``(key, value)`` pairs of ``to_dict`` in order.
+
+        With ``stream`` the teams and player pools are ``json_stream`` containers
+        whose player dicts are built one at a time as they are written.
+        """
+        if stream:
+            players = lambda group: StreamList(player.to_dict() for player in group)
+            yield "teams", StreamList(StreamDict(self._serialize_team(team, players).items()) for team in self.teams)
+        else:
+            yield "teams", [self._serialize_team(team) for team in self.teams]
+        for name in ("free_agents", "draft_prospects", "college_db"):
+            yield name, self._serialize_pool(name, stream)
+        summary = self._serialize_summary()
+        yield "calendar", summary["calendar"]
+        yield "standings", summary["standings"]
+        yield "schedule", summary["schedule"]
+        yield "results_by_week", getattr(self, "results_by_week", {})
+        yield "transaction_log", summary["transaction_log"]
+        yield "controlled_team_id", summary["controlled_team_id"]
+        yield "user_gm", summary["user_gm"]
+        yield "time_engine", self._serialize_time_engine()
+
+    def to_dict(self):
+        return dict(self._dict_items())
+
+    def to_json_stream(self):
+        """``to_dict`` as a ``json_stream.StreamDict`` for writing without building it."""
+        return StreamDict(self._dict_items(stream=True))
+
     @staticmethod
     def from_dict(data):
         league = LeagueManager()
@@ -241,8 +325,9 @@ class LeagueManager:
         # Debug print: show each created Team object
         for team in league.teams:
             league.free_agents = [Player.from_dict(p) for p in data.get("free_agents", [])]
-        # Add draft prospects
-        league.draft_prospects = [Player.from_dict(p) for p in data.get("draft_prospects", [])]  # <-- Add this line
+        # Prospect pools stay as compact records until a prospect is drafted or inspected
+        league.draft_prospects = load_prospects(data.get("draft_prospects", []))
+        league.college_db = load_prospects(data.get("college_db", []))
         # Standings: convert any abbreviation keys to IDs (legacy support)
         standings = data.get("standings", {})
         new_standings = {}
@@ -310,13 +395,7 @@ class LeagueManager:
         league.game_clock = time_engine.get("clock")
         league.event_queue = time_engine.get("event_queue")
         league.inboxes = time_engine.get("inboxes", {})
-        raw_decisions = time_engine.get("decisions", data.get("decisions", []))
-        if not isinstance(raw_decisions, list):
-            raw_decisions = []
-        league.decisions = [
-            item if isinstance(item, DecisionItem) else DecisionItem.from_dict(item)
-            for item in raw_decisions
-        ]
+        league.decisions = LeagueManager._load_decisions(time_engine.get("decisions", data.get("decisions", [])))
         league.last_agenda_date = time_engine.get("last_agenda_date")
         league.last_weekly_decay = time_engine.get("last_weekly_decay")
         league.last_season_progression = time_engine.get("last_season_progression")
@@ -365,6 +444,15 @@ class LeagueManager:
             for decision in decisions
         ]
 
+    @staticmethod
+    def _load_decisions(raw_decisions):
+        if not isinstance(raw_decisions, list):
+            raw_decisions = []
+        return [
+            item if isinstance(item, DecisionItem) else DecisionItem.from_dict(item)
+            for item in raw_decisions
+        ]
+
     @staticmethod
     def _serialize_date(value):
         if isinstance(value, datetime.date):
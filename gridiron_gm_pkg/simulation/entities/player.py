@@ -1,6 +1,7 @@
 import datetime
 import random
 from uuid import uuid4
+from collections.abc import Mapping
 from dataclasses import dataclass, field, asdict, is_dataclass
 from typing import List, Dict, Optional
 from gridiron_gm_pkg.simulation.systems.player.player_dna import PlayerDNA
@@ -115,6 +116,67 @@ class Contract:
 class Player:
     """Represents a football player."""
 
+    # Process-wide hit/miss counters for the memoized overall and effective attributes.
+    attribute_cache_stats = {"hits": 0, "misses": 0}
+
+    # ------------------------------------------------------------------
+    # Memoized overall / effective attributes
+    #
+    # ``_attr_version`` is bumped whenever ratings, injury effects, injury
+    # status or position change through this class (property setters,
+    # normalize_ratings) or through attribute_xp / AttributeStore writes.
+    # Code that edits ``attributes.core``/``position_specific`` dicts in place
+    # must call invalidate_attribute_cache() (or normalize_ratings()) afterwards.
+    def invalidate_attribute_cache(self) -> None:
+        self.__dict__["_attr_version"] = self.__dict__.get("_attr_version", 0) + 1
+        self.__dict__["_effective_cache"] = {}
+        self.__dict__["_overall_cache"] = None
+
+    @property
+    def attribute_version(self) -> int:
+        return self.__dict__.get("_attr_version", 0)
+
+    @classmethod
+    def reset_attribute_cache_stats(cls) -> None:
+        cls.attribute_cache_stats["hits"] = 0
+        cls.attribute_cache_stats["misses"] = 0
+
+    @property
+    def attributes(self):
+        return self._attributes
+
+    @attributes.setter
+    def attributes(self, value) -> None:
+        self._attributes = value
+        self.invalidate_attribute_cache()
+
+    @property
+    def active_injury_effects(self):
+        return self._active_injury_effects
+
+    @active_injury_effects.setter
+    def active_injury_effects(self, value) -> None:
+        self._active_injury_effects = value
+        self.invalidate_attribute_cache()
+
+    @property
+    def injury_status(self) -> str:
+        return self._injury_status
+
+    @injury_status.setter
+    def injury_status(self, value: str) -> None:
+        self._injury_status = value
+        self.invalidate_attribute_cache()
+
+    @property
+    def position(self):
+        return self._position
+
+    @position.setter
+    def position(self, value) -> None:
+        self._position = value
+        self.invalidate_attribute_cache()
+
     # ------------------------------------------------------------------
     # Core attribute property helpers
     def _get_core_attr(self, name: str) -> Optional[int]:
@@ -124,6 +186,7 @@ class Player:
         if not hasattr(self, "attributes"):
             self.attributes = AttributeSet(core={}, position_specific={})
         self.attributes.core[name] = value
+        self.invalidate_attribute_cache()
 
     # Dynamically expose common core attributes for backward compatibility
     @property
@@ -359,6 +422,11 @@ class Player:
         attrs = getattr(self, "attributes", None)
         if attrs is None:
             return int(round(getattr(self, "overall", 0)))
+        cached = self.__dict__.get("_overall_cache")
+        if cached is not None:
+            Player.attribute_cache_stats["hits"] += 1
+            return cached
+        Player.attribute_cache_stats["misses"] += 1
         values = []
         for container in (attrs.core, attrs.position_specific):
             for val in container.values():
@@ -366,7 +434,9 @@ class Player:
                     values.append(val)
         if not values:
             return int(round(getattr(self, "overall", 0)))
-        return int(round(sum(values) / len(values)))
+        overall = int(round(sum(values) / len(values)))
+        self.__dict__["_overall_cache"] = overall
+        return overall
 
     def normalize_ratings(self) -> None:
         attrs = getattr(self, "attributes", None)
@@ -375,12 +445,19 @@ class Player:
                 for key, val in list(container.items()):
                     if isinstance(val, (int, float)):
                         container[key] = max(0, min(99, int(round(val))))
+        # normalize_ratings is the documented "ratings were edited" hook, so it always invalidates.
+        self.invalidate_attribute_cache()
         self.overall = max(0, min(99, self._compute_overall()))
         pot_value = getattr(self, "pot", None)
         if not isinstance(pot_value, (int, float)):
             pot_value = self.overall
         pot_value = max(0, min(99, int(round(pot_value))))
         self.pot = max(pot_value, self.overall)
+        from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_player_dirty
+        from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import notify_player_changed
+
+        notify_player_changed(self)
+        mark_player_dirty(self)
 
     def init_core_attributes(self):
         """Return baseline attribute mapping common to all players."""
@@ -535,7 +612,8 @@ class Player:
 
     def get_relevant_attribute_names(self) -> List[str]:
         """Return list of all attribute names used for this player."""
-        return list(self.get_all_attributes().keys())
+        attrs = getattr(self, "attributes", AttributeSet())
+        return list(dict.fromkeys([*attrs.core, *attrs.position_specific]))
 
     def add_trait(self, category, trait):
         if category in self.traits:
@@ -583,7 +661,7 @@ class Player:
 
     def add_injury(self, injury):
         """Legacy hook for old injury objects; converts to status-based fields."""
-        from gridiron_gm_pkg.simulation.systems.player.injury_status import apply_simple_injury
+        from gridiron_gm_pkg.simulation.systems.player.injury_status import apply_simple_injury, set_injury_fields
 
         name = getattr(injury, "name", None) or str(injury)
         weeks_out = getattr(injury, "weeks_out", None)
@@ -592,11 +670,7 @@ class Player:
             duration_days = max(1, int(weeks_out) * 7)
             apply_simple_injury(self, datetime.date.today(), duration_days, name, severity=severity)
         else:
-            self.injury_status = "out"
-            self.injury_name = name
-            self.injury_start_date = datetime.date.today()
-            self.injury_end_date = None
-            self.injury_severity = None
+            set_injury_fields(self, "out", name, datetime.date.today(), None)
         if isinstance(self.injuries, list):
             self.injuries.append(name)
         if isinstance(self.injury_history, list):
@@ -616,15 +690,28 @@ class Player:
                 self.is_injured = False
 
     def get_effective_attribute(self, attr: str):
-        """Return the attribute value factoring in active injury penalties."""
+        """Return the attribute value factoring in active injury penalties.
+
+        Values read from the attribute containers are memoized until the next
+        invalidate_attribute_cache(); attributes falling back to plain player
+        fields are recomputed on every call.
+        """
+        cache = self.__dict__.get("_effective_cache")
+        if cache is not None and attr in cache:
+            Player.attribute_cache_stats["hits"] += 1
+            return cache[attr]
+        Player.attribute_cache_stats["misses"] += 1
+
         attrs = getattr(self, "attributes", None)
         base = None
+        cacheable = True
         if attrs is not None and attr in attrs.core:
             base = attrs.core.get(attr)
         elif attrs is not None and attr in attrs.position_specific:
             base = attrs.position_specific.get(attr)
         else:
             base = getattr(self, attr, None)
+            cacheable = False
 
         if base is None:
             base = 0
@@ -638,7 +725,10 @@ class Player:
                 if isinstance(eff, dict) and eff.get("attribute") == attr:
                     penalty += eff.get("change", 0)
 
-        return base + penalty
+        value = base + penalty
+        if cacheable and cache is not None:
+            cache[attr] = value
+        return value
 
     def resolve_discipline_rating(self, default: int = 50) -> int:
         """Return a backward-compatible discipline rating for mixed save formats."""
@@ -653,7 +743,7 @@ class Player:
         attrs = getattr(self, "attributes", None)
         if attrs is not None:
             core = getattr(attrs, "core", None)
-            if isinstance(core, dict):
+            if isinstance(core, Mapping):
                 candidates.append(core.get("discipline"))
             ratings = getattr(attrs, "ratings", None)
             if isinstance(ratings, dict):
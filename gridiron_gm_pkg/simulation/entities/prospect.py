@@ -0,0 +1,211 @@
+"""Compact records for the draft prospect and college pools.
+
+Those pools are far larger than the pro rosters and mostly sit untouched, so
+``LeagueManager`` loads them as ``Prospect`` records instead of full ``Player``
+objects. A record keeps the identity and headline fields in ``__slots__``, packs
+the rating dicts into one byte per rating and keeps everything else (stat
+histories, caps, traits, DNA payload) as a zlib-compressed JSON blob that is only
+decoded when the record is saved or promoted. ``PlayerDNA`` is built on first access.
+
+Call ``promote()`` (or ``LeagueManager.promote_prospect``) when a prospect is
+drafted or needs the full Player API; ``rules.transactions.draft_prospect`` and
+the free-agent paths do this for prospects leaving a pool. ``to_dict()`` returns the payload the record
+was loaded from, plus any header fields (such as a backfilled ``pot``) set since.
+
+Records never develop: the weekly decay and season progression passes call
+``promote_prospect_records`` first, and injured prospects load as full Players,
+so a loaded league develops and heals its prospects like a freshly built one.
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_chunks
+from gridiron_gm_pkg.simulation.systems.player.player_dna import PlayerDNA
+
+# Fields kept as slots; everything else in a player payload goes into the blob.
+_HEADER = (
+    "id",
+    "name",
+    "position",
+    "age",
+    "dob",
+    "college",
+    "birth_location",
+    "jersey_number",
+    "overall",
+    "potential",
+    "pot",
+)
+_NONE_RATING = 255
+_LAYOUTS: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+
+
+def _intern(layout: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Share one tuple object between every record with the same keys."""
+    return _LAYOUTS.setdefault(layout, layout)
+
+
+def _packable(values: Any) -> bool:
+    if not isinstance(values, dict):
+        return False
+    for value in values.values():
+        if value is None:
+            continue
+        if type(value) is not int or not 0 <= value < _NONE_RATING:
+            return False
+    return True
+
+
+class Prospect:
+    """Memory-light stand-in for a Player in the draft/college pools."""
+
+    __slots__ = _HEADER + ("_keys", "_layout", "_ratings", "_mirror", "_blob", "_dna")
+
+    def __init__(self, **fields: Any):
+        for name in _HEADER:
+            setattr(self, name, fields.get(name))
+        self._keys: Tuple[str, ...] = ()
+        self._layout: Optional[Tuple[Tuple[str, ...], Tuple[str, ...]]] = None
+        self._ratings: Optional[bytes] = None
+        self._mirror = False
+        self._blob = b""
+        self._dna: Optional[PlayerDNA] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Prospect":
+        record = cls(**{name: data.get(name) for name in _HEADER})
+        record._keys = _intern(tuple(data))
+        rest = {key: value for key, value in data.items() if key not in _HEADER}
+
+        attrs = rest.get("attributes")
+        if isinstance(attrs, dict) and set(attrs) == {"core", "position_specific"}:
+            core, pos = attrs["core"], attrs["position_specific"]
+            if _packable(core) and _packable(pos):
+                record._layout = _intern((_intern(tuple(core)), _intern(tuple(pos))))
+                record._ratings = bytes(
+                    _NONE_RATING if value is None else value for value in (*core.values(), *pos.values())
+                )
+                del rest["attributes"]
+                if rest.get("position_specific") == pos:
+                    record._mirror = True
+                    del rest["position_specific"]
+        if rest:
+            record._blob = zlib.compress(json.dumps(rest, separators=(",", ":")).encode("utf-8"), 1)
+        return record
+
+    def _rest(self) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(self._blob)) if self._blob else {}
+
+    def _attribute_sections(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        if self._ratings is None:
+            attrs = self._rest().get("attributes") or {}
+            return dict(attrs.get("core") or {}), dict(attrs.get("position_specific") or {})
+        core_keys, pos_keys = self._layout
+        values = [None if value == _NONE_RATING else value for value in self._ratings]
+        split = len(core_keys)
+        return dict(zip(core_keys, values[:split])), dict(zip(pos_keys, values[split:]))
+
+    def get_all_attributes(self) -> Dict[str, Any]:
+        """Combined core and position-specific ratings, like Player.get_all_attributes."""
+        core, pos = self._attribute_sections()
+        combined = dict(core)
+        combined.update(pos)
+        return combined
+
+    @property
+    def dna(self) -> PlayerDNA:
+        if self._dna is None:
+            payload = self._rest().get("dna")
+            if payload:
+                self._dna = PlayerDNA.from_dict(payload)
+            else:
+                self._dna = PlayerDNA.generate_random_dna(self.position, is_college=True)
+        return self._dna
+
+    def to_dict(self) -> Dict[str, Any]:
+        rest = self._rest()
+        if self._ratings is not None:
+            core, pos = self._attribute_sections()
+            rest["attributes"] = {"core": core, "position_specific": pos}
+            if self._mirror:
+                rest["position_specific"] = dict(pos)
+        if self._dna is not None:
+            rest["dna"] = self._dna.to_dict()
+
+        data: Dict[str, Any] = {}
+        for key in self._keys:
+            if key in _HEADER:
+                data[key] = getattr(self, key)
+            elif key in rest:
+                data[key] = rest.pop(key)
+        for name in _HEADER:
+            if name not in data and getattr(self, name) is not None:
+                data[name] = getattr(self, name)
+        data.update(rest)
+        return data
+
+    def promote(self) -> Any:
+        """Build the full Player for this record (its id is kept) and register it with the indexes."""
+        from gridiron_gm_pkg.simulation.entities.player import Player
+        from gridiron_gm_pkg.simulation.systems.player.injury_index import notify_injury_changed
+        from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import notify_player_changed
+
+        player = Player.from_dict(self.to_dict())
+        if self.id is not None:
+            player.id = self.id
+        # Records are invisible to the injury and rating indexes; the Player is not.
+        notify_injury_changed(player)
+        notify_player_changed(player)
+        return player
+
+    def __repr__(self) -> str:
+        return f"Prospect({self.name!r}, {self.position!r}, age={self.age!r}, overall={self.overall!r})"
+
+
+PROSPECT_POOLS = ("draft_prospects", "college_db")
+
+
+def iter_prospect_records(league: Any) -> Iterator[Prospect]:
+    """Compact (not yet promoted) records in the league's prospect pools."""
+    for group in PROSPECT_POOLS:
+        for player in getattr(league, group, []) or []:
+            if isinstance(player, Prospect):
+                yield player
+
+
+def promote_prospect_records(league: Any) -> int:
+    """Promote every compact record in the prospect pools in place; returns how many."""
+    promoted = 0
+    for group in PROSPECT_POOLS:
+        pool = getattr(league, group, None) or []
+        before = promoted
+        for idx, entry in enumerate(pool):
+            if isinstance(entry, Prospect):
+                pool[idx] = entry.promote()
+                promoted += 1
+        if promoted > before:
+            mark_chunks(league, group)
+    return promoted
+
+
+def _injured(payload: Dict[str, Any]) -> bool:
+    status = str(payload.get("injury_status") or "healthy").lower()
+    legacy = payload.get("is_injured") and payload.get("weeks_out")
+    return status != "healthy" or bool(payload.get("injury_end_date")) or bool(legacy)
+
+
+def _load_prospect(payload: Any) -> Any:
+    if not isinstance(payload, dict):
+        return payload
+    record = Prospect.from_dict(payload)
+    # The injury index only tracks Players, so an injured prospect must be one to heal.
+    return record.promote() if _injured(payload) else record
+
+
+def load_prospects(payloads: List[Any]) -> List[Any]:
+    """Prospect records for saved player dicts (injured ones and non-dict entries excepted)."""
+    return [_load_prospect(item) for item in payloads or []]
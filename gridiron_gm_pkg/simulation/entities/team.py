@@ -1,9 +1,16 @@
 import uuid
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_team_dirty
 from gridiron_gm_pkg.simulation.systems.roster.depth_chart import generate_depth_chart
+from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import (
+    notify_depth_chart_changed,
+    notify_player_added,
+    notify_player_removed,
+)
+from gridiron_gm_pkg.simulation.utils.lazy_sections import LazySections, pending_payload
 
-class Team:
+class Team(LazySections):
     """
     Represents a football team in the simulation engine.
 
@@ -88,6 +95,8 @@ class Team:
             self.depth_chart[position] = []
         self.depth_chart[position].append(player)
         self.depth_chart[position].sort(key=lambda p: getattr(p, "overall", 0), reverse=True)
+        notify_player_added(self, player)
+        mark_team_dirty(self, player)
 
     def remove_player(self, player: Player) -> None:
         """
@@ -98,15 +107,20 @@ class Team:
         """
         if player in self.roster:
             self.roster.remove(player)
+            notify_player_removed(self, player)
         for position, player_list in self.depth_chart.items():
             if player in player_list:
                 player_list.remove(player)
+        notify_depth_chart_changed(self)
+        mark_team_dirty(self)
 
     def generate_depth_chart(self) -> None:
         """
         Rebuilds the depth chart by grouping and sorting players by position and overall.
         """
         self.depth_chart = generate_depth_chart(self)
+        notify_depth_chart_changed(self)
+        mark_team_dirty(self)
 
     def get_starters(self) -> Dict[str, Player]:
         """
@@ -137,12 +151,14 @@ class Team:
             return False
         if player in self.roster:
             self.roster.remove(player)
+            notify_player_removed(self, player)
         if player in self.practice_squad:
             self.practice_squad.remove(player)
         self.ir_list.append(player)
         player.on_injured_reserve = True
         if hasattr(player, "injury_status"):
             player.injury_status = "ir"
+        mark_team_dirty(self, player)
         self.generate_depth_chart()
         return True
 
@@ -151,8 +167,10 @@ class Team:
             return False
         self.ir_list.remove(player)
         player.on_injured_reserve = False
+        mark_team_dirty(self, player)
         if len(self.roster) < self.MAX_ROSTER_SIZE:
             self.roster.append(player)
+            notify_player_added(self, player)
             self.generate_depth_chart()
             return True
         if len(self.practice_squad) < self.PRACTICE_SQUAD_SIZE:
@@ -160,13 +178,28 @@ class Team:
             return True
         return False
 
-    def to_dict(self) -> dict:
+    def to_dict(self, serialize_players: Optional[Callable[[List[Player]], object]] = None) -> dict:
         """
         Serializes the team to a dictionary.
 
+        Args:
+            serialize_players (Optional[Callable]): Turns a player list into its serialized
+                form. Defaults to a list of ``Player.to_dict`` results; savegame passes a
+                streaming list instead.
+
         Returns:
             dict: Serialized team data.
         """
+        # A roster loaded lazily and never read is written straight from the save.
+        players = pending_payload(self, "roster")
+        if players is None:
+            serialize = serialize_players or (lambda group: [player.to_dict() for player in group])
+            players = {
+                "players": serialize(self.roster),
+                "ir_list": serialize(self.ir_list),
+                "practice_squad": serialize(self.practice_squad),
+                "depth_chart": {pos: [p.name for p in players] for pos, players in self.depth_chart.items()},
+            }
         return {
             "id": self.id,
             "team_name": self.team_name,
@@ -175,10 +208,10 @@ class Team:
             "conference": self.conference,
             "division": self.division,
             "scouting_accuracy": self.scouting_accuracy,
-            "players": [player.to_dict() for player in self.roster],
-            "ir_list": [player.to_dict() for player in self.ir_list],
-            "practice_squad": [player.to_dict() for player in self.practice_squad],
-            "depth_chart": {pos: [p.name for p in players] for pos, players in self.depth_chart.items()},
+            "players": players.get("players", []),
+            "ir_list": players.get("ir_list", []),
+            "practice_squad": players.get("practice_squad", []),
+            "depth_chart": players.get("depth_chart", {}),
             "team_record": self.team_record,
             "playoff_seed": self.playoff_seed,
             "rebuild_mode": self.rebuild_mode,
@@ -204,10 +237,7 @@ class Team:
             division=data.get("division", "Unknown"),
             id=data.get("id"),
         )
-        team.roster = [Player.from_dict(p) for p in data.get("players", [])]
-        team.ir_list = [Player.from_dict(p) for p in data.get("ir_list", [])]
-        team.practice_squad = [Player.from_dict(p) for p in data.get("practice_squad", [])]
-        team.generate_depth_chart()
+        team._load_roster(data)
         team.team_record = data.get("team_record", {"wins": 0, "losses": 0, "ties": 0})
         team.playoff_seed = data.get("playoff_seed", None)
         team.rebuild_mode = data.get("rebuild_mode", False)
@@ -215,5 +245,12 @@ class Team:
         team.payroll = data.get("payroll")
         return team
 
+    def _load_roster(self, data: dict) -> None:
+        """Build the player lists and depth chart from a serialized team."""
+        self.roster = [Player.from_dict(p) for p in data.get("players", [])]
+        self.ir_list = [Player.from_dict(p) for p in data.get("ir_list", [])]
+        self.practice_squad = [Player.from_dict(p) for p in data.get("practice_squad", [])]
+        self.generate_depth_chart()
+
     def __repr__(self) -> str:
         return f"{self.team_name} | Roster Size: {len(self.roster)}"
@@ -11,9 +11,22 @@ from pathlib import Path
 from typing import Any, Dict
 
 from gridiron_gm_pkg.simulation.career.gm_profile import CareerHistoryEntry, GMProfile
+from gridiron_gm_pkg.simulation.engine.play_record import PlayRecord
 from gridiron_gm_pkg.simulation.entities.league import LeagueManager
 from gridiron_gm_pkg.api.schemas import STATE_SCHEMA_VERSION
-from gridiron_gm_pkg.simulation.persistence.savegame import load_league, save_league
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_chunks, mark_team_dirty
+from gridiron_gm_pkg.simulation.persistence.savegame import (
+    DeltaSnapshot,
+    chunk_dir,
+    load_league,
+    save_league,
+    snapshot_league,
+    team_chunk,
+)
+from gridiron_gm_pkg.simulation.systems.core.data_loader import (
+    discard_results_journal,
+    flush_results_journal,
+)
 from gridiron_gm_pkg.simulation.systems.core.team_data import (
     fill_team_rosters_with_dummy_players,
     load_teams_from_json,
@@ -77,6 +90,8 @@ class GameFacade:
         self._continue_in_progress = False
         self._continue_stop_requested = False
         self._last_continue_result: Dict[str, Any] | None = None
+        # Save chunks touched by the last inbox/depth-chart call; None = unknown.
+        self._save_scope: set[str] | None = None
 
     def _inject_dict_access(self, league: LeagueManager) -> None:
         if not hasattr(league, "get"):
@@ -167,9 +182,13 @@ class GameFacade:
                                 path.unlink()
                             except Exception as exc:
                                 warnings.append(f"Failed to delete save file '{cleaned_save_path}': {exc}")
+                        chunks = chunk_dir(path)
+                        if chunks.is_dir():
+                            shutil.rmtree(chunks, onerror=on_remove_error)
 
             save_name = str(self.save_name or "").strip()
             if save_name:
+                discard_results_journal(save_name)
                 save_dir = Path(__file__).resolve().parents[2] / "data" / "saves" / save_name
                 try:
                     save_dir_exists = save_dir.exists()
@@ -210,11 +229,51 @@ class GameFacade:
             "message": message,
         }
 
-    def save(self, path: str | Path) -> Dict[str, Any]:
+    def save(self, path: str | Path, delta: bool = False, scoped: bool = False) -> Dict[str, Any]:
+        """Save the league to ``path`` (see ``save_league`` for ``delta``).
+
+        ``scoped=True`` limits a delta save to the chunks the preceding inbox or
+        depth-chart call reported changing; only use it directly after such a call.
+        """
         self._ensure_game()
-        save_league(path, self.league)
+        self.note_save(scoped)
+        self._flush_results_for_save()
+        save_league(path, self.league, delta=delta)
         return {"ok": True, "path": str(path)}
 
+    def note_save(self, scoped: bool = False) -> None:
+        """Mark what the last call changed as dirty for the next delta save.
+
+        Teams, players, inboxes and the league summary mark themselves where
+        they change (see ``persistence.dirty_chunks``). An unscoped call may also
+        have moved the clock and played games, so it marks those two chunks.
+        """
+        scope, self._save_scope = self._save_scope, None
+        if self.league is None:
+            return
+        if scoped and scope is not None:
+            if scope:
+                self.league.mark_dirty(*scope)
+        else:
+            self.league.mark_dirty("results", "time_engine")
+
+    def snapshot_save(self, path: str | Path) -> DeltaSnapshot:
+        """Capture the dirty chunks for a delta save; ``write()`` the result without the lock."""
+        self._ensure_game()
+        self._flush_results_for_save()
+        return snapshot_league(path, self.league)
+
+    def _flush_results_for_save(self) -> None:
+        if self.season_manager is not None and getattr(self.league, "dirty_chunks", None) is None:
+            flush_results_journal(self.save_name, self.season_manager.results_by_week, compact=True)
+
+    def _team_save_scope(self, team: Any) -> set[str] | None:
+        teams = list(getattr(self.league, "teams", []) or [])
+        for index, candidate in enumerate(teams):
+            if candidate is team:
+                return {team_chunk(team, index)}
+        return None
+
     def load(self, path: str | Path) -> Dict[str, Any]:
         league = load_league(path)
         self._inject_dict_access(league)
@@ -298,6 +357,7 @@ class GameFacade:
                     filtered_messages.append(msg)
                 engine.inboxes[inbox_team_id] = filtered_messages
             self.league.inboxes = engine.inboxes
+            mark_chunks(self.league, "inboxes")
         self.league.last_agenda_date = None
         self._time_engine = None
         self._get_time_engine().ensure_agenda_for_today()
@@ -322,6 +382,7 @@ class GameFacade:
     def _set_controlled_team_context(self, team_id: str | None) -> None:
         self.league.controlled_team_id = team_id
         self.league.user_team_id = team_id
+        mark_chunks(self.league, "league", "time_engine")
 
     def _normalize_loaded_user_context(self) -> None:
         controlled_team_id = self._resolve_team_id(getattr(self.league, "controlled_team_id", None))
@@ -428,6 +489,7 @@ class GameFacade:
         self._sync_gm_history(gm_profile, resolved_team_id)
         if persist:
             self.league.user_gm = gm_profile
+            mark_chunks(self.league, "league")
         return gm_profile
 
     def get_state(self) -> Dict[str, Any]:
@@ -1641,6 +1703,7 @@ class GameFacade:
         depth_chart = self._depth_chart_position_sources(getattr(team, "depth_chart", None))
         if depth_chart:
             return depth_chart
+        self._save_scope = self._team_save_scope(team)
         generated_depth_chart = self._build_fallback_depth_chart(team)
         self._persist_depth_chart(team, generated_depth_chart)
         return generated_depth_chart
@@ -1652,6 +1715,7 @@ class GameFacade:
             team.depth_chart = depth_chart if isinstance(depth_chart, dict) else {}
         except Exception:
             setattr(team, "depth_chart", depth_chart if isinstance(depth_chart, dict) else {})
+        mark_team_dirty(team)
 
     def _depth_chart_positions_for_requirement(self, requirement_position: str, available_positions: set[str]) -> list[str]:
         aliases = self._DEPTH_CHART_FLEX_ALIASES.get(requirement_position, (requirement_position,))
@@ -1881,6 +1945,7 @@ class GameFacade:
     def auto_fill_depth_chart(self, team_id: str | None = None) -> Dict[str, Any]:
         if not self.has_active_game():
             return {"ok": False, "error": "No active league loaded."}
+        self._save_scope = set()
 
         resolved_team_id = (
             team_id
@@ -1894,6 +1959,7 @@ class GameFacade:
         if team is None:
             return {"ok": False, "error": "team_not_found"}
 
+        self._save_scope = self._team_save_scope(team)
         generated_depth_chart = self._build_fallback_depth_chart(team)
         self._persist_depth_chart(team, generated_depth_chart)
 
@@ -1912,6 +1978,7 @@ class GameFacade:
     ) -> Dict[str, Any]:
         if not self.has_active_game():
             return {"ok": False, "error": "No active league loaded."}
+        self._save_scope = set()
 
         normalized_position = self._safe_stringify(position).strip().upper()
         normalized_player_id = self._safe_stringify(player_id).strip()
@@ -1933,6 +2000,7 @@ class GameFacade:
         if team is None:
             return {"ok": False, "error": "team_not_found"}
 
+        self._save_scope = self._team_save_scope(team)
         depth_chart = self._ensure_persisted_depth_chart(team)
         available_positions = set(depth_chart.keys())
         group_positions = self._depth_chart_group_positions(normalized_position, available_positions)
@@ -2284,6 +2352,7 @@ class GameFacade:
             path = save_dir / filename
             if path.exists():
                 path.unlink()
+        discard_results_journal(self.save_name)
         for standings_path in save_dir.glob("standings_*.json"):
             if standings_path.exists():
                 standings_path.unlink()
@@ -3164,6 +3233,12 @@ class GameFacade:
             else:
                 logging.warning("TODO: missing box score generation for game_id=%s", game_id_str)
                 payload["box_score"] = self._build_minimal_box_score(payload)
+            play_record = payload.pop("play_record", None)
+            if isinstance(play_record, dict):
+                try:
+                    payload["drive_chart"] = PlayRecord.from_dict(play_record).drive_chart()
+                except ValueError:
+                    logging.warning("Unreadable play record for game_id=%s", game_id_str)
             self._attach_season_fields(payload, week_hint)
             return {"ok": True, "game": payload}
 
@@ -3667,10 +3742,10 @@ class GameFacade:
 
     def _compact_advance_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
         engine = self._get_time_engine()
-        queue_events = engine.queue.events()
+        head = engine.queue.peek_next()
         next_event = None
-        if queue_events:
-            next_event = self._calendar_dashboard_event_dict(queue_events[0], engine)
+        if head is not None:
+            next_event = self._calendar_dashboard_event_dict(head, engine)
         paused = bool(result.get("paused"))
         payload = {
             "status": "stopped_for_user_attention" if paused else "advanced",
@@ -4385,8 +4460,10 @@ class GameFacade:
         team_id: str | None = None,
         include_messages: bool = False,
     ) -> Dict[str, Any]:
+        known_engine = self._time_engine is not None
         engine = self._get_time_engine()
         ok = engine.mark_read(message_id, team_id)
+        self._save_scope = {"inboxes"} if known_engine else None
         unread_count = engine.unread_inbox_count(team_id)
         payload: Dict[str, Any] = {"ok": ok, "unread_count": unread_count, "unread": unread_count}
         if include_messages:
@@ -4400,8 +4477,10 @@ class GameFacade:
         team_id: str | None = None,
         include_messages: bool = False,
     ) -> Dict[str, Any]:
+        known_engine = self._time_engine is not None
         engine = self._get_time_engine()
         ok = engine.acknowledge_notification(notification_id, team_id)
+        self._save_scope = {"inboxes"} if known_engine else None
         unread_count = engine.unread_inbox_count(team_id)
         payload: Dict[str, Any] = {
             "ok": ok,
@@ -4414,8 +4493,10 @@ class GameFacade:
         return payload
 
     def mark_all_inbox_read(self, team_id: str | None = None) -> Dict[str, Any]:
+        known_engine = self._time_engine is not None
         engine = self._get_time_engine()
         count = engine.mark_all_read(team_id)
+        self._save_scope = {"inboxes"} if known_engine else None
         return {"ok": True, "marked": count, "unread": engine.unread_inbox_count(team_id)}
 
     def get_decisions(self, *, open_only: bool = True) -> Dict[str, Any]:
@@ -0,0 +1,300 @@
+"""Binary save container with a section table and lazily loaded sections.
+
+A ``.ggsave`` file holds the same payload as a JSON save (``{"schema_version",
+"league"}``), split into sections so a loader can decode only the parts it
+needs::
+
+    magic     b"GGMSAVE\\0"
+    header    <HHI  container version, schema version, section count
+    table     per section: <H name length, UTF-8 name, <BQQ codec, offset, length
+    payloads  one blob per section: compact UTF-8 JSON, compressed with the
+              section's codec (0 none, 1 gzip, 2 bz2, 3 lzma)
+
+Sections are ``header`` (team headers, standings, schedule and the rest of the
+league summary), ``calendar`` (calendar and time-engine state), ``inboxes``
+(inboxes and decisions), one ``roster-<n>`` per team, ``free_agents``,
+``draft_prospects``, ``college_db``, ``results`` and ``transactions``.
+
+``split_payload`` and ``join_sections`` convert losslessly between the two
+layouts (key order included), so a JSON save survives a round trip through a
+binary one unchanged. ``load_binary_league`` builds the league from the header
+and calendar sections only; team rosters, player pools, results and inboxes
+are decoded and built the first time they are read (see
+``utils.lazy_sections``).
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from gridiron_gm_pkg.simulation.entities.player import ensure_pot
+from gridiron_gm_pkg.simulation.persistence.compression import (
+    check_compression,
+    compress,
+    decompress,
+    open_save_file,
+    read_bytes,
+)
+from gridiron_gm_pkg.simulation.utils.lazy_sections import PendingSection, defer_section
+
+MAGIC = b"GGMSAVE\x00"
+BINARY_VERSION = 1
+BINARY_SUFFIX = ".ggsave"
+CODEC_JSON = 0
+# Section codec byte per compression; each section is compressed on its own so
+# it can still be decoded without touching the rest of the file.
+SECTION_CODECS = {None: CODEC_JSON, "gzip": 1, "bz2": 2, "lzma": 3}
+_CODEC_COMPRESSION = {codec: compression for compression, codec in SECTION_CODECS.items()}
+
+_HEADER = struct.Struct("<HHI")
+_NAME = struct.Struct("<H")
+_ENTRY = struct.Struct("<BQQ")
+
+# Team keys kept in the team's roster section rather than the header.
+ROSTER_KEYS = ("players", "ir_list", "practice_squad", "depth_chart")
+# Time-engine keys kept in the inboxes section rather than the calendar section.
+INBOX_KEYS = ("inboxes", "decisions")
+# League keys that get a section of their own, and the section names.
+LEAGUE_SECTIONS = {
+    "free_agents": "free_agents",
+    "draft_prospects": "draft_prospects",
+    "college_db": "college_db",
+    "results_by_week": "results",
+    "transaction_log": "transactions",
+}
+ROSTER_FIELDS = ("roster", "ir_list", "practice_squad", "depth_chart")
+
+
+def roster_section(index: int) -> str:
+    return f"roster-{index}"
+
+
+def is_binary_save(path: str | Path) -> bool:
+    try:
+        with open_save_file(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except (OSError, EOFError, ValueError):
+        return False
+
+
+def split_payload(payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """``(schema_version, sections)`` for a JSON save payload (as produced by ``migrate``)."""
+    league = payload.get("league")
+    if not isinstance(league, dict):
+        raise ValueError("save payload has no league object")
+    header: Dict[str, Any] = {"league_keys": list(league), "league": {}, "teams": [], "team_keys": []}
+    sections: Dict[str, Any] = {"header": header}
+    calendar: Dict[str, Any] = {}
+    for key, value in league.items():
+        if key == "teams" and isinstance(value, list):
+            for index, team in enumerate(value):
+                if not isinstance(team, dict):
+                    header["teams"].append(team)
+                    header["team_keys"].append(None)
+                    continue
+                header["teams"].append({k: v for k, v in team.items() if k not in ROSTER_KEYS})
+                header["team_keys"].append(list(team))
+                sections[roster_section(index)] = {k: team[k] for k in ROSTER_KEYS if k in team}
+        elif key == "calendar":
+            calendar["calendar"] = value
+        elif key == "time_engine" and isinstance(value, dict):
+            calendar["time_engine"] = {k: v for k, v in value.items() if k not in INBOX_KEYS}
+            calendar["time_engine_keys"] = list(value)
+            sections["inboxes"] = {k: value[k] for k in INBOX_KEYS if k in value}
+        elif key in LEAGUE_SECTIONS:
+            sections[LEAGUE_SECTIONS[key]] = value
+        else:
+            header["league"][key] = value
+    sections["calendar"] = calendar
+    return int(payload.get("schema_version", 0) or 0), sections
+
+
+def join_sections(schema_version: int, section: Callable[[str], Any]) -> Dict[str, Any]:
+    """Rebuild the JSON save payload from ``section(name)`` lookups."""
+    header = section("header")
+    calendar = section("calendar")
+    league: Dict[str, Any] = {}
+    for key in header["league_keys"]:
+        if key == "teams" and "teams" not in header["league"]:
+            league[key] = [
+                _join_team(team, keys, section(roster_section(index)) if keys is not None else {})
+                for index, (team, keys) in enumerate(zip(header["teams"], header["team_keys"]))
+            ]
+        elif key == "calendar" and "calendar" in calendar:
+            league[key] = calendar["calendar"]
+        elif key == "time_engine" and "time_engine" in calendar:
+            state = dict(calendar["time_engine"])
+            state.update(section("inboxes"))
+            league[key] = {k: state[k] for k in calendar["time_engine_keys"]}
+        elif key in LEAGUE_SECTIONS and key not in header["league"]:
+            league[key] = section(LEAGUE_SECTIONS[key])
+        else:
+            league[key] = header["league"][key]
+    return {"schema_version": schema_version, "league": league}
+
+
+def _join_team(team: Any, keys: List[str] | None, roster: Dict[str, Any]) -> Any:
+    if keys is None:
+        return team
+    return {key: roster[key] if key in roster else team[key] for key in keys}
+
+
+def encode_sections(schema_version: int, sections: Dict[str, Any], compression: str | None = None) -> bytes:
+    """The container bytes for ``sections`` (name -> JSON-serializable payload)."""
+    codec = SECTION_CODECS[check_compression(compression)]
+    names = list(sections)
+    blobs = [
+        compress(json.dumps(sections[name], separators=(",", ":")).encode("utf-8"), compression) for name in names
+    ]
+    encoded = [name.encode("utf-8") for name in names]
+    table_size = sum(_NAME.size + len(name) + _ENTRY.size for name in encoded)
+    offset = len(MAGIC) + _HEADER.size + table_size
+    parts = [MAGIC, _HEADER.pack(BINARY_VERSION, schema_version, len(names))]
+    for name, blob in zip(encoded, blobs):
+        parts.append(_NAME.pack(len(name)) + name + _ENTRY.pack(codec, offset, len(blob)))
+        offset += len(blob)
+    parts.extend(blobs)
+    return b"".join(parts)
+
+
+def encode_payload(payload: Dict[str, Any], compression: str | None = None) -> bytes:
+    """Binary save bytes for a JSON save payload, sections compressed with ``compression``."""
+    return encode_sections(*split_payload(payload), compression=compression)
+
+
+class SaveFile:
+    """An opened binary save; ``section(name)`` decodes one section on demand.
+
+    The file is read into memory once, so it can be replaced on disk while
+    sections of it are still waiting to be loaded.
+    """
+
+    def __init__(self, data: bytes):
+        if data[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a binary save file")
+        pos = len(MAGIC)
+        version, self.schema_version, count = _HEADER.unpack_from(data, pos)
+        if version > BINARY_VERSION:
+            raise ValueError(f"unsupported binary save version {version}")
+        pos += _HEADER.size
+        self.entries: Dict[str, Tuple[int, int, int]] = {}
+        for _ in range(count):
+            (size,) = _NAME.unpack_from(data, pos)
+            pos += _NAME.size
+            name = data[pos : pos + size].decode("utf-8")
+            pos += size
+            codec, offset, length = _ENTRY.unpack_from(data, pos)
+            pos += _ENTRY.size
+            if offset + length > len(data):
+                raise ValueError(f"binary save section {name!r} is truncated")
+            self.entries[name] = (codec, offset, length)
+        self._data = data
+
+    @classmethod
+    def open(cls, path: str | Path) -> "SaveFile":
+        # A container that was compressed as a whole is expanded here.
+        return cls(read_bytes(path))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.entries
+
+    def section(self, name: str) -> Any:
+        codec, offset, length = self.entries[name]
+        if codec not in _CODEC_COMPRESSION:
+            raise ValueError(f"unknown codec {codec} for binary save section {name!r}")
+        return json.loads(decompress(self._data[offset : offset + length], _CODEC_COMPRESSION[codec]))
+
+    def payload(self) -> Dict[str, Any]:
+        """The whole save as a JSON save payload."""
+        return join_sections(self.schema_version, self.section)
+
+
+def _finish_players(players: List[Any], current_date: Any, league_level: str) -> None:
+    """The per-player fix-ups ``load_league`` applies after building players."""
+    from gridiron_gm_pkg.simulation.entities.prospect import Prospect
+    from gridiron_gm_pkg.simulation.persistence.savegame import DEBUG_POT_BACKFILL
+    from gridiron_gm_pkg.simulation.systems.player.injury_status import convert_legacy_injury_fields
+
+    backfilled = 0
+    for player in players:
+        if not isinstance(player, Prospect):
+            convert_legacy_injury_fields(player, current_date)
+        if ensure_pot(player, league_level):
+            backfilled += 1
+    if DEBUG_POT_BACKFILL and backfilled:
+        print(f"[savegame] Backfilled pot for {backfilled} players.")
+
+
+def _build_roster(team: Any, payload: Dict[str, Any], current_date: Any) -> None:
+    team._load_roster(payload)
+    _finish_players(team.roster + team.ir_list + team.practice_squad, current_date, "pro")
+
+
+def _build_free_agents(league: Any, payload: List[Any], current_date: Any) -> None:
+    from gridiron_gm_pkg.simulation.entities.player import Player
+
+    league.free_agents = [Player.from_dict(p) for p in payload]
+    _finish_players(league.free_agents, current_date, "pro")
+
+
+def _build_prospects(league: Any, payload: List[Any], context: Tuple[str, Any]) -> None:
+    from gridiron_gm_pkg.simulation.entities.prospect import load_prospects
+
+    group, current_date = context
+    setattr(league, group, load_prospects(payload))
+    _finish_players(getattr(league, group), current_date, "college")
+
+
+def _build_results(league: Any, payload: Any, context: Any) -> None:
+    league.results_by_week = payload
+
+
+def _build_transactions(league: Any, payload: Any, context: Any) -> None:
+    league.transaction_log = [item for item in payload or [] if isinstance(item, dict)]
+
+
+def _build_inboxes(league: Any, payload: Dict[str, Any], legacy_decisions: Any) -> None:
+    league.inboxes = payload.get("inboxes", {})
+    league.decisions = league._load_decisions(payload.get("decisions", legacy_decisions))
+
+
+def load_binary_league(save: SaveFile) -> Any:
+    """A LeagueManager whose rosters, pools, results and inboxes load on first access.
+
+    The injury expiry index is left unbuilt; the first heal pass builds it.
+    """
+    from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+
+    header = save.section("header")
+    calendar = save.section("calendar")
+    data = dict(header["league"])
+    data["teams"] = header["teams"]
+    if "calendar" in calendar:
+        data["calendar"] = calendar["calendar"]
+    if "time_engine" in calendar:
+        data["time_engine"] = calendar["time_engine"]
+    league = LeagueManager.from_dict(data)
+
+    current_date = getattr(league.calendar, "current_date", None)
+    for index, team in enumerate(league.teams):
+        name = roster_section(index)
+        if name in save and header["team_keys"][index] is not None:
+            defer_section(team, PendingSection(ROSTER_FIELDS, save, name, _build_roster, current_date))
+    lazy = {
+        "free_agents": (_build_free_agents, current_date),
+        "draft_prospects": (_build_prospects, ("draft_prospects", current_date)),
+        "college_db": (_build_prospects, ("college_db", current_date)),
+        "results_by_week": (_build_results, None),
+        "transaction_log": (_build_transactions, None),
+    }
+    for field, (build, context) in lazy.items():
+        name = LEAGUE_SECTIONS[field]
+        if name in save and field not in header["league"]:
+            defer_section(league, PendingSection((field,), save, name, build, context))
+    if "inboxes" in save and "time_engine" in calendar:
+        legacy = data.get("decisions", [])
+        defer_section(league, PendingSection(INBOX_KEYS, save, "inboxes", _build_inboxes, legacy))
+    return league
@@ -0,0 +1,166 @@
+"""Transparent gzip, bz2 and lzma compression for save files.
+
+Writers choose a codec explicitly or from the file extension (``.gz``,
+``.bz2``, ``.xz``; see ``compression_for_path``). Readers ignore the name and
+detect the codec from the file's magic bytes, so a compressed file can be read
+under any name. Compression and decompression both stream through the stdlib
+file objects, so a large save is never held in memory twice.
+
+``write_atomic`` writes to a temporary file next to the target and renames it
+into place, so an interrupted write leaves the previous file intact.
+"""
+
+from __future__ import annotations
+
+import bz2
+import contextlib
+import gzip
+import io
+import json
+import lzma
+import os
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from gridiron_gm_pkg.simulation.persistence.json_stream import StreamDict, iter_json
+
+COMPRESSIONS = ("gzip", "bz2", "lzma")
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".gzip": "gzip", ".bz2": "bz2", ".xz": "lzma", ".lzma": "lzma"}
+# Preferred extension per codec, e.g. for delta-save chunk files.
+COMPRESSION_EXTENSIONS = {"gzip": ".gz", "bz2": ".bz2", "lzma": ".xz"}
+# zlib's default level: most of level 9's ratio on repetitive JSON at a fraction of the time.
+GZIP_LEVEL = 6
+
+_MAGIC = (("gzip", b"\x1f\x8b"), ("bz2", b"BZh"), ("lzma", b"\xfd7zXZ\x00"))
+_MAGIC_SIZE = max(len(magic) for _, magic in _MAGIC)
+
+
+def check_compression(compression: Optional[str]) -> Optional[str]:
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"unknown compression {compression!r}; expected one of {', '.join(COMPRESSIONS)}")
+    return compression
+
+
+def compression_for_path(path: str | Path) -> Optional[str]:
+    """The codec a file extension asks for, or None."""
+    return COMPRESSION_SUFFIXES.get(Path(path).suffix.lower())
+
+
+def strip_compression_suffix(path: str | Path) -> Path:
+    """``path`` without a trailing compression extension (``league.json.gz`` -> ``league.json``)."""
+    path = Path(path)
+    return path.with_suffix("") if compression_for_path(path) else path
+
+
+def sniff_compression(head: bytes) -> Optional[str]:
+    for name, magic in _MAGIC:
+        if head.startswith(magic):
+            return name
+    return None
+
+
+def detect_compression(path: str | Path) -> Optional[str]:
+    """The codec a file was written with, from its magic bytes (None for plain files)."""
+    try:
+        with Path(path).open("rb") as f:
+            return sniff_compression(f.read(_MAGIC_SIZE))
+    except OSError:
+        return None
+
+
+def compress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression is None:
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "bz2":
+        return bz2.compress(data)
+    if compression == "lzma":
+        return lzma.compress(data)
+    raise ValueError(f"unknown compression {compression!r}")
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    if compression is None:
+        return data
+    if compression == "gzip":
+        return gzip.decompress(data)
+    if compression == "bz2":
+        return bz2.decompress(data)
+    if compression == "lzma":
+        return lzma.decompress(data)
+    raise ValueError(f"unknown compression {compression!r}")
+
+
+def _writer(raw: IO[bytes], compression: str) -> IO[bytes]:
+    if compression == "gzip":
+        # mtime=0 keeps identical content byte-identical on disk.
+        return gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=GZIP_LEVEL, mtime=0)
+    if compression == "bz2":
+        return bz2.BZ2File(raw, "wb")
+    return lzma.LZMAFile(raw, "wb")
+
+
+def _reader(raw: IO[bytes], compression: str) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=raw, mode="rb")
+    if compression == "bz2":
+        return bz2.BZ2File(raw, "rb")
+    return lzma.LZMAFile(raw, "rb")
+
+
+@contextlib.contextmanager
+def open_save_file(path: str | Path, mode: str = "r") -> Iterator[IO[Any]]:
+    """Open ``path`` for reading ("r" text or "rb" bytes), decompressing if needed."""
+    if mode not in ("r", "rb"):
+        raise ValueError(f"open_save_file only reads; got mode {mode!r}")
+    with Path(path).open("rb") as raw:
+        compression = sniff_compression(raw.read(_MAGIC_SIZE))
+        raw.seek(0)
+        stream = raw if compression is None else _reader(raw, compression)
+        try:
+            yield io.TextIOWrapper(stream, encoding="utf-8") if mode == "r" else stream
+        finally:
+            stream.close()
+
+
+def read_bytes(path: str | Path) -> bytes:
+    with open_save_file(path, "rb") as f:
+        return f.read()
+
+
+def read_json(path: str | Path) -> Any:
+    """``json.load`` for a plain or compressed file."""
+    with open_save_file(path) as f:
+        return json.load(f)
+
+
+def write_atomic(path: str | Path, data: str | bytes | Iterable[str | bytes], compression: Optional[str] = None) -> None:
+    """Write ``data`` (or its chunks), optionally compressed, and rename it over ``path``."""
+    path = Path(path)
+    check_compression(compression)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            out = raw if compression is None else _writer(raw, compression)
+            try:
+                for chunk in (data,) if isinstance(data, (str, bytes)) else data:
+                    out.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            finally:
+                if out is not raw:
+                    out.close()
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: str | Path, payload: Any, compression: Optional[str] = None, indent: Optional[int] = 2) -> None:
+    """Atomically write ``payload`` as JSON (same text as ``json.dump``), streaming top-level entries."""
+    streamable = isinstance(payload, dict) and all(isinstance(key, str) for key in payload)
+    document = StreamDict(payload.items()) if streamable else payload
+    write_atomic(path, iter_json(document, indent), compression)
@@ -0,0 +1,113 @@
+"""Mark delta-save chunks dirty where the data changes.
+
+``snapshot_league`` registers every league it saves. After that, code that
+changes a team or a player reports it through ``mark_team_dirty`` or
+``mark_player_dirty``. Every registered league holding that object then marks
+only the chunk it lives in (see ``savegame.league_chunks``). Code that already
+has the league at hand calls ``mark_chunks`` with the chunk names. A league
+whose ``dirty_chunks`` is None gets a full save next anyway, so it is skipped.
+
+Which chunk holds which player is cached per league. The cache is rebuilt from
+a full scan after every delta save, and ``mark_team_dirty`` updates it on
+roster moves. A player the cache does not know triggers one rescan per save
+cycle, e.g. one on a roster that was loaded lazily since the last scan.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, Dict
+
+from gridiron_gm_pkg.simulation.utils.lazy_sections import pending_payload
+
+_LEAGUES: "weakref.WeakSet[Any]" = weakref.WeakSet()
+_OWNERS: "weakref.WeakKeyDictionary[Any, _Owners]" = weakref.WeakKeyDictionary()
+
+_TEAM_GROUPS = ("roster", "ir_list", "practice_squad")
+_POOLS = ("free_agents", "draft_prospects", "college_db")
+
+
+class _Owners:
+    """Chunk name for each team and player of one league, for one save cycle."""
+
+    __slots__ = ("cycle", "chunks", "rescanned")
+
+    def __init__(self, cycle: Any, chunks: Dict[int, str]) -> None:
+        self.cycle = cycle
+        self.chunks = chunks
+        self.rescanned = False
+
+
+def track_league(league: Any) -> None:
+    """Start marking chunks of ``league`` as its teams and players change."""
+    try:
+        _LEAGUES.add(league)
+    except TypeError:
+        pass
+
+
+def _scan(league: Any) -> Dict[int, str]:
+    from gridiron_gm_pkg.simulation.persistence.savegame import team_chunk
+
+    chunks: Dict[int, str] = {}
+    for index, team in enumerate(getattr(league, "teams", []) or []):
+        name = team_chunk(team, index)
+        chunks[id(team)] = name
+        for group in _TEAM_GROUPS:
+            # A section that was never loaded cannot have changed yet.
+            if pending_payload(team, group) is not None:
+                continue
+            for player in getattr(team, group, None) or []:
+                chunks[id(player)] = name
+    for name in _POOLS:
+        if pending_payload(league, name) is not None:
+            continue
+        for player in getattr(league, name, None) or []:
+            chunks[id(player)] = name
+    return chunks
+
+
+def _owners(league: Any) -> _Owners:
+    owners = _OWNERS.get(league)
+    if owners is None or owners.cycle is not league.dirty_chunks:
+        owners = _OWNERS[league] = _Owners(league.dirty_chunks, _scan(league))
+    return owners
+
+
+def _tracking(league: Any) -> bool:
+    return getattr(league, "dirty_chunks", None) is not None
+
+
+def mark_chunks(league: Any, *names: str) -> None:
+    """Mark ``names`` dirty on ``league`` (a no-op for leagues without delta saves)."""
+    if names and _tracking(league):
+        league.mark_dirty(*names)
+
+
+def mark_team_dirty(team: Any, *players: Any) -> None:
+    """Call after changing ``team``; pass the players that just joined its roster."""
+    for league in list(_LEAGUES):
+        if not _tracking(league):
+            continue
+        owners = _owners(league)
+        name = owners.chunks.get(id(team))
+        if name is None:
+            continue
+        for player in players:
+            owners.chunks[id(player)] = name
+        league.mark_dirty(name)
+
+
+def mark_player_dirty(player: Any) -> None:
+    """Call after changing a player's saved fields."""
+    for league in list(_LEAGUES):
+        if not _tracking(league):
+            continue
+        owners = _owners(league)
+        name = owners.chunks.get(id(player))
+        if name is None and not owners.rescanned:
+            owners.chunks = _scan(league)
+            owners.rescanned = True
+            name = owners.chunks.get(id(player))
+        if name is not None:
+            league.mark_dirty(name)
@@ -0,0 +1,71 @@
+"""Incremental JSON writer for documents too large to build in memory.
+
+Wrap the big containers of a document in ``StreamDict`` (an iterable of
+``(key, value)`` pairs) or ``StreamList`` (an iterable of items), usually
+backed by generators. ``iter_json`` produces the document text piece by piece,
+so only one item of a streamed container exists at a time. Any other value is
+handed to ``json.dumps`` whole.
+
+The output is exactly what ``json.dumps`` would produce for the equivalent
+plain dicts and lists, with the same ``indent``. ``indent=None`` gives compact
+output with no whitespace.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, Iterator, Optional, Tuple
+
+
+class StreamDict:
+    """A JSON object whose ``(key, value)`` pairs are produced while writing."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[Tuple[str, Any]]):
+        self.items = items
+
+
+class StreamList:
+    """A JSON array whose items are produced while writing."""
+
+    __slots__ = ("items",)
+
+    def __init__(self, items: Iterable[Any]):
+        self.items = items
+
+
+def _dumps(value: Any, indent: Optional[int], level: int) -> str:
+    if indent is None:
+        return json.dumps(value, separators=(",", ":"))
+    text = json.dumps(value, indent=indent)
+    # JSON strings never contain raw newlines, so every newline is layout.
+    return text.replace("\n", "\n" + " " * (indent * level)) if level else text
+
+
+def iter_json(value: Any, indent: Optional[int] = 2, level: int = 0) -> Iterator[str]:
+    """The JSON text of ``value`` in pieces, streaming any Stream containers in it."""
+    if isinstance(value, StreamDict):
+        opener, closer, entries = "{", "}", value.items
+    elif isinstance(value, StreamList):
+        opener, closer, entries = "[", "]", value.items
+    else:
+        yield _dumps(value, indent, level)
+        return
+
+    if indent is None:
+        inner = outer = ""
+        key_sep = ":"
+    else:
+        inner = "\n" + " " * (indent * (level + 1))
+        outer = "\n" + " " * (indent * level)
+        key_sep = ": "
+    first = True
+    for entry in entries:
+        yield (opener if first else ",") + inner
+        first = False
+        if closer == "}":
+            key, entry = entry
+            yield json.dumps(key) + key_sep
+        yield from iter_json(entry, indent, level + 1)
+    yield opener + closer if first else outer + closer
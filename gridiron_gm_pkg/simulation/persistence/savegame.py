@@ -1,11 +1,35 @@
+import hashlib
 import json
+import marshal
+import re
+import shutil
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from gridiron_gm_pkg.simulation.entities.player import ensure_pot
+from gridiron_gm_pkg.simulation.persistence.binary_save import (
+    BINARY_SUFFIX,
+    SaveFile,
+    encode_payload,
+    is_binary_save,
+    load_binary_league,
+)
+from gridiron_gm_pkg.simulation.persistence.compression import (
+    COMPRESSION_EXTENSIONS,
+    check_compression,
+    compression_for_path,
+    open_save_file,
+    strip_compression_suffix,
+    write_atomic,
+)
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import track_league
+from gridiron_gm_pkg.simulation.persistence.json_stream import StreamDict, iter_json
 
 SCHEMA_VERSION = 1
 DEBUG_POT_BACKFILL = False
+DELTA_FORMAT = "delta"
+# Chunks besides one ``team_chunk`` per team, in manifest order.
+LEAGUE_CHUNKS = ("league", "time_engine", "inboxes", "results", "free_agents", "draft_prospects", "college_db")
 
 
 def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -18,21 +42,270 @@ def migrate(data: Dict[str, Any]) -> Dict[str, Any]:
     return data
 
 
-def save_league(path: str | Path, league: Any) -> None:
-    payload = {
-        "schema_version": SCHEMA_VERSION,
-        "league": league.to_dict() if hasattr(league, "to_dict") else league,
-    }
+def chunk_dir(path: str | Path) -> Path:
+    """Directory holding the chunk files of a delta save's manifest."""
+    save_path = Path(path)
+    return save_path.with_name(save_path.name + ".chunks")
+
+
+def team_chunk(team: Any, index: int = 0) -> str:
+    """Chunk name for ``team``: its id made filename-safe, plus a hash of the raw id.
+
+    The hash keeps ids that only differ in stripped characters apart.
+    """
+    raw_id = str(getattr(team, "id", "") or "")
+    team_id = re.sub(r"[^A-Za-z0-9_-]", "", raw_id)
+    digest = hashlib.sha1(raw_id.encode("utf-8")).hexdigest()[:8]
+    return f"team-{team_id or index}-{digest}"
+
+
+def _drop_chunks(save_path: Path) -> None:
+    """Remove the chunks a delta save once left next to ``save_path``."""
+    shutil.rmtree(chunk_dir(save_path), ignore_errors=True)
+
+
+def league_chunks(league: Any, names: Iterable[str]) -> Iterator[Tuple[str, Any]]:
+    """``(name, payload)`` for each requested chunk of ``league.to_dict()``."""
+    teams = {team_chunk(team, idx): team for idx, team in enumerate(league.teams)}
+    for name in names:
+        if name in teams:
+            payload = league._serialize_team(teams[name])
+        elif name == "league":
+            payload = league._serialize_summary()
+        elif name == "time_engine":
+            payload = league._serialize_time_engine(include_inboxes=False)
+        elif name == "inboxes":
+            payload = {"inboxes": league._serialize_inboxes(), "decisions": league._serialize_decisions()}
+        elif name == "results":
+            payload = getattr(league, "results_by_week", {})
+        elif name in ("free_agents", "draft_prospects", "college_db"):
+            payload = league._serialize_pool(name)
+        else:
+            continue
+        yield name, payload
+
+
+def _save_compression(path: Path, compression: Optional[str]) -> Optional[str]:
+    """An explicit codec, else the one the file extension asks for."""
+    return check_compression(compression) if compression is not None else compression_for_path(path)
+
+
+def _is_binary_path(path: Path) -> bool:
+    return strip_compression_suffix(path).suffix == BINARY_SUFFIX
+
+
+def _read_manifest(path: Path) -> Dict[str, Any] | None:
+    try:
+        with open_save_file(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("format") != DELTA_FORMAT:
+        return None
+    return data
+
+
+class DeltaSnapshot:
+    """One delta save, captured from the league and ready to be written.
+
+    ``snapshot_league`` builds it while the caller holds whatever lock guards the
+    league. Each dirty chunk is held as a ``marshal`` blob, an immutable copy
+    that is much cheaper to take than the JSON text; ``write`` encodes the JSON
+    and touches files without the league, so it can run on another thread.
+    """
+
+    def __init__(
+        self,
+        save_path: Path,
+        teams: List[str],
+        reused: Dict[str, str],
+        blobs: Dict[str, bytes],
+        compression: Optional[str] = None,
+    ):
+        self.save_path = save_path
+        self.teams = teams
+        self.reused = reused
+        self.blobs = blobs
+        self.compression = compression
+
+    def write(self) -> None:
+        directory = chunk_dir(self.save_path)
+        directory.mkdir(parents=True, exist_ok=True)
+        files = dict(self.reused)
+        extension = ".json" + COMPRESSION_EXTENSIONS.get(self.compression, "")
+        for name, blob in self.blobs.items():
+            text = json.dumps(marshal.loads(blob), separators=(",", ":"))
+            filename = f"{name}.{hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]}{extension}"
+            if not (directory / filename).is_file():
+                write_atomic(directory / filename, text, self.compression)
+            files[name] = filename
+
+        chunks = {name: files[name] for name in list(LEAGUE_CHUNKS) + self.teams if name in files}
+        manifest = {"schema_version": SCHEMA_VERSION, "format": DELTA_FORMAT, "teams": self.teams, "chunks": chunks}
+        write_atomic(self.save_path, json.dumps(manifest, indent=2), self.compression)
+        live = set(chunks.values())
+        for stale in directory.iterdir():
+            if stale.name not in live and not stale.name.endswith(".tmp"):
+                try:
+                    stale.unlink()
+                except OSError:
+                    pass
+
+
+def snapshot_league(path: str | Path, league: Any, compression: Optional[str] = None) -> DeltaSnapshot:
+    """Capture the dirty chunks of ``league`` for a delta save to ``path``.
+
+    Clears ``league.dirty_chunks``, which the ``dirty_chunks`` hooks fill again
+    as the league changes; if the snapshot is never written, call
+    ``league.mark_dirty()`` so the next save starts from scratch. JSON encoding
+    and compression happen in ``DeltaSnapshot.write``, outside the caller's lock.
+    """
+    save_path = Path(path)
+    compression = _save_compression(save_path, compression)
+    directory = chunk_dir(save_path)
+    previous = None
+    dirty = getattr(league, "dirty_chunks", None)
+    if dirty is not None and getattr(league, "delta_base", None) == str(save_path):
+        previous = _read_manifest(save_path)
+    old_files = (previous or {}).get("chunks", {})
+
+    teams = [team_chunk(team, idx) for idx, team in enumerate(league.teams)]
+    reused: Dict[str, str] = {}
+    todo = []
+    for name in list(LEAGUE_CHUNKS) + teams:
+        if previous is None or name in dirty or not (directory / old_files.get(name, "")).is_file():
+            todo.append(name)
+        else:
+            reused[name] = old_files[name]
+    blobs = {name: marshal.dumps(payload) for name, payload in league_chunks(league, todo)}
+    league.dirty_chunks = set()
+    league.delta_base = str(save_path)
+    track_league(league)
+    return DeltaSnapshot(save_path, teams, reused, blobs, compression)
+
+
+def _read_delta(save_path: Path, manifest: Dict[str, Any]) -> Dict[str, Any]:
+    directory = chunk_dir(save_path)
+    chunks: Dict[str, Any] = {}
+    for name, filename in (manifest.get("chunks") or {}).items():
+        with open_save_file(directory / filename) as f:
+            chunks[name] = json.load(f)
+
+    league = dict(chunks.get("league") or {})
+    league["teams"] = [chunks[name] for name in manifest.get("teams", [])]
+    for name in ("free_agents", "draft_prospects", "college_db"):
+        league[name] = chunks.get(name) or []
+    league["results_by_week"] = chunks.get("results") or {}
+    time_engine = dict(chunks.get("time_engine") or {})
+    time_engine.update(chunks.get("inboxes") or {})
+    league["time_engine"] = time_engine
+    return {"schema_version": manifest.get("schema_version", SCHEMA_VERSION), "league": league}
+
+
+def save_league(
+    path: str | Path,
+    league: Any,
+    delta: bool = False,
+    compact: bool = False,
+    compression: Optional[str] = None,
+) -> None:
+    """Write ``league`` to ``path``.
+
+    A full JSON save is streamed to a temporary file (see ``json_stream``) and
+    renamed over ``path``, so the whole league dict is never held in memory.
+    The output is the same as ``json.dump(..., indent=2)`` of
+    ``league.to_dict()``, or has no whitespace at all with ``compact=True``.
+
+    With ``delta=True`` the save is a small manifest at ``path`` plus one chunk
+    file per team, player pool, inbox set, results and time-engine state in
+    ``chunk_dir(path)``. Only chunks named in ``league.dirty_chunks`` (all of
+    them when it is None, see ``LeagueManager.mark_dirty``) are serialized, and
+    only chunks whose content changed are written. The manifest is replaced
+    atomically, so an interrupted save leaves the previous one intact. A full
+    save to the same path removes the chunk directory again.
+
+    A ``path`` ending in ``BINARY_SUFFIX`` gets a full binary save instead (see
+    ``persistence.binary_save``); ``delta`` is ignored for those.
+
+    ``compression`` ("gzip", "bz2" or "lzma") defaults to whatever the path's
+    extension asks for (``league.json.gz``, ``league.ggsave.xz``...). JSON saves
+    and delta chunks are compressed as they stream out; binary saves compress
+    each section separately so they still load lazily. ``load_league`` detects
+    compression from the file contents.
+    """
     save_path = Path(path)
     save_path.parent.mkdir(parents=True, exist_ok=True)
-    with save_path.open("w", encoding="utf-8") as f:
-        json.dump(payload, f, indent=2)
+    compression = _save_compression(save_path, compression)
+    binary = _is_binary_path(save_path)
+    if delta and not binary and hasattr(league, "teams"):
+        snapshot_league(save_path, league, compression).write()
+        return
+    if binary:
+        payload = {
+            "schema_version": SCHEMA_VERSION,
+            "league": league.to_dict() if hasattr(league, "to_dict") else league,
+        }
+        write_atomic(save_path, encode_payload(payload, compression))
+    else:
+        if hasattr(league, "to_json_stream"):
+            body = league.to_json_stream()
+        else:
+            body = league.to_dict() if hasattr(league, "to_dict") else league
+        payload = StreamDict([("schema_version", SCHEMA_VERSION), ("league", body)])
+        write_atomic(save_path, iter_json(payload, None if compact else 2), compression)
+    _drop_chunks(save_path)
+    if hasattr(league, "dirty_chunks"):
+        league.dirty_chunks = None
+
+
+def _read_json_save(save_path: Path) -> Any:
+    with open_save_file(save_path) as f:
+        data = json.load(f)
+    if isinstance(data, dict) and data.get("format") == DELTA_FORMAT:
+        data = _read_delta(save_path, data)
+    return data
+
+
+def read_save_payload(path: str | Path) -> Dict[str, Any]:
+    """The migrated ``{"schema_version", "league"}`` payload of any save format."""
+    save_path = Path(path)
+    if is_binary_save(save_path):
+        return migrate(SaveFile.open(save_path).payload())
+    return migrate(_read_json_save(save_path))
+
+
+def convert_save(source: str | Path, target: str | Path, compression: Optional[str] = None) -> None:
+    """Rewrite the save at ``source`` as ``target``, binary if it ends in ``BINARY_SUFFIX``.
+
+    Works on the payload alone, without building the league, so the conversion
+    is lossless in both directions. ``compression`` works as in ``save_league``.
+    """
+    payload = read_save_payload(source)
+    target_path = Path(target)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+    compression = _save_compression(target_path, compression)
+    if _is_binary_path(target_path):
+        write_atomic(target_path, encode_payload(payload, compression))
+    else:
+        write_atomic(target_path, iter_json(StreamDict(payload.items())), compression)
+    _drop_chunks(target_path)
 
 
 def load_league(path: str | Path):
+    """Load a JSON, delta or binary save, compressed or not.
+
+    Binary saves load lazily: only the league summary and calendar are built
+    here, and each team roster, player pool, result set and inbox is built the
+    first time it is read.
+    """
     save_path = Path(path)
-    with save_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+    if is_binary_save(save_path):
+        save = SaveFile.open(save_path)
+        if save.schema_version == SCHEMA_VERSION:
+            return load_binary_league(save)
+        data = save.payload()
+    else:
+        data = _read_json_save(save_path)
     migrated = migrate(data)
     league_data = migrated.get("league", {})
     from gridiron_gm_pkg.simulation.entities.league import LeagueManager
@@ -45,6 +318,7 @@ def load_league(path: str | Path):
     current_date = getattr(league.calendar, "current_date", None)
     for player in iter_league_players(league):
         convert_legacy_injury_fields(player, current_date)
+    league.injury_index.rebuild(league)
     backfilled = 0
     for team in league.teams:
         for player in team.roster + team.ir_list + team.practice_squad:
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+from gridiron_gm_pkg.simulation.entities.prospect import Prospect
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_chunks, mark_team_dirty
 from gridiron_gm_pkg.simulation.rules.contract_rules import (
     cap_summary,
     contract_payload,
     validate_contract_offer,
 )
 
+# Player pool each transaction takes a player from or puts one into.
+_ACTION_POOLS = {"sign": "free_agents", "draft": "draft_prospects", "release": "free_agents"}
+
 
 def _team_for_id(league: Any, team_id: Any) -> Any:
     key = str(team_id or "")
@@ -38,6 +43,8 @@ def _record(league: Any, action: str, team: Any, player: Any, details: Dict[str,
         "details": dict(details or {}),
     }
     log.append(entry)
+    mark_team_dirty(team)
+    mark_chunks(league, "league", _ACTION_POOLS[action])
     return entry
 
 
@@ -49,6 +56,8 @@ def sign_free_agent(league: Any, team_id: Any, player_id: Any, contract: Any) ->
     player = _find_player(free_agents, player_id)
     if player is None:
         return {"ok": False, "error": "free_agent_not_found"}
+    if isinstance(player, Prospect):
+        player = league.promote_prospect(player)
     if len(getattr(team, "roster", []) or []) >= int(getattr(team, "MAX_ROSTER_SIZE", 53) or 53):
         return {"ok": False, "error": "active_roster_full", "summary": cap_summary(team)}
 
@@ -64,6 +73,26 @@ def sign_free_agent(league: Any, team_id: Any, player_id: Any, contract: Any) ->
     return {"ok": True, "transaction": transaction, "summary": cap_summary(team)}
 
 
+def draft_prospect(league: Any, team_id: Any, player_id: Any) -> Dict[str, Any]:
+    """Move a draft prospect onto a team's roster as a full Player."""
+    team = _team_for_id(league, team_id)
+    if team is None:
+        return {"ok": False, "error": "team_not_found"}
+    prospects = getattr(league, "draft_prospects", None) or []
+    prospect = _find_player(prospects, player_id)
+    if prospect is None:
+        return {"ok": False, "error": "draft_prospect_not_found"}
+    if len(getattr(team, "roster", []) or []) >= int(getattr(team, "MAX_ROSTER_SIZE", 53) or 53):
+        return {"ok": False, "error": "active_roster_full", "summary": cap_summary(team)}
+
+    player = league.promote_prospect(prospect) if isinstance(prospect, Prospect) else prospect
+    prospects.remove(player)
+    team.add_player(player)
+    player.current_team = getattr(team, "id", None)
+    transaction = _record(league, "draft", team, player)
+    return {"ok": True, "transaction": transaction, "summary": cap_summary(team)}
+
+
 def release_player(league: Any, team_id: Any, player_id: Any) -> Dict[str, Any]:
     team = _team_for_id(league, team_id)
     if team is None:
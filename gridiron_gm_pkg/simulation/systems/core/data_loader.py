@@ -1,34 +1,153 @@
+import atexit
 import os
 import json
 from pathlib import Path
+from gridiron_gm_pkg.simulation.persistence.compression import read_json, write_json
 from gridiron_gm_pkg.simulation.persistence.savegame import load_league, save_league
 
+# "gzip", "bz2" or "lzma" to compress league.json, results_by_week.json,
+# standings_{year}.json and the playoff files when they are written. Readers
+# detect compression from the file contents, so this can change between runs.
+SAVE_COMPRESSION = None
+RESULTS_JOURNAL_FILENAME = "results_by_week.journal"
+# Fold the journal into results_by_week.json once it holds this many results.
+RESULTS_JOURNAL_COMPACT_LINES = 256
+
+_pending_results = {}
+_journal_line_counts = {}
+
+
+def _save_dir(save_name):
+    return Path(__file__).resolve().parents[3] / "data" / "saves" / save_name
+
+
 def load_schedule_files(save_name, calendar=None):
-    base_path = Path(__file__).resolve().parents[3] / "data" / "saves" / save_name
+    base_path = _save_dir(save_name)
     schedule_path = base_path / "schedule_by_week.json"
     results_path = base_path / "results_by_week.json"
     if os.path.exists(schedule_path):
-        with open(schedule_path, "r") as f:
-            schedule_by_week = json.load(f)
+        schedule_by_week = read_json(schedule_path)
     else:
         schedule_by_week = {}
     if os.path.exists(results_path):
-        with open(results_path, "r") as f:
-            results_by_week = json.load(f)
+        results_by_week = read_json(results_path)
     else:
         results_by_week = {}
+    flush_results_journal(save_name)
+    replay_results_journal(results_by_week, save_name)
     return schedule_by_week, results_by_week
 
-def save_results(results_by_week, save_name):
-    results_path = Path(__file__).resolve().parents[3] / "data" / "saves" / save_name / "results_by_week.json"
+def save_results(results_by_week, save_name, compression=None):
+    """Write the full results snapshot and drop the journal it supersedes."""
+    results_path = _save_dir(save_name) / "results_by_week.json"
     os.makedirs(results_path.parent, exist_ok=True)
-    with open(results_path, "w") as f:
-        json.dump(results_by_week, f, indent=2)
+    write_json(results_path, results_by_week, compression or SAVE_COMPRESSION)
+    discard_results_journal(save_name)
 
-def save_league_state(league, save_name):
-    base_path = Path(__file__).resolve().parents[3] / "data" / "saves" / save_name
-    league_path = base_path / "league.json"
-    save_league(league_path, league)
+def append_result(result, save_name):
+    """Queue one canonical game result for the save's append-only journal."""
+    _pending_results.setdefault(save_name, []).append(json.dumps(result, separators=(",", ":")))
+
+def flush_results_journal(save_name, results_by_week=None, compact=False):
+    """
+    Append queued results to the journal. When ``results_by_week`` is given and
+    the journal is long (or ``compact`` is set), fold it into the snapshot.
+    """
+    pending = _pending_results.pop(save_name, None)
+    if pending:
+        journal_path = _save_dir(save_name) / RESULTS_JOURNAL_FILENAME
+        os.makedirs(journal_path.parent, exist_ok=True)
+        # Never extend a torn line left by an interrupted append.
+        lead = "\n" if _ends_mid_line(journal_path) else ""
+        with open(journal_path, "a") as f:
+            f.write(lead + "\n".join(pending) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        _journal_line_counts[save_name] = _journal_line_counts.get(save_name, 0) + len(pending)
+    if results_by_week is None:
+        return
+    if compact or _journal_line_counts.get(save_name, 0) >= RESULTS_JOURNAL_COMPACT_LINES:
+        save_results(results_by_week, save_name)
+
+def flush_all_results_journals():
+    """Append every save's queued results; also runs at interpreter exit."""
+    for save_name in list(_pending_results):
+        try:
+            flush_results_journal(save_name)
+        except OSError as exc:
+            print(f"[data_loader] Failed to flush results journal for {save_name}: {exc}")
+
+atexit.register(flush_all_results_journals)
+
+def _ends_mid_line(path):
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except OSError:
+        return False
+
+def replay_results_journal(results_by_week, save_name):
+    """
+    Apply journaled results missing from ``results_by_week``. A torn final
+    line from an interrupted write is truncated away. Returns the number applied.
+    """
+    journal_path = _save_dir(save_name) / RESULTS_JOURNAL_FILENAME
+    if not os.path.exists(journal_path):
+        _journal_line_counts[save_name] = 0
+        return 0
+    applied = 0
+    lines = 0
+    offset = 0
+    torn_at = None
+    with open(journal_path, "rb+") as f:
+        for raw in f:
+            start = offset
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                result = json.loads(line)
+            except ValueError:
+                if not raw.endswith(b"\n"):
+                    torn_at = start
+                continue
+            lines += 1
+            if not isinstance(result, dict):
+                continue
+            week = str(result.get("week", "") or "")
+            if not week:
+                continue
+            week_results = results_by_week.setdefault(week, [])
+            game_id = result.get("game_id")
+            if any(game_id == entry.get("game_id") for entry in week_results if isinstance(entry, dict)):
+                continue
+            week_results.append(result)
+            applied += 1
+        if torn_at is not None:
+            f.truncate(torn_at)
+        elif offset and not raw.endswith(b"\n"):
+            # A complete record that lost only its newline.
+            f.seek(0, os.SEEK_END)
+            f.write(b"\n")
+    _journal_line_counts[save_name] = lines
+    return applied
+
+def discard_results_journal(save_name):
+    _pending_results.pop(save_name, None)
+    _journal_line_counts[save_name] = 0
+    journal_path = _save_dir(save_name) / RESULTS_JOURNAL_FILENAME
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+def save_league_state(league, save_name, compression=None):
+    flush_results_journal(save_name)
+    league_path = _save_dir(save_name) / "league.json"
+    save_league(league_path, league, compression=compression or SAVE_COMPRESSION)
 
 def load_league_from_file(save_name, league_class):
     """
@@ -40,16 +159,14 @@ def load_league_from_file(save_name, league_class):
         raise FileNotFoundError(f"League file not found: {league_path}")
     return load_league(league_path)
 
-def save_playoff_bracket(playoff_bracket, save_name):
+def save_playoff_bracket(playoff_bracket, save_name, compression=None):
     base_path = Path(__file__).resolve().parents[3] / "data" / "saves" / save_name
     bracket_path = base_path / "playoff_bracket.json"
     os.makedirs(base_path, exist_ok=True)
-    with open(bracket_path, "w") as f:
-        json.dump(playoff_bracket, f, indent=2)
+    write_json(bracket_path, playoff_bracket, compression or SAVE_COMPRESSION)
 
-def save_playoff_results(playoff_results, save_name):
+def save_playoff_results(playoff_results, save_name, compression=None):
     base_path = Path(__file__).resolve().parents[3] / "data" / "saves" / save_name
     results_path = base_path / "playoff_results.json"
     os.makedirs(base_path, exist_ok=True)
-    with open(results_path, "w") as f:
-        json.dump(playoff_results, f, indent=2)
+    write_json(results_path, playoff_results, compression or SAVE_COMPRESSION)
@@ -294,6 +294,7 @@ class PlayoffManager:
                         away_team,
                         week=week,
                         context={"weather": None, "current_date": sm.calendar.current_date},
+                        detail_level="stats_only",
                     )
                     home_score = sim_home.get("points", sim_home.get("score", 0))
                     away_score = sim_away.get("points", sim_away.get("score", 0))
@@ -18,7 +18,9 @@ from gridiron_gm_pkg.simulation.systems.game.playoff_manager import (
 )
 import gridiron_gm.gridiron_gm_pkg.simulation.engine.game_engine as game_engine
 from gridiron_gm_pkg.simulation.systems.player.fatigue import accumulate_season_fatigue_for_team
-from gridiron_gm_pkg.simulation.engine.game_engine import simulate_game
+from gridiron_gm_pkg.simulation.engine.game_engine import DETAIL_FULL_PBP, simulate_game
+from gridiron_gm_pkg.simulation.engine.play_record import PlayRecord
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_team_dirty
 from gridiron_gm_pkg.simulation.utils.box_score import (
     generate_box_score,
     sanitize_box_score_numbers,
@@ -29,7 +31,7 @@ from gridiron_gm_pkg.simulation.systems.core.team_data import load_teams_from_js
 from gridiron_gm import VERBOSE_SIM_OUTPUT
 
 from gridiron_gm_pkg.simulation.systems.core.data_loader import (
-    load_schedule_files, save_results, save_playoff_bracket, save_playoff_results
+    load_schedule_files, save_results, flush_results_journal, save_playoff_bracket, save_playoff_results
 )
 from gridiron_gm_pkg.simulation.persistence.savegame import save_league
 from gridiron_gm_pkg.simulation.utils.generate_schedule import add_nfl_style_playoff_schedule
@@ -43,6 +45,10 @@ except ImportError:
 
 
 class SeasonManager:
+    # detail_level for simulated games; "full_pbp" also stores each game's play_record
+    # in its result, which GameFacade.get_game turns into a drive_chart.
+    game_detail_level = "stats_only"
+
     def __init__(self, calendar, league, save_name="test_league"):
         self.calendar = calendar
         self.league = league
@@ -222,11 +228,14 @@ class SeasonManager:
             if home_team is None or away_team is None:
                 print(f"ERROR: Could not find team object for {game.get('home_id')} or {game.get('away_id')}. Skipping.")
                 continue
+            play_record = PlayRecord() if self.game_detail_level == DETAIL_FULL_PBP else None
             sim_home, sim_away = simulate_game(
                 home_team,
                 away_team,
                 week=self.calendar.current_week,
                 context={"weather": None, "current_date": self.calendar.current_date},
+                detail_level=self.game_detail_level,
+                play_record=play_record,
             )
             if sim_home is not None and sim_away is not None:
                 home_score = sim_home.get("points", sim_home.get("score", 0))
@@ -247,6 +256,7 @@ class SeasonManager:
                 if label == "Regular Season":
                     # Ensure team_record exists and initialize fields
                     for team_obj in [home_team, away_team]:
+                        mark_team_dirty(team_obj)
                         if not hasattr(team_obj, "team_record"):
                             team_obj.team_record = {}
                         team_obj.team_record.setdefault("wins", 0)
@@ -289,6 +299,8 @@ class SeasonManager:
                     "round": game.get("round"),
                     "box_score": box_score,
                 }
+                if play_record is not None:
+                    game_result["play_record"] = play_record.to_dict()
                 self.results_by_week[week].append(game_result)
                 self.standings_manager.update_from_result(game_result)
                 self.standings_manager.results_by_week = self.results_by_week
@@ -555,6 +567,7 @@ class SeasonManager:
         """
         Saves the entire league dictionary (teams + future keys) to JSON.
         """
+        flush_results_journal(self.save_name)
         base_path = Path(__file__).resolve().parents[3] / "data" / "saves" / self.save_name
         league_path = base_path / "league.json"
         save_league(league_path, self.league)
@@ -2,6 +2,10 @@ import os
 import json
 from pathlib import Path
 
+from gridiron_gm_pkg.simulation.persistence.compression import read_json, write_json
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_chunks, mark_team_dirty
+from gridiron_gm_pkg.simulation.systems.core import data_loader
+
 def update_team_records(home_team, away_team, home_score, away_score):
     """
     Updates the team_record dict for both teams after a game.
@@ -9,6 +13,7 @@ def update_team_records(home_team, away_team, home_score, away_score):
     """
     # Ensure team_record dict exists
     for team in [home_team, away_team]:
+        mark_team_dirty(team)
         if not hasattr(team, "team_record"):
             team.team_record = {}
         team.team_record.setdefault("wins", 0)
@@ -116,23 +121,22 @@ class StandingsManager:
         path = self.get_standings_path()
         if os.path.exists(path):
             try:
-                with open(path, "r") as f:
-                    loaded = json.load(f)
-                    if isinstance(loaded, dict):
-                        # Convert any abbreviation keys to IDs (for legacy files)
-                        new_loaded = {}
-                        for tid, rec in loaded.items():
-                            # If tid is not a known ID but is an abbreviation, convert
-                            if tid not in self.id_to_team and tid in self.abbr_to_id:
-                                real_id = self.abbr_to_id[tid]
-                                tid = real_id
-                            abbr = rec.get("abbr", self.id_to_abbr.get(tid, tid))
-                            conf = rec.get("conference")
-                            if conf is None or conf == "Unknown":
-                                pass
-                            rec["abbr"] = abbr
-                            new_loaded[tid] = rec
-                        return new_loaded
+                loaded = read_json(path)
+                if isinstance(loaded, dict):
+                    # Convert any abbreviation keys to IDs (for legacy files)
+                    new_loaded = {}
+                    for tid, rec in loaded.items():
+                        # If tid is not a known ID but is an abbreviation, convert
+                        if tid not in self.id_to_team and tid in self.abbr_to_id:
+                            real_id = self.abbr_to_id[tid]
+                            tid = real_id
+                        abbr = rec.get("abbr", self.id_to_abbr.get(tid, tid))
+                        conf = rec.get("conference")
+                        if conf is None or conf == "Unknown":
+                            pass
+                        rec["abbr"] = abbr
+                        new_loaded[tid] = rec
+                    return new_loaded
             except Exception:
                 pass
 
@@ -162,8 +166,7 @@ class StandingsManager:
     def save_standings(self):
         path = self.get_standings_path()
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(self.standings, f, indent=2)
+        write_json(path, self.standings, data_loader.SAVE_COMPRESSION)
 
     def update_from_result(self, result):
         label = result.get("label")
@@ -198,6 +201,7 @@ class StandingsManager:
             winner, loser = None, None
 
         # Track division/conference records and victories/opponents
+        mark_chunks(self.league, "league")
         home_team = self.id_to_team.get(home_id)
         away_team = self.id_to_team.get(away_id)
         if home_team and away_team:
@@ -0,0 +1,403 @@
+"""Optional league-wide columnar storage for player ratings.
+
+``AttributeStore`` keeps one contiguous float64 column per attribute name and
+gives every attached player a slot (row) in those columns. An attached
+player's ``attributes`` becomes a ``StoredAttributeSet`` whose ``core`` and
+``position_specific`` mappings are views onto the player's slot, so existing
+code that reads or writes ``player.attributes.core[attr]`` keeps working while
+league-wide scans can read a whole column at once.
+
+Views remember each key's insertion order and value type, so ``dict(view)``
+(and therefore ``Player.to_dict``) is identical to the plain dict it replaced.
+Bools are numeric, as in ``Player.normalize_ratings``: they sit in the columns
+as 0/1 and read back as bools until normalized to ints. ``None`` and other
+non-numeric values are kept on the view itself and read as NaN from the
+columns. Copies and pickles of an attached player carry plain dicts; copies of
+the store start empty.
+
+Every ``LeagueManager`` owns a store. Players join it when weekly decay or
+season progression first reads their ratings (``gather_ratings``), or all at
+once through ``LeagueManager.enable_attribute_store``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from gridiron_gm_pkg.simulation.entities.player import AttributeSet
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_player_dirty
+
+SECTIONS = ("core", "position_specific")
+
+_BOOL = "b"
+_INT = "i"
+_FLOAT = "f"
+_OBJECT = "o"
+_READERS = {_BOOL: bool, _INT: int, _FLOAT: float}
+
+
+def _kind(value: Any) -> str:
+    if isinstance(value, (bool, np.bool_)):
+        return _BOOL
+    if isinstance(value, (int, np.integer)):
+        return _INT
+    if isinstance(value, (float, np.floating)):
+        return _FLOAT
+    return _OBJECT
+
+
+class _AttributeView(MutableMapping):
+    """Dict-like view of one section of one player's ratings."""
+
+    __slots__ = ("_store", "_section", "_slot", "_kinds", "_objects")
+
+    def __init__(self, store: "AttributeStore", section: str, slot: int, values: Optional[Dict[str, Any]] = None):
+        self._store = store
+        self._section = section
+        self._slot = slot
+        self._kinds: Dict[str, str] = {}
+        self._objects: Dict[str, Any] = {}
+        if values:
+            for key, value in values.items():
+                self[key] = value
+
+    def __getitem__(self, key: str) -> Any:
+        kind = self._kinds[key]
+        if kind == _OBJECT:
+            return self._objects[key]
+        return _READERS[kind](self._store._columns[self._section][key][self._slot])
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        kind = _kind(value)
+        column = self._store._column(self._section, key)
+        if kind == _OBJECT:
+            self._objects[key] = value
+            column[self._slot] = np.nan
+        else:
+            self._objects.pop(key, None)
+            column[self._slot] = value
+        self._kinds[key] = kind
+        self._invalidate()
+
+    def __delitem__(self, key: str) -> None:
+        del self._kinds[key]
+        self._objects.pop(key, None)
+        self._store._columns[self._section][key][self._slot] = np.nan
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        invalidate = getattr(self._store._players[self._slot], "invalidate_attribute_cache", None)
+        if invalidate is not None:
+            invalidate()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._kinds
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in self._kinds else default
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._kinds)
+
+    def __len__(self) -> int:
+        return len(self._kinds)
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self)
+
+
+class StoredAttributeSet:
+    """Drop-in replacement for ``AttributeSet`` backed by an ``AttributeStore`` slot."""
+
+    __slots__ = ("store", "slot", "_core", "_position_specific")
+
+    def __init__(self, store: "AttributeStore", slot: int, core: Dict[str, Any], position_specific: Dict[str, Any]):
+        self.store = store
+        self.slot = slot
+        self._core = _AttributeView(store, "core", slot, core)
+        self._position_specific = _AttributeView(store, "position_specific", slot, position_specific)
+
+    @property
+    def core(self) -> _AttributeView:
+        return self._core
+
+    @core.setter
+    def core(self, values: Dict[str, Any]) -> None:
+        self._core.clear()
+        self._core.update(dict(values or {}))
+
+    @property
+    def position_specific(self) -> _AttributeView:
+        return self._position_specific
+
+    @position_specific.setter
+    def position_specific(self, values: Dict[str, Any]) -> None:
+        self._position_specific.clear()
+        self._position_specific.update(dict(values or {}))
+
+    def section(self, name: str) -> _AttributeView:
+        return self._core if name == "core" else self._position_specific
+
+    def to_plain(self) -> AttributeSet:
+        return AttributeSet(core=dict(self._core), position_specific=dict(self._position_specific))
+
+    def __reduce__(self):
+        return AttributeSet, (dict(self._core), dict(self._position_specific))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (AttributeSet, StoredAttributeSet)):
+            return dict(self.core) == dict(other.core) and dict(self.position_specific) == dict(other.position_specific)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"StoredAttributeSet(core={dict(self._core)!r}, position_specific={dict(self._position_specific)!r})"
+
+
+class AttributeStore:
+    """Columnar ratings for every attached player, indexed by slot."""
+
+    def __init__(self, capacity: int = 64) -> None:
+        self._capacity = max(1, int(capacity))
+        self._columns: Dict[str, Dict[str, np.ndarray]] = {section: {} for section in SECTIONS}
+        self._players: List[Any] = []
+        self._free: List[int] = []
+
+    # The store mirrors live Player objects: copies and pickles start empty.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+
+    def __len__(self) -> int:
+        return len(self._players) - len(self._free)
+
+    def __contains__(self, player: Any) -> bool:
+        return self.slot_of(player) is not None
+
+    # ------------------------------------------------------------------
+    # Slots
+    def _grow(self, needed: int) -> None:
+        if needed <= self._capacity:
+            return
+        capacity = self._capacity
+        while capacity < needed:
+            capacity *= 2
+        for columns in self._columns.values():
+            for name, column in columns.items():
+                grown = np.full(capacity, np.nan)
+                grown[: self._capacity] = column
+                columns[name] = grown
+        self._capacity = capacity
+
+    def _column(self, section: str, name: str) -> np.ndarray:
+        column = self._columns[section].get(name)
+        if column is None:
+            column = np.full(self._capacity, np.nan)
+            self._columns[section][name] = column
+        return column
+
+    def slot_of(self, player: Any) -> Optional[int]:
+        attrs = getattr(player, "attributes", None)
+        if isinstance(attrs, StoredAttributeSet) and attrs.store is self:
+            return attrs.slot
+        return None
+
+    def attach(self, player: Any) -> int:
+        """Move ``player``'s ratings into the store and return its slot."""
+        slot = self.slot_of(player)
+        if slot is not None:
+            return slot
+        attrs = getattr(player, "attributes", None)
+        core = dict(getattr(attrs, "core", None) or {})
+        position_specific = dict(getattr(attrs, "position_specific", None) or {})
+        if isinstance(attrs, StoredAttributeSet):
+            attrs.store.detach(player)
+        if self._free:
+            slot = self._free.pop()
+            self._players[slot] = player
+        else:
+            slot = len(self._players)
+            self._grow(slot + 1)
+            self._players.append(player)
+        player.attributes = StoredAttributeSet(self, slot, core, position_specific)
+        return slot
+
+    def attach_all(self, players: Iterable[Any]) -> int:
+        """Attach every player object in ``players``; returns how many were attached."""
+        attached = 0
+        for player in players:
+            if player is None or isinstance(player, dict) or not hasattr(player, "attributes"):
+                continue
+            if self.slot_of(player) is None:
+                self.attach(player)
+                attached += 1
+        return attached
+
+    def detach(self, player: Any) -> None:
+        """Give ``player`` plain dict attributes again and free its slot."""
+        slot = self.slot_of(player)
+        if slot is None:
+            return
+        player.attributes = player.attributes.to_plain()
+        for columns in self._columns.values():
+            for column in columns.values():
+                column[slot] = np.nan
+        self._players[slot] = None
+        self._free.append(slot)
+
+    def players(self) -> List[Any]:
+        """Attached players in slot order."""
+        return [player for player in self._players if player is not None]
+
+    def slots(self, players: Iterable[Any]) -> np.ndarray:
+        """Slot for each player, ``-1`` for players not attached to this store."""
+        return np.asarray([-1 if (slot := self.slot_of(p)) is None else slot for p in players], dtype=np.int64)
+
+    # ------------------------------------------------------------------
+    # Column reads
+    def column(self, name: str, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """Ratings for ``name`` (core first, then position-specific); NaN where absent."""
+        core = self._columns["core"].get(name)
+        pos = self._columns["position_specific"].get(name)
+        size = len(self._players)
+        if core is None and pos is None:
+            values = np.full(size, np.nan)
+        elif pos is None:
+            values = core[:size].copy()
+        elif core is None:
+            values = pos[:size].copy()
+        else:
+            values = np.where(np.isnan(core[:size]), pos[:size], core[:size])
+        return values if slots is None else values[slots]
+
+    def ratings(self, names: Iterable[str], slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """2-D array of ratings, one row per slot and one column per name."""
+        names = list(names)
+        size = len(self._players) if slots is None else len(slots)
+        if not names:
+            return np.empty((size, 0))
+        return np.column_stack([self.column(name, slots) for name in names])
+
+    def overalls(self, slots: Optional[np.ndarray] = None) -> np.ndarray:
+        """``Player._compute_overall`` for every slot at once (NaN for slots without numeric ratings)."""
+        size = len(self._players)
+        total = np.zeros(size)
+        count = np.zeros(size)
+        for columns in self._columns.values():
+            for column in columns.values():
+                values = column[:size]
+                present = ~np.isnan(values)
+                total += np.where(present, values, 0.0)
+                count += present
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = np.where(count > 0, np.rint(total / np.maximum(count, 1)), np.nan)
+        return result if slots is None else result[slots]
+
+    # ------------------------------------------------------------------
+    # Column writes
+    def normalize(self, players: Optional[Iterable[Any]] = None) -> int:
+        """``Player.normalize_ratings`` for many attached players as column operations.
+
+        Ratings are rounded and clamped to 0-99 column by column, overall is the
+        rounded mean of the numeric ratings and pot is lifted to at least overall.
+        Players not attached to this store fall back to their own
+        normalize_ratings. Returns the number of players normalized.
+        """
+        from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import notify_player_changed
+
+        if players is None:
+            attached = self.players()
+            others: List[Any] = []
+        else:
+            attached, others = [], []
+            for player in players:
+                (attached if self.slot_of(player) is not None else others).append(player)
+        for player in others:
+            if hasattr(player, "normalize_ratings"):
+                player.normalize_ratings()
+        if not attached:
+            return len(others)
+
+        slots = self.slots(attached)
+        for columns in self._columns.values():
+            for column in columns.values():
+                values = column[slots]
+                column[slots] = np.where(np.isnan(values), values, np.clip(np.rint(values), 0, 99))
+        for player in attached:
+            attrs = player.attributes
+            for view in (attrs.core, attrs.position_specific):
+                for key, kind in view._kinds.items():
+                    if kind in (_BOOL, _FLOAT):
+                        view._kinds[key] = _INT
+
+        overalls = self.overalls(slots)
+        for player, overall in zip(attached, overalls):
+            if hasattr(player, "invalidate_attribute_cache"):
+                player.invalidate_attribute_cache()
+            if np.isnan(overall):
+                overall = int(round(getattr(player, "overall", 0)))
+            player.overall = max(0, min(99, int(overall)))
+            pot_value = getattr(player, "pot", None)
+            if not isinstance(pot_value, (int, float)):
+                pot_value = player.overall
+            pot_value = max(0, min(99, int(round(pot_value))))
+            player.pot = max(pot_value, player.overall)
+            notify_player_changed(player)
+            mark_player_dirty(player)
+        return len(attached) + len(others)
+
+
+def gather_ratings(
+    league: Any,
+    players: Sequence[Any],
+    rows: Sequence[Tuple[int, str]],
+    fallback: Callable[[Any, str], int],
+) -> np.ndarray:
+    """Rating of ``rows[i] = (player index, name)``, rounded and clamped to 0-99.
+
+    Ratings are read a column at a time from the league's AttributeStore, which
+    first attaches any of ``players`` it does not hold yet. Rows it has no
+    numeric rating for are read one by one through ``fallback(player, name)``.
+    """
+    ratings = np.full(len(rows), np.nan)
+    store = getattr(league, "attribute_store", None)
+    if isinstance(store, AttributeStore) and rows:
+        store.attach_all(players)
+        row_slots = store.slots(players)[np.fromiter((index for index, _ in rows), dtype=np.int64, count=len(rows))]
+        by_name: Dict[str, List[int]] = {}
+        for idx, (_, name) in enumerate(rows):
+            by_name.setdefault(name, []).append(idx)
+        for name, indices in by_name.items():
+            indices = np.asarray(indices, dtype=np.int64)
+            slots = row_slots[indices]
+            attached = slots >= 0
+            ratings[indices[attached]] = store.column(name, slots[attached])
+        ratings = np.clip(np.rint(ratings), 0, 99)
+    for idx in np.flatnonzero(np.isnan(ratings)):
+        index, name = rows[idx]
+        ratings[idx] = fallback(players[index], name)
+    return ratings.astype(np.int64)
+
+
+def normalize_players(league: Any, players: Iterable[Any]) -> None:
+    """Normalize ``players`` through the league's AttributeStore when it has one."""
+    store = getattr(league, "attribute_store", None)
+    if isinstance(store, AttributeStore):
+        store.normalize(players)
+        return
+    for player in players:
+        if hasattr(player, "normalize_ratings"):
+            player.normalize_ratings()
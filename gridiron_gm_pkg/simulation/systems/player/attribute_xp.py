@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-import bisect
+from collections.abc import Mapping
 import random
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Tuple
 
+import numpy as np
+
+from gridiron_gm_pkg.simulation.entities.prospect import promote_prospect_records
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_player_dirty
+from gridiron_gm_pkg.simulation.systems.player.attribute_store import gather_ratings, normalize_players
 from gridiron_gm_pkg.simulation.systems.player.injury_status import iter_league_players
 from gridiron_gm_pkg.simulation.systems.player.player_dna import (
     PHYSICAL_ATTRIBUTE_NAMES,
@@ -16,6 +21,8 @@ MAX_RATING = 99
 
 
 def _clamp_rating(value: Any) -> int:
+    if type(value) is int and 0 <= value <= MAX_RATING:
+        return value
     try:
         rating = int(round(value))
     except (TypeError, ValueError):
@@ -24,6 +31,8 @@ def _clamp_rating(value: Any) -> int:
 
 
 def _clamp_xp(value: Any) -> int:
+    if type(value) is int and 0 <= value <= TOTAL_XP:
+        return value
     try:
         xp = int(round(value))
     except (TypeError, ValueError):
@@ -117,7 +126,33 @@ def _build_xp_table() -> list[int]:
     return xp_table
 
 
-XP_TABLE = _build_xp_table()
+# XP_TABLE[r] is the total XP needed to reach rating r. It is built once at import
+# and never mutated; _XP_TABLE_ARRAY is the read-only NumPy copy for vectorized code.
+XP_TABLE: Tuple[int, ...] = tuple(_build_xp_table())
+_XP_TABLE_ARRAY = np.asarray(XP_TABLE, dtype=np.int64)
+_XP_TABLE_ARRAY.setflags(write=False)
+_XP_BUCKET_SHIFT = 6
+
+
+def _build_xp_buckets() -> Tuple[int, ...]:
+    """Rating at the start of every 2**_XP_BUCKET_SHIFT XP bucket.
+
+    Every rating step costs more XP than a bucket is wide, so a bucket spans at
+    most two ratings and rating_from_xp needs one comparison after the lookup.
+    """
+    width = 1 << _XP_BUCKET_SHIFT
+    assert min(b - a for a, b in zip(XP_TABLE, XP_TABLE[1:])) > width
+    starts = np.arange(0, TOTAL_XP + 1, width, dtype=np.int64)
+    return tuple(int(r) for r in np.searchsorted(_XP_TABLE_ARRAY, starts, side="right") - 1)
+
+
+_XP_BUCKETS = _build_xp_buckets()
+_XP_BUCKETS_ARRAY = np.asarray(_XP_BUCKETS, dtype=np.int64)
+_XP_BUCKETS_ARRAY.setflags(write=False)
+# Sentinel so _XP_TABLE_NEXT[r] is always safe to read (nothing reaches rating 100).
+_XP_TABLE_NEXT = np.append(_XP_TABLE_ARRAY[1:], TOTAL_XP + 1)
+_XP_TABLE_NEXT.setflags(write=False)
+_XP_NEXT = tuple(int(x) for x in _XP_TABLE_NEXT)
 
 
 def xp_at_value(rating: int) -> int:
@@ -127,8 +162,26 @@ def xp_at_value(rating: int) -> int:
 
 def rating_from_xp(xp_total: int) -> int:
     xp_total = _clamp_xp(xp_total)
-    idx = bisect.bisect_right(XP_TABLE, xp_total) - 1
-    return max(0, min(MAX_RATING, idx))
+    rating = _XP_BUCKETS[xp_total >> _XP_BUCKET_SHIFT]
+    if _XP_NEXT[rating] <= xp_total:
+        rating += 1
+    return rating
+
+
+def xp_at_values(ratings: Any) -> np.ndarray:
+    """Vectorized xp_at_value for an array of ratings."""
+    ratings = np.clip(np.rint(np.asarray(ratings, dtype=np.float64)), 0, MAX_RATING).astype(np.int64)
+    return _XP_TABLE_ARRAY[ratings]
+
+
+def ratings_from_xp(xp_totals: Any) -> np.ndarray:
+    """Vectorized rating_from_xp for an array of XP totals."""
+    xp = np.asarray(xp_totals)
+    if xp.dtype.kind != "i":
+        xp = np.rint(xp.astype(np.float64))
+    xp = np.clip(xp, 0, TOTAL_XP).astype(np.int64)
+    ratings = _XP_BUCKETS_ARRAY[xp >> _XP_BUCKET_SHIFT]
+    return ratings + (_XP_TABLE_NEXT[ratings] <= xp)
 
 
 def _get_attr_container(player: Any, attr: str) -> tuple[Dict[str, int], str] | tuple[None, None]:
@@ -157,6 +210,9 @@ def _set_attr_value(player: Any, attr: str, value: int) -> None:
     container, _ = _get_attr_container(player, attr)
     if container is not None:
         container[attr] = _clamp_rating(value)
+        invalidate = getattr(player, "invalidate_attribute_cache", None)
+        if invalidate is not None:
+            invalidate()
         return
     if hasattr(player, attr):
         setattr(player, attr, _clamp_rating(value))
@@ -169,10 +225,10 @@ def _iter_attribute_names(player: Any) -> Iterable[str]:
     names: list[str] = []
     if attrs is not None:
         core = getattr(attrs, "core", {})
-        if isinstance(core, dict):
+        if isinstance(core, Mapping):
             names.extend(core.keys())
         pos = getattr(attrs, "position_specific", {})
-        if isinstance(pos, dict):
+        if isinstance(pos, Mapping):
             names.extend(pos.keys())
     return names
 
@@ -260,6 +316,25 @@ def add_xp(player: Any, attr: str, xp_delta: Any, cap_value: int | None = None)
     return new_rating
 
 
+_DECAY_MULTIPLIER = {"physical": 1.0, "skill": 0.5, "mental": 0.25}
+_DECAY_START_OFFSET = {"skill": 2, "mental": 4}
+_NAME_DECAY_TYPES: Dict[str, str] = {}
+
+
+def _decay_type_from_name(attr: str) -> str:
+    typ = _NAME_DECAY_TYPES.get(attr)
+    if typ is None:
+        lower = str(attr).lower()
+        if lower in PHYSICAL_ATTRIBUTE_NAMES or any(token in lower for token in PHYSICAL_TOKENS):
+            typ = "physical"
+        elif any(token in lower for token in ("awareness", "iq", "recognition", "discipline", "consistency", "vision")):
+            typ = "mental"
+        else:
+            typ = "skill"
+        _NAME_DECAY_TYPES[attr] = typ
+    return typ
+
+
 def _attribute_decay_type(player: Any, attr: str) -> str:
     dna = getattr(player, "dna", None)
     if dna is not None:
@@ -268,12 +343,7 @@ def _attribute_decay_type(player: Any, attr: str) -> str:
             typ = decay_map.get(attr)
             if typ:
                 return str(typ)
-    lower = str(attr).lower()
-    if lower in PHYSICAL_ATTRIBUTE_NAMES or any(token in lower for token in PHYSICAL_TOKENS):
-        return "physical"
-    if any(token in lower for token in ("awareness", "iq", "recognition", "discipline", "consistency", "vision")):
-        return "mental"
-    return "skill"
+    return _decay_type_from_name(attr)
 
 
 def weekly_decay_xp(
@@ -297,11 +367,7 @@ def weekly_decay_xp(
     if not isinstance(profile, dict):
         profile = {}
 
-    start_age = int(profile.get("start_age", 30) or 30)
-    if decay_type == "skill":
-        start_age += 2
-    elif decay_type == "mental":
-        start_age += 4
+    start_age = int(profile.get("start_age", 30) or 30) + _DECAY_START_OFFSET.get(decay_type, 0)
 
     if age < start_age:
         return 0
@@ -313,7 +379,7 @@ def weekly_decay_xp(
     if isinstance(pos_map, dict):
         position_factor = float(pos_map.get(position, 1.0) or 1.0)
 
-    decay_mult = {"physical": 1.0, "skill": 0.5, "mental": 0.25}.get(decay_type, 0.5)
+    decay_mult = _DECAY_MULTIPLIER.get(decay_type, 0.5)
     age_over = max(0, age - start_age)
     age_factor = 1.0 + age_over * 0.08
 
@@ -341,12 +407,120 @@ def _derive_seed(base_seed: int, label: str) -> int:
     return seed
 
 
+_SEED_SUFFIXES: Dict[str, Tuple[int, int]] = {}
+
+
+def _seed_suffix(label: str) -> Tuple[int, int]:
+    """(31**len, hash) such that _derive_seed(s, prefix + label) == (_derive_seed(s, prefix) * mult + hash) mod 2**32."""
+    suffix = _SEED_SUFFIXES.get(label)
+    if suffix is None:
+        suffix = (pow(31, len(label), 1 << 32), _derive_seed(0, label))
+        _SEED_SUFFIXES[label] = suffix
+    return suffix
+
+
+def _counter_uniform(keys: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Stateless uniform draws in [low, high): one splitmix64 hash per key."""
+    z = keys.astype(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    unit = (z >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+    return low + (high - low) * unit
+
+
+def _gather_decay_rows(
+    players: Iterable[Any], token: str, base_seed: int, league: Any = None
+) -> Tuple[List[Tuple[Any, str]], Dict[str, np.ndarray]]:
+    """Collect every (player, attribute) pair old enough to decay, with the inputs weekly_decay_xp reads.
+
+    Ratings are read from ``league``'s AttributeStore columns when it has one.
+    """
+    players = [player for player in players if player is not None]
+    candidates: List[Tuple[int, str]] = []
+    columns: Dict[str, list] = {
+        name: [] for name in ("weekly_rate", "position_factor", "decay_mult", "age_factor", "prefix", "mult", "hash")
+    }
+    for index, player in enumerate(players):
+        age = int(getattr(player, "age", 0) or 0)
+        if age <= 0:
+            continue
+        dna = getattr(player, "dna", None)
+        profile = getattr(dna, "regression_profile", {}) if dna is not None else {}
+        if not isinstance(profile, dict):
+            profile = {}
+        profile_start = int(profile.get("start_age", 30) or 30)
+        if age < profile_start:
+            continue  # no decay type starts earlier than the profile's start age
+
+        weekly_rate = float(profile.get("rate", 0.04) or 0.04) / 52.0
+        position_factor = 1.0
+        pos_map = profile.get("position_modifier")
+        if isinstance(pos_map, dict):
+            position_factor = float(pos_map.get(getattr(player, "position", ""), 1.0) or 1.0)
+        mutations = getattr(dna, "mutations", []) if dna is not None else []
+        built_to_last = MutationType.BuiltToLast in mutations
+        decay_map = getattr(dna, "attribute_decay_type", None) if dna is not None else None
+        if not isinstance(decay_map, dict):
+            decay_map = None
+        prefix = _derive_seed(base_seed, f"decay|{token}|{player.id}|")
+
+        for attr in _iter_attribute_names(player):
+            typ = decay_map.get(attr) if decay_map else None
+            typ = str(typ) if typ else _decay_type_from_name(attr)
+            start_age = profile_start + _DECAY_START_OFFSET.get(typ, 0)
+            if age < start_age:
+                continue
+            age_factor = 1.0 + max(0, age - start_age) * 0.08
+            if built_to_last:
+                age_factor *= 0.5
+            mult, label_hash = _seed_suffix(attr)
+            candidates.append((index, attr))
+            columns["weekly_rate"].append(weekly_rate)
+            columns["position_factor"].append(position_factor)
+            columns["decay_mult"].append(_DECAY_MULTIPLIER.get(typ, 0.5))
+            columns["age_factor"].append(age_factor)
+            columns["prefix"].append(prefix)
+            columns["mult"].append(mult)
+            columns["hash"].append(label_hash)
+
+    rating = gather_ratings(league, players, candidates, _get_attr_value)
+    keep = rating > 0
+    arrays = {
+        "rating": rating[keep],
+        "prefix": np.asarray(columns["prefix"], dtype=np.uint64)[keep],
+        "mult": np.asarray(columns["mult"], dtype=np.uint64)[keep],
+        "hash": np.asarray(columns["hash"], dtype=np.uint64)[keep],
+    }
+    for name in ("weekly_rate", "position_factor", "decay_mult", "age_factor"):
+        arrays[name] = np.asarray(columns[name], dtype=np.float64)[keep]
+    rows = [(players[index], attr) for (index, attr), kept in zip(candidates, keep) if kept]
+    return rows, arrays
+
+
+def _weekly_decay_losses(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """Vectorized weekly_decay_xp over gathered rows, jittered by a counter-based RNG."""
+    rating = arrays["rating"]
+    step_xp = np.maximum(1, _XP_TABLE_ARRAY[rating] - _XP_TABLE_ARRAY[np.maximum(0, rating - 1)])
+    keys = (arrays["prefix"] * arrays["mult"] + arrays["hash"]) & np.uint64(0xFFFFFFFF)
+    xp_loss = step_xp * arrays["weekly_rate"] * arrays["position_factor"] * arrays["decay_mult"] * arrays["age_factor"]
+    xp_loss = xp_loss * _counter_uniform(keys, 0.9, 1.1)
+    return np.maximum(1, np.rint(xp_loss).astype(np.int64))
+
+
 def apply_weekly_decay(
     league: Any,
     year: int | None = None,
     week: int | None = None,
     current_date: Any | None = None,
 ) -> bool:
+    """Apply one week of age-based XP decay to every player in the league.
+
+    Eligible (player, attribute) pairs are gathered into arrays and their losses
+    computed in one NumPy pass. The jitter comes from a counter-based RNG keyed by
+    ``_derive_seed(base_seed, "decay|<year>-W<week>|<player id>|<attr>")``, so a
+    pair's loss depends only on that key, not on iteration order.
+    """
     if league is None:
         return False
 
@@ -369,22 +543,40 @@ def apply_weekly_decay(
         base_seed = 0
         league.base_seed = base_seed
 
-    for player in iter_league_players(league):
-        if player is None:
-            continue
-        for attr in _iter_attribute_names(player):
-            seed = _derive_seed(base_seed, f"decay|{token}|{player.id}|{attr}")
-            rng = random.Random(seed)
-            xp_loss = weekly_decay_xp(
-                player,
-                attr,
-                current_date=current_date,
-                year=year,
-                week=week,
-                rng=rng,
-            )
-            if xp_loss > 0:
-                add_xp(player, attr, -xp_loss)
+    promote_prospect_records(league)
+    rows, arrays = _gather_decay_rows(iter_league_players(league), token, base_seed, league)
+    if rows:
+        losses = _weekly_decay_losses(arrays)
+        current = np.empty(len(rows), dtype=np.int64)
+        cap_xp = np.full(len(rows), TOTAL_XP, dtype=np.int64)
+        for idx, (player, attr) in enumerate(rows):
+            xp_map = getattr(player, "attribute_xp", None)
+            if not isinstance(xp_map, dict):
+                xp_map = sync_xp_from_rating(player)
+            value = xp_map.get(attr)
+            current[idx] = -1 if value is None else _clamp_xp(value)
+            cap_value = _resolve_cap_value(player, attr, None)
+            if cap_value is not None:
+                cap_xp[idx] = XP_TABLE[cap_value]
+
+        # Same reconciliation as add_xp: stored XP must agree with the displayed rating.
+        rating = arrays["rating"]
+        current = np.where((current >= 0) & (ratings_from_xp(current) == rating), current, _XP_TABLE_ARRAY[rating])
+        new_xp = np.minimum(np.clip(current - losses, 0, TOTAL_XP), cap_xp)
+        new_rating = ratings_from_xp(new_xp)
+
+        decayed: Dict[int, Any] = {}
+        changed_players: Dict[int, Any] = {}
+        for idx in range(len(rows)):
+            player, attr = rows[idx]
+            player.attribute_xp[attr] = int(new_xp[idx])
+            decayed[id(player)] = player
+            if new_rating[idx] != rating[idx]:
+                _set_attr_value(player, attr, int(new_rating[idx]))
+                changed_players[id(player)] = player
+        normalize_players(league, changed_players.values())
+        for player in decayed.values():
+            mark_player_dirty(player)
 
     league.last_weekly_decay = token
     return True
@@ -1,8 +1,18 @@
+import weakref
+
+
 class FatigueSystem:
     """
     Handles player fatigue accumulation, recovery, and performance impact for the simulation engine.
+
+    Objects registered with watch() expose a ``fatigue_threshold`` and an
+    ``on_fatigue_crossed(player, old, new)`` method; it is called whenever an
+    add_fatigue/recover call moves a player's fatigue across that threshold.
+    Watchers are held weakly, so a finished game's managers drop out on their own.
     """
 
+    _watchers = weakref.WeakSet()
+
     min_fatigue = 0.0
     max_fatigue = 1.0
 
@@ -41,6 +51,20 @@ class FatigueSystem:
         "DB": 0.011,
     }
 
+    @classmethod
+    def watch(cls, watcher) -> None:
+        cls._watchers.add(watcher)
+
+    @classmethod
+    def unwatch(cls, watcher) -> None:
+        cls._watchers.discard(watcher)
+
+    def _notify(self, player, old: float, new: float) -> None:
+        for watcher in list(self._watchers):
+            threshold = watcher.fatigue_threshold
+            if (old >= threshold) != (new >= threshold):
+                watcher.on_fatigue_crossed(player, old, new)
+
     def add_fatigue(self, player, play_intensity: float = 1.0) -> None:
         """
         Increases a player's fatigue, scaled by position and play intensity.
@@ -64,6 +88,8 @@ class FatigueSystem:
             rate = self.POSITION_FATIGUE_RATE.get(pos, 0.01)
             fatigue_gain = rate * play_intensity * (100 / stamina)
             player.fatigue = min(self.max_fatigue, fatigue + fatigue_gain)
+        if self._watchers:
+            self._notify(player, fatigue, min(self.max_fatigue, fatigue + fatigue_gain))
 
     def recover(self, player: dict, context: str = None, is_on_field: bool = False) -> None:
         """
@@ -84,10 +110,13 @@ class FatigueSystem:
         else:
             recovery_rate = 0.08
         if isinstance(player, dict):
-            player["fatigue"] = max(self.min_fatigue, player.get("fatigue", 0.0) - recovery_rate)
+            fatigue = player.get("fatigue", 0.0)
+            player["fatigue"] = max(self.min_fatigue, fatigue - recovery_rate)
         else:
             fatigue = getattr(player, "fatigue", 0.0)
             player.fatigue = max(self.min_fatigue, fatigue - recovery_rate)
+        if self._watchers:
+            self._notify(player, fatigue, max(self.min_fatigue, fatigue - recovery_rate))
 
     def performance_modifier(self, player: dict) -> float:
         """
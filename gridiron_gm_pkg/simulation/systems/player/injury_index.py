@@ -0,0 +1,146 @@
+"""League-level min-heap of injury end dates.
+
+``InjuryExpiryIndex`` lets ``heal_league_players`` pop just the players whose
+``injury_end_date`` has arrived instead of walking the whole league every day.
+``apply_simple_injury``, ``clear_injury_fields`` and
+``convert_legacy_injury_fields`` report changes through
+``notify_injury_changed``. The heap drops stale entries lazily: an entry only
+counts if it still matches the player's latest end date.
+
+The index is built from a full scan the first time it is used, and again by
+``load_league``. Set ``DEBUG_INJURY_INDEX`` to compare it against a full scan
+before every heal pass.
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+DEBUG_INJURY_INDEX = False
+
+_INDEXES: "weakref.WeakSet[InjuryExpiryIndex]" = weakref.WeakSet()
+
+
+def _end_date(player: Any) -> Optional[datetime.date]:
+    from gridiron_gm_pkg.simulation.systems.player.injury_status import _coerce_date
+
+    return _coerce_date(getattr(player, "injury_end_date", None))
+
+
+class InjuryExpiryIndex:
+    """Injured players ordered by the date they are due to heal."""
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int, int]] = []
+        self._current: Dict[int, Tuple[int, int, Any]] = {}
+        self._members: Set[int] = set()
+        self._next_seq = 0
+        self.built = False
+        _INDEXES.add(self)
+
+    # The index is a cache: copies and pickles start empty and rebuild on demand.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def _refresh_members(self, league: Any) -> List[Any]:
+        from gridiron_gm_pkg.simulation.systems.player.injury_status import iter_league_players
+
+        players = list(iter_league_players(league))
+        self._members = {id(player) for player in players}
+        return players
+
+    def rebuild(self, league: Any) -> None:
+        """Re-index every league player with an injury end date."""
+        self._heap = []
+        self._current = {}
+        self._next_seq = 0
+        for player in self._refresh_members(league):
+            self._track(player)
+        self.built = True
+
+    def _track(self, player: Any) -> None:
+        key = id(player)
+        end = _end_date(player)
+        if end is None:
+            self._current.pop(key, None)
+            return
+        ordinal = end.toordinal()
+        entry = self._current.get(key)
+        if entry is not None and entry[0] == ordinal:
+            return
+        seq = self._next_seq
+        self._next_seq += 1
+        self._current[key] = (ordinal, seq, player)
+        heapq.heappush(self._heap, (ordinal, seq, key))
+
+    def player_changed(self, player: Any) -> None:
+        if self.built:
+            self._track(player)
+
+    def due(self, current_date: datetime.date) -> List[Any]:
+        """Pop tracked players whose end date is on or before ``current_date``."""
+        ordinal = current_date.toordinal()
+        players = []
+        while self._heap and self._heap[0][0] <= ordinal:
+            _, seq, key = heapq.heappop(self._heap)
+            entry = self._current.get(key)
+            if entry is None or entry[1] != seq:
+                continue
+            del self._current[key]
+            players.append(entry[2])
+        return players
+
+    def heal_due(self, league: Any, current_date: Any) -> int:
+        """``heal_league_players`` for the players due today; returns how many healed."""
+        from gridiron_gm_pkg.simulation.systems.player.injury_status import _coerce_date, heal_if_due
+
+        current = _coerce_date(current_date)
+        if current is None:
+            return 0
+        if not self.built:
+            self.rebuild(league)
+        if DEBUG_INJURY_INDEX:
+            problems = self.verify(league)
+            if problems:
+                raise RuntimeError(f"InjuryExpiryIndex out of sync: {problems}")
+
+        healed = 0
+        refreshed = False
+        for player in self.due(current):
+            if id(player) not in self._members and not refreshed:
+                # Joined the league since the last scan, or belongs to another league.
+                self._refresh_members(league)
+                refreshed = True
+            if id(player) not in self._members:
+                continue
+            if heal_if_due(player, current):
+                healed += 1
+        return healed
+
+    def verify(self, league: Any) -> List[str]:
+        """Players whose indexed end date disagrees with a full league scan."""
+        from gridiron_gm_pkg.simulation.systems.player.injury_status import iter_league_players
+
+        problems = []
+        for player in iter_league_players(league):
+            end = _end_date(player)
+            entry = self._current.get(id(player))
+            indexed = None if entry is None else datetime.date.fromordinal(entry[0])
+            if end != indexed:
+                problems.append(f"{getattr(player, 'name', player)}: {indexed} != {end}")
+        return problems
+
+
+def notify_injury_changed(player: Any) -> None:
+    """Call after changing a player's ``injury_end_date``."""
+    for index in list(_INDEXES):
+        index.player_changed(player)
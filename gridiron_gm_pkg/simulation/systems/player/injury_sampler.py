@@ -0,0 +1,196 @@
+"""Precomputed weighted samplers for picking injuries from the catalog.
+
+``injury_sampler(context)`` returns an ``InjurySampler`` built once per context
+("game", "practice", "off_field") from ``config/injury_catalog.py``. Each
+sampler holds Walker alias tables, so a draw costs one index and at most one
+coin flip no matter how large the catalog is.
+
+Catalog entries may carry two optional weighting keys:
+
+* ``"frequency"``: relative likelihood of the injury (default 1.0).
+* ``"position_weights"``: per-position multipliers on that frequency, e.g.
+  ``{"QB": 0.5, "RB": 2.0}`` (positions not listed use 1.0; 0 rules it out).
+
+With no weights every eligible injury is equally likely, and a scalar draw
+consumes the RNG exactly like ``rng.choice`` over the eligible entries did.
+``sample_batch`` draws many injuries at once with a NumPy generator.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+CONTEXT_INJURY_TYPES = {
+    "game": ("on_field", "either"),
+    "practice": ("on_field", "either"),
+    "off_field": ("off_field", "either"),
+}
+
+_SAMPLERS: Dict[str, "InjurySampler"] = {}
+
+
+def _context_key(context: Any) -> str:
+    key = str(context).lower()
+    # Unknown contexts draw off-field injuries, as every non-game context did before "practice" was added.
+    return key if key in CONTEXT_INJURY_TYPES else "off_field"
+
+
+def _weight(value: Any, default: float = 1.0) -> float:
+    try:
+        weight = float(value)
+    except (TypeError, ValueError):
+        return default
+    return weight if weight > 0 else 0.0
+
+
+class AliasTable:
+    """Walker/Vose alias table for O(1) draws from a fixed discrete distribution."""
+
+    __slots__ = ("prob", "alias", "_prob_array", "_alias_array")
+
+    def __init__(self, weights: Sequence[float]):
+        size = len(weights)
+        if not size:
+            raise ValueError("AliasTable needs at least one weight")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("AliasTable needs a positive total weight")
+
+        prob = [1.0] * size
+        alias = list(range(size))
+        if any(weight != weights[0] for weight in weights):
+            scaled = [weight * size / total for weight in weights]
+            small = [idx for idx, value in enumerate(scaled) if value < 1.0]
+            large = [idx for idx, value in enumerate(scaled) if value >= 1.0]
+            while small and large:
+                lo, hi = small.pop(), large.pop()
+                prob[lo] = scaled[lo]
+                alias[lo] = hi
+                scaled[hi] -= 1.0 - scaled[lo]
+                (small if scaled[hi] < 1.0 else large).append(hi)
+            # Whatever is left is 1.0 up to rounding error.
+            for idx in small + large:
+                prob[idx] = 1.0
+                alias[idx] = idx
+
+        self.prob: Tuple[float, ...] = tuple(prob)
+        self.alias: Tuple[int, ...] = tuple(alias)
+        self._prob_array = np.asarray(prob)
+        self._alias_array = np.asarray(alias, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def draw(self, rng: Any = None) -> int:
+        """One index; ``rng`` is anything with ``randrange`` and ``random``."""
+        rng = rng or random
+        idx = rng.randrange(len(self.prob))
+        prob = self.prob[idx]
+        if prob < 1.0 and rng.random() >= prob:
+            idx = self.alias[idx]
+        return idx
+
+    def draw_many(self, size: int, rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """``size`` indices at once from a NumPy generator."""
+        rng = rng if rng is not None else np.random.default_rng()
+        columns = rng.integers(0, len(self.prob), size=size)
+        coins = rng.random(size)
+        return np.where(coins < self._prob_array[columns], columns, self._alias_array[columns])
+
+
+class InjurySampler:
+    """Weighted injury picker for one context, with lazily built per-position tables."""
+
+    def __init__(self, catalog: Dict[str, Dict[str, Any]], context: str = "game"):
+        self.context = _context_key(context)
+        allowed = CONTEXT_INJURY_TYPES[self.context]
+        entries = [
+            (name, data)
+            for name, data in (catalog or {}).items()
+            if data.get("injury_context", "on_field") in allowed
+        ]
+        if not entries:
+            entries = list((catalog or {}).items())
+        self.entries: List[Tuple[str, Dict[str, Any]]] = entries
+        self._base = [_weight(data.get("frequency")) for _, data in entries]
+        self._positional = any(data.get("position_weights") for _, data in entries)
+        self._tables: Dict[Any, Optional[Tuple[List[int], AliasTable]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _table(self, position: Any = None) -> Optional[Tuple[List[int], AliasTable]]:
+        key = position if self._positional else None
+        if key in self._tables:
+            return self._tables[key]
+        weights = list(self._base)
+        if key is not None:
+            for idx, (_, data) in enumerate(self.entries):
+                multipliers = data.get("position_weights") or {}
+                weights[idx] *= _weight(multipliers.get(key))
+        indices = [idx for idx, weight in enumerate(weights) if weight > 0]
+        if not indices and self.entries:
+            # Every entry was weighted out: fall back to a uniform pick.
+            indices, weights = list(range(len(self.entries))), [1.0] * len(self.entries)
+        table = (indices, AliasTable([weights[idx] for idx in indices])) if indices else None
+        self._tables[key] = table
+        return table
+
+    def sample(self, rng: Any = None, position: Any = None) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """One ``(injury_name, injury_data)`` pair, or None for an empty catalog."""
+        table = self._table(position)
+        if table is None:
+            return None
+        indices, alias = table
+        return self.entries[indices[alias.draw(rng)]]
+
+    def sample_indices(
+        self,
+        size: int,
+        rng: Optional[np.random.Generator] = None,
+        position: Any = None,
+    ) -> np.ndarray:
+        """Indices into ``entries`` for ``size`` injuries to players at ``position``."""
+        table = self._table(position)
+        if table is None or size <= 0:
+            return np.empty(0, dtype=np.int64)
+        indices, alias = table
+        return np.asarray(indices, dtype=np.int64)[alias.draw_many(size, rng)]
+
+    def sample_batch(
+        self,
+        positions: Iterable[Any],
+        rng: Optional[np.random.Generator] = None,
+    ) -> List[Optional[Tuple[str, Dict[str, Any]]]]:
+        """One injury per entry of ``positions`` (in order), drawn per position group."""
+        positions = list(positions)
+        results: List[Optional[Tuple[str, Dict[str, Any]]]] = [None] * len(positions)
+        if not self.entries:
+            return results
+        rng = rng if rng is not None else np.random.default_rng()
+        groups: Dict[Any, List[int]] = {}
+        for slot, position in enumerate(positions):
+            groups.setdefault(position if self._positional else None, []).append(slot)
+        for position, slots in groups.items():
+            for slot, idx in zip(slots, self.sample_indices(len(slots), rng, position)):
+                results[slot] = self.entries[idx]
+        return results
+
+
+def injury_sampler(context: Any = "game") -> InjurySampler:
+    """The shared sampler for ``context``, built from the catalog on first use."""
+    key = _context_key(context)
+    sampler = _SAMPLERS.get(key)
+    if sampler is None:
+        from gridiron_gm_pkg.config.injury_catalog import INJURY_CATALOG
+
+        sampler = _SAMPLERS[key] = InjurySampler(INJURY_CATALOG, key)
+    return sampler
+
+
+def reset_injury_samplers() -> None:
+    """Forget the shared samplers so the next draw rebuilds them from the catalog."""
+    _SAMPLERS.clear()
@@ -4,6 +4,9 @@ import datetime
 import random
 from typing import Any, Iterator
 
+from gridiron_gm_pkg.simulation.systems.player.injury_index import InjuryExpiryIndex, notify_injury_changed
+from gridiron_gm_pkg.simulation.systems.player.injury_sampler import injury_sampler
+
 _VALID_STATUSES = {"healthy", "questionable", "out", "ir"}
 _SEVERITY_LEVELS = {"minor": 1, "moderate": 2, "severe": 3}
 
@@ -56,12 +59,34 @@ def _severity_to_level(severity: Any) -> int | None:
     return _SEVERITY_LEVELS.get(label)
 
 
+def _notify_player_changed(player: Any) -> None:
+    from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_player_dirty
+    from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import notify_player_changed
+
+    notify_player_changed(player)
+    mark_player_dirty(player)
+
+
+def set_injury_fields(
+    player: Any,
+    status: str,
+    injury_name: str | None,
+    start_date: datetime.date | None,
+    end_date: datetime.date | None,
+    severity: int | None = None,
+) -> None:
+    """Set every injury field and notify the expiry and rating indexes."""
+    player.injury_status = normalize_injury_status(status)
+    player.injury_name = injury_name
+    player.injury_start_date = start_date
+    player.injury_end_date = end_date
+    player.injury_severity = severity
+    notify_injury_changed(player)
+    _notify_player_changed(player)
+
+
 def clear_injury_fields(player: Any) -> None:
-    player.injury_status = "healthy"
-    player.injury_name = None
-    player.injury_start_date = None
-    player.injury_end_date = None
-    player.injury_severity = None
+    set_injury_fields(player, "healthy", None, None, None)
 
 
 def heal_if_due(player: Any, current_date: Any) -> bool:
@@ -82,16 +107,32 @@ def heal_player_if_due(player: Any, current_date: Any) -> bool:
 
 
 def iter_league_players(league: Any) -> Iterator[Any]:
+    """Every Player in the league.
+
+    Compact prospect records in the draft and college pools are skipped until
+    promoted; one that ended up among the free agents is promoted in place.
+    """
+    from gridiron_gm_pkg.simulation.entities.prospect import Prospect
+
     for team in getattr(league, "teams", []) or []:
         for group in ("roster", "ir_list", "practice_squad"):
             for player in getattr(team, group, []) or []:
                 yield player
-    for group in ("free_agents", "draft_prospects", "college_db"):
+    free_agents = getattr(league, "free_agents", None) or []
+    for idx, player in enumerate(free_agents):
+        if isinstance(player, Prospect):
+            player = free_agents[idx] = player.promote()
+        yield player
+    for group in ("draft_prospects", "college_db"):
         for player in getattr(league, group, []) or []:
-            yield player
+            if not isinstance(player, Prospect):
+                yield player
 
 
 def heal_league_players(league: Any, current_date: datetime.date) -> int:
+    index = getattr(league, "injury_index", None)
+    if isinstance(index, InjuryExpiryIndex):
+        return index.heal_due(league, current_date)
     healed = 0
     for player in iter_league_players(league):
         if heal_if_due(player, current_date):
@@ -111,11 +152,14 @@ def apply_simple_injury(
     duration = max(1, int(duration_days))
     if status is None:
         status = "questionable" if duration <= 7 else "out"
-    player.injury_status = normalize_injury_status(status)
-    player.injury_name = injury_name
-    player.injury_start_date = start
-    player.injury_end_date = start + datetime.timedelta(days=duration)
-    player.injury_severity = _severity_to_level(severity)
+    set_injury_fields(
+        player,
+        status,
+        injury_name,
+        start,
+        start + datetime.timedelta(days=duration),
+        _severity_to_level(severity),
+    )
 
 
 def convert_legacy_injury_fields(player: Any, current_date: Any) -> bool:
@@ -136,6 +180,8 @@ def convert_legacy_injury_fields(player: Any, current_date: Any) -> bool:
         player.injury_severity = _severity_to_level(getattr(player, "injury_severity", None))
         player.weeks_out = 0
         player.is_injured = False
+        notify_injury_changed(player)
+        _notify_player_changed(player)
         return True
 
     # Ensure legacy flags are neutralized going forward
@@ -154,28 +200,13 @@ def assign_catalog_injury(
     if status != "healthy" or getattr(player, "on_injured_reserve", False):
         return None
 
-    from gridiron_gm_pkg.config.injury_catalog import INJURY_CATALOG
-
     rng = rng or random
-    allowed_contexts = {"either"}
-    if str(context).lower() == "game":
-        allowed_contexts.add("on_field")
-    else:
-        allowed_contexts.add("off_field")
-
-    candidates = [
-        (name, data)
-        for name, data in (INJURY_CATALOG or {}).items()
-        if data.get("injury_context", "on_field") in allowed_contexts
-    ]
-    if not candidates:
-        candidates = list((INJURY_CATALOG or {}).items())
-
-    if not candidates:
+    picked = injury_sampler(context).sample(rng, getattr(player, "position", None))
+    if picked is None:
         injury_name = "Injury"
         injury_data = {"severity": "minor", "weeks": (1, 1)}
     else:
-        injury_name, injury_data = rng.choice(candidates)
+        injury_name, injury_data = picked
 
     weeks_range = injury_data.get("weeks", (1, 1))
     try:
@@ -214,8 +245,14 @@ def assign_game_injuries(home_team: Any, away_team: Any, current_date: Any, rng:
     else:
         return []
 
+    from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import index_for
+
     candidates = []
     for team in (home_team, away_team):
+        index = index_for(team)
+        if index is not None:
+            candidates.extend(index.healthy_players(team))
+            continue
         roster = getattr(team, "roster", None) or getattr(team, "players", [])
         for player in roster:
             status = normalize_injury_status(getattr(player, "injury_status", "healthy"))
@@ -36,14 +36,15 @@ class MutationType(Enum):
     FastLearner = auto()
 
 
-def assign_mutations() -> List[MutationType]:
+def assign_mutations(rng: random.Random | None = None) -> List[MutationType]:
     """Randomly assign up to two rare mutations with weighted odds."""
-    roll = random.random()
+    rng = rng or random
+    roll = rng.random()
     if roll < 0.975:
         return []
     if roll < 0.995:
-        return [random.choice(list(MutationType))]
-    return random.sample(list(MutationType), 2)
+        return [rng.choice(list(MutationType))]
+    return rng.sample(list(MutationType), 2)
 
 
 def generate_dev_speed() -> float:
@@ -198,7 +199,7 @@ def _sample_gap(attr_type: str, is_college: bool, rng: random.Random) -> int:
 # === Mutation utility functions ===
 # === ATTRIBUTE CAPS STRUCTURE ===
 def generate_attribute_caps(
-    dev_focus: Dict[str, float],
+    dev_focus: Optional[Dict[str, float]],
     attributes: Optional[List[str]] = None,
     is_college: bool = False,
     rng: random.Random | None = None,
@@ -232,9 +233,21 @@ def generate_attribute_caps(
     return caps
 
 
+# Derived fields built on first access from the DNA's seed, in dependency order.
+LAZY_FIELDS = ("career_arc", "dev_focus", "mutations", "attribute_caps", "scouted_caps")
+
+
 @dataclass
 class PlayerDNA:
-    """Container for a player's long-term development profile."""
+    """Container for a player's long-term development profile.
+
+    The fields in ``LAZY_FIELDS`` are not generated up front. Each one is built
+    on first access from its own stream derived from ``seed``, so the result does
+    not depend on which field is touched first and is identical to calling
+    ``materialize()`` eagerly. to_dict() only includes the ones that exist.
+    """
+
+    seed: Optional[int] = field(init=False, default=None)
 
     rise_duration: int = field(init=False)
     prime_duration: int = field(init=False)
@@ -259,33 +272,64 @@ class PlayerDNA:
         self.fall_duration = max(2, 20 - (self.rise_duration + self.prime_duration))
         self.peak_value = round(random.uniform(0.85, 1.0), 2)
         self.stability = round(random.uniform(0.01, 0.05), 3)
-        self.career_arc = self.generate_procedural_arc()
 
         self.regression_profile = DEFAULT_REGRESSION_PROFILE.copy()
         self.attribute_decay_type = ATTRIBUTE_DECAY_TYPE
         self.dev_speed = generate_dev_speed()
-        self.dev_focus = self._generate_dev_focus_weights()
         self.traits = self._assign_traits()
-        self.mutations = assign_mutations()
-        self.attribute_caps = generate_attribute_caps(self.dev_focus)
-        self.scouted_caps = self._generate_scouted_caps()
         self.growth_curve = "normal"
-
-    def generate_procedural_arc(self, total_years: int = 25) -> List[float]:
+        self.seed = random.getrandbits(32)
+
+    # --- Lazy derived fields ---------------------------------------------------
+    def __getattr__(self, name: str):
+        # Only reached when normal lookup fails, i.e. for lazy fields not built yet.
+        if name not in LAZY_FIELDS or self.__dict__.get("seed") is None:
+            raise AttributeError(f"{type(self).__name__!s} object has no attribute {name!r}")
+        value = self._generate_lazy_field(name)
+        self.__dict__[name] = value
+        return value
+
+    def _field_rng(self, name: str) -> random.Random:
+        return random.Random(f"{self.seed}:{name}")
+
+    def _generate_lazy_field(self, name: str):
+        rng = self._field_rng(name)
+        if name == "career_arc":
+            return self.generate_procedural_arc(rng=np.random.RandomState(rng.getrandbits(32)))
+        if name == "dev_focus":
+            return self._generate_dev_focus_weights(rng=rng)
+        if name == "mutations":
+            return assign_mutations(rng=rng)
+        if name == "attribute_caps":
+            return generate_attribute_caps(None, rng=rng)
+        return self._generate_scouted_caps(rng=rng)
+
+    def is_materialized(self, name: str) -> bool:
+        return name in self.__dict__
+
+    def materialize(self) -> "PlayerDNA":
+        """Build every lazy field now (same values as building them on first access)."""
+        for name in LAZY_FIELDS:
+            getattr(self, name)
+        return self
+
+    def generate_procedural_arc(self, total_years: int = 25, rng: np.random.RandomState | None = None) -> List[float]:
         """Return an annual multiplier curve representing the player's career trajectory."""
+        rng = rng or np.random
         rise = np.power(np.linspace(0, 1, self.rise_duration), 1.5) * self.peak_value
-        prime_noise = np.random.normal(0, self.stability, self.prime_duration)
+        prime_noise = rng.normal(0, self.stability, self.prime_duration)
         prime = np.clip(np.full(self.prime_duration, self.peak_value) + prime_noise, 0, 1.05)
         fall_x = np.linspace(1, 0, self.fall_duration)
         fall = np.power(fall_x, 0.7) * self.peak_value
-        fall_noise = np.random.normal(0, self.stability, self.fall_duration)
+        fall_noise = rng.normal(0, self.stability, self.fall_duration)
         fall = np.clip(fall + fall_noise, 0, 1.05)
         arc = np.concatenate((rise, prime, fall))
         return arc[:total_years].tolist()
 
     # --- Helper generators -------------------------------------------------
-    def _generate_dev_focus_weights(self) -> Dict[str, float]:
-        weights = [random.uniform(0.25, 0.45) for _ in range(3)]
+    def _generate_dev_focus_weights(self, rng: random.Random | None = None) -> Dict[str, float]:
+        rng = rng or random
+        weights = [rng.uniform(0.25, 0.45) for _ in range(3)]
         total = sum(weights)
         return {
             "physical": weights[0] / total,
@@ -377,27 +421,35 @@ class PlayerDNA:
 
     # --- Serialization ------------------------------------------------------
     def to_dict(self) -> Dict:
-        return {
+        data = {
+            "seed": self.seed,
             "rise_duration": self.rise_duration,
             "prime_duration": self.prime_duration,
             "fall_duration": self.fall_duration,
             "peak_value": self.peak_value,
             "stability": self.stability,
-            "career_arc": self.career_arc,
+            "career_arc": self.__dict__.get("career_arc"),
             "regression_profile": self.regression_profile,
             "attribute_decay_type": self.attribute_decay_type,
             "dev_speed": self.dev_speed,
-            "dev_focus": self.dev_focus,
+            "dev_focus": self.__dict__.get("dev_focus"),
             "traits": self.traits,
-            "mutations": [m.name for m in self.mutations],
-            "attribute_caps": self.attribute_caps,
-            "scouted_caps": self.scouted_caps,
+            "mutations": [m.name for m in self.mutations] if "mutations" in self.__dict__ else None,
+            "attribute_caps": self.__dict__.get("attribute_caps"),
+            "scouted_caps": self.__dict__.get("scouted_caps"),
             "growth_curve": self.growth_curve,
         }
+        if self.seed is not None:
+            # Lazy fields that were never built are regenerated from the seed on load.
+            for name in LAZY_FIELDS:
+                if name not in self.__dict__:
+                    del data[name]
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict) -> "PlayerDNA":
         obj = cls.__new__(cls)
+        obj.seed = data.get("seed")
         for field_name in [
             "rise_duration",
             "prime_duration",
@@ -414,8 +466,11 @@ class PlayerDNA:
             "scouted_caps",
             "growth_curve",
         ]:
+            if obj.seed is not None and field_name in LAZY_FIELDS and field_name not in data:
+                continue
             setattr(obj, field_name, data.get(field_name))
-        obj.mutations = [MutationType[m] for m in data.get("mutations", [])]
+        if obj.seed is None or "mutations" in data:
+            obj.mutations = [MutationType[m] for m in data.get("mutations") or []]
         if not getattr(obj, "growth_curve", None):
             obj.growth_curve = "normal"
         return obj
@@ -431,7 +486,7 @@ class PlayerDNA:
         dna = PlayerDNA()
         relevant = _get_relevant_attribute_names(position)
         dna.attribute_caps = generate_attribute_caps(
-            dna.dev_focus, relevant, is_college=is_college, rng=rng
+            None, relevant, is_college=is_college, rng=rng
         )
         dna.scouted_caps = dna._generate_scouted_caps(rng=rng)
         return dna
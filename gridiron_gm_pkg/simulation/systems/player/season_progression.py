@@ -7,16 +7,26 @@ responsibilities remain with the season and franchise systems.
 
 from __future__ import annotations
 
-import random
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
+from gridiron_gm_pkg.simulation.entities.prospect import promote_prospect_records
 from gridiron_gm_pkg.simulation.systems.player.attribute_xp import (
+    MAX_RATING,
+    TOTAL_XP,
+    XP_TABLE,
+    _XP_TABLE_ARRAY,
     _attribute_decay_type,
+    _counter_uniform,
     _get_attr_value,
-    add_xp,
+    _resolve_cap_value,
+    _seed_suffix,
+    _set_attr_value,
+    ratings_from_xp,
     sync_xp_from_rating,
-    xp_at_value,
 )
+from gridiron_gm_pkg.simulation.systems.player.attribute_store import gather_ratings, normalize_players
 from gridiron_gm_pkg.simulation.systems.player.injury_status import iter_league_players
 
 
@@ -33,47 +43,84 @@ def _attribute_names(player: Any) -> list[str]:
     return list(getter()) if callable(getter) else []
 
 
-def _growth_chance(player: Any, attr: str) -> float:
+def _base_growth_chance(player: Any) -> float:
     age = int(getattr(player, "age", 0) or 0)
-    speed = float(getattr(getattr(player, "dna", None), "dev_speed", 0.65) or 0.65)
     if age <= 23:
-        chance = 0.55
-    elif age <= 25:
-        chance = 0.35
-    elif age <= 27:
-        chance = 0.14
-    else:
-        return 0.0
-    if _attribute_decay_type(player, attr) == "mental":
-        chance += 0.05
-    return max(0.0, min(0.85, chance * speed / 0.65))
-
-
-def _retirement_reason(player: Any, rng: random.Random) -> str | None:
-    age = int(getattr(player, "age", 0) or 0)
-    overall = int(getattr(player, "overall", 0) or 0)
-    if age >= 41:
-        return "age_limit"
-    if age < 35:
-        return None
-    chance = 0.0
-    if age >= 39:
-        chance = 0.65
-    elif age == 38:
-        chance = 0.30
-    elif age == 37:
-        chance = 0.12
-    elif age == 36:
-        chance = 0.04
-    if overall < 60:
-        chance += 0.15
-    elif overall >= 80:
-        chance -= 0.10
-    return "age_decline" if rng.random() < max(0.0, min(0.95, chance)) else None
+        return 0.55
+    if age <= 25:
+        return 0.35
+    if age <= 27:
+        return 0.14
+    return 0.0
+
+
+def _retirement_chances(ages: np.ndarray, overalls: np.ndarray) -> np.ndarray:
+    chance = np.select(
+        [ages >= 39, ages == 38, ages == 37, ages == 36],
+        [0.65, 0.30, 0.12, 0.04],
+        default=0.0,
+    )
+    chance = chance + np.where(overalls < 60, 0.15, np.where(overalls >= 80, -0.10, 0.0))
+    return np.clip(chance, 0.0, 0.95)
+
+
+def _gather_growth_rows(
+    players: List[Tuple[Any, str]], base_seed: int, token: str, league: Any = None
+) -> Tuple[List[Tuple[int, str]], Dict[str, np.ndarray], List[Dict[str, int]]]:
+    """Ratings for every player attribute, plus growth chance and seed key for those that can grow.
+
+    Ratings are read from ``league``'s AttributeStore columns when it has one.
+    """
+    names = [_attribute_names(player) for player, _ in players]
+    pairs = [(slot, attr) for slot, attrs in enumerate(names) for attr in attrs]
+    values = iter(gather_ratings(league, [player for player, _ in players], pairs, _get_attr_value).tolist())
+    rows: List[Tuple[int, str]] = []
+    rating_col: List[int] = []
+    chance_col: List[float] = []
+    prefix_col: List[int] = []
+    mult_col: List[int] = []
+    hash_col: List[int] = []
+    before: List[Dict[str, int]] = []
+    for slot, (player, player_id) in enumerate(players):
+        ratings = {attr: next(values) for attr in names[slot]}
+        before.append(ratings)
+        base = _base_growth_chance(player)
+        if not base:
+            continue  # a zero chance never grows, whatever the roll
+        speed = float(getattr(getattr(player, "dna", None), "dev_speed", 0.65) or 0.65)
+        prefix = _seed_for(base_seed, "season_progression", token, player_id)
+        for attr, rating in ratings.items():
+            chance = base + 0.05 if _attribute_decay_type(player, attr) == "mental" else base
+            mult, label_hash = _seed_suffix(attr)
+            rows.append((slot, attr))
+            rating_col.append(rating)
+            chance_col.append(max(0.0, min(0.85, chance * speed / 0.65)))
+            prefix_col.append(prefix)
+            mult_col.append(mult)
+            hash_col.append(label_hash)
+    arrays = {
+        "rating": np.asarray(rating_col, dtype=np.int64),
+        "chance": np.asarray(chance_col, dtype=np.float64),
+        "prefix": np.asarray(prefix_col, dtype=np.uint64),
+        "mult": np.asarray(mult_col, dtype=np.uint64),
+        "hash": np.asarray(hash_col, dtype=np.uint64),
+    }
+    return rows, arrays, before
+
+
+def _growth_rolls(arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    keys = (arrays["prefix"] * arrays["mult"] + arrays["hash"]) & np.uint64(0xFFFFFFFF)
+    return _counter_uniform(keys, 0.0, 1.0) < arrays["chance"]
 
 
 def apply_season_progression(league: Any, year: int | None = None) -> Dict[str, Any]:
-    """Apply exactly one development update for ``year`` and return its summary."""
+    """Apply exactly one development update for ``year`` and return its summary.
+
+    Growth and retirement rolls for the whole league are evaluated as arrays.
+    Each roll comes from a counter-based RNG keyed by ``_seed_for(base_seed,
+    "season_progression"|"retirement", year, player_id[, attr])``, so a player's
+    outcome depends only on its key.
+    """
     if league is None:
         return {"applied": False, "reason": "missing_league", "players": []}
     if year is None:
@@ -86,46 +133,92 @@ def apply_season_progression(league: Any, year: int | None = None) -> Dict[str,
         return {"applied": False, "reason": "already_applied", "year": int(year), "players": []}
 
     base_seed = int(getattr(league, "base_seed", 0) or 0)
+    promote_prospect_records(league)
     seen_ids: set[str] = set()
-    summaries: list[Dict[str, Any]] = []
+    players: List[Tuple[Any, str]] = []
     for player in iter_league_players(league):
         player_id = str(getattr(player, "id", id(player)))
         if player_id in seen_ids or getattr(player, "retired", False):
             continue
         seen_ids.add(player_id)
-
-        age_before = int(getattr(player, "age", 0) or 0)
-        player.age = age_before + 1
+        player.age = int(getattr(player, "age", 0) or 0) + 1
         sync_xp_from_rating(player)
-        changes: Dict[str, int] = {}
-        for attr in _attribute_names(player):
-            rating_before = _get_attr_value(player, attr)
-            rng = random.Random(_seed_for(base_seed, "season_progression", token, player_id, attr))
-            if rng.random() < _growth_chance(player, attr):
-                add_xp(player, attr, xp_at_value(min(99, rating_before + 1)) - xp_at_value(rating_before))
-            rating_after = _get_attr_value(player, attr)
-            if rating_after != rating_before:
-                changes[attr] = rating_after - rating_before
-
-        current = {attr: _get_attr_value(player, attr) for attr in _attribute_names(player)}
+        players.append((player, player_id))
+
+    # Growth: one roll per attribute of every player young enough to develop.
+    rows, arrays, before = _gather_growth_rows(players, base_seed, token, league)
+    changes: List[Dict[str, int]] = [{} for _ in players]
+    if rows:
+        grows = np.flatnonzero(_growth_rolls(arrays))
+        rating = arrays["rating"][grows]
+        current = np.empty(len(grows), dtype=np.int64)
+        cap_xp = np.full(len(grows), TOTAL_XP, dtype=np.int64)
+        for out, idx in enumerate(grows):
+            slot, attr = rows[idx]
+            player = players[slot][0]
+            current[out] = int(player.attribute_xp.get(attr, XP_TABLE[rating[out]]))
+            cap_value = _resolve_cap_value(player, attr, None)
+            if cap_value is not None:
+                cap_xp[out] = XP_TABLE[cap_value]
+
+        # add_xp(player, attr, one rating step), reconciled and capped the same way.
+        step = _XP_TABLE_ARRAY[np.minimum(MAX_RATING, rating + 1)] - _XP_TABLE_ARRAY[rating]
+        current = np.where(ratings_from_xp(current) == rating, current, _XP_TABLE_ARRAY[rating])
+        new_xp = np.minimum(np.clip(current + step, 0, TOTAL_XP), cap_xp)
+        new_rating = ratings_from_xp(new_xp)
+
+        touched: Dict[int, Any] = {}
+        for out, idx in enumerate(grows):
+            slot, attr = rows[idx]
+            player = players[slot][0]
+            player.attribute_xp[attr] = int(new_xp[out])
+            _set_attr_value(player, attr, int(new_rating[out]))
+            touched[slot] = player
+            if new_rating[out] != rating[out]:
+                changes[slot][attr] = int(new_rating[out] - rating[out])
+        normalize_players(league, touched.values())
+
+    # Retirement: one roll per player, after this season's growth.
+    ages = np.fromiter((player.age for player, _ in players), dtype=np.int64, count=len(players))
+    overalls = np.fromiter(
+        (int(getattr(player, "overall", 0) or 0) for player, _ in players), dtype=np.int64, count=len(players)
+    )
+    retire_keys = np.fromiter(
+        (_seed_for(base_seed, "retirement", token, player_id) for _, player_id in players),
+        dtype=np.uint64,
+        count=len(players),
+    )
+    declines = _counter_uniform(retire_keys, 0.0, 1.0) < _retirement_chances(ages, overalls)
+
+    summaries: list[Dict[str, Any]] = []
+    for slot, (player, player_id) in enumerate(players):
+        player_changes = changes[slot]
+        current = before[slot]
+        for attr, delta in player_changes.items():
+            current[attr] += delta
         player.last_attribute_values = current
+        no_growth = getattr(player, "no_growth_years", {})
         player.no_growth_years = {
-            attr: (0 if changes.get(attr, 0) > 0 else int(getattr(player, "no_growth_years", {}).get(attr, 0)) + 1)
+            attr: (0 if player_changes.get(attr, 0) > 0 else int(no_growth.get(attr, 0)) + 1)
             for attr in current
         }
         history = getattr(player, "progress_history", None)
         if not isinstance(history, dict):
             history = {}
             player.progress_history = history
-        history[token] = {"age": player.age, "changes": changes, "overall": int(getattr(player, "overall", 0) or 0)}
-
-        retirement_rng = random.Random(_seed_for(base_seed, "retirement", token, player_id))
-        reason = _retirement_reason(player, retirement_rng)
+        history[token] = {"age": player.age, "changes": player_changes, "overall": int(overalls[slot])}
+
+        age = int(ages[slot])
+        reason = None
+        if age >= 41:
+            reason = "age_limit"
+        elif age >= 35 and declines[slot]:
+            reason = "age_decline"
         if reason:
             player.retired = True
             player.retirement_reason = reason
             player.retirement_year = int(year)
-        summaries.append({"player_id": player_id, "changes": changes, "retired": bool(reason)})
+        summaries.append({"player_id": player_id, "changes": player_changes, "retired": bool(reason)})
 
     league.last_season_progression = token
     return {"applied": True, "year": int(year), "players": summaries}
@@ -1,29 +1,104 @@
 from typing import Dict, List, Tuple, Any
 
+from gridiron_gm_pkg.simulation.systems.player.fatigue import FatigueSystem
+
 class SubstitutionManagerV2:
     """
     Handles active lineup selection and substitution based on fatigue and depth chart.
+
+    The lineup is built once and then kept up to date incrementally: the manager
+    watches FatigueSystem for players crossing ``fatigue_threshold`` and only
+    re-evaluates the slots those players start or back up. Fatigue set directly
+    on a player (outside FatigueSystem) or a depth chart edited in place needs
+    an explicit invalidate().
     """
+    fatigue_threshold = 0.9
+    # Standard 11-man defense: 2 DE, 2 DT, 3 LB, 2 CB, 2 S
+    DEFENSE_SCHEME = {"DE": 2, "DT": 2, "LB": 3, "CB": 2, "S": 2}
+
     def __init__(self, depth_chart: Dict[str, List[Any]]):
         self.depth_chart = depth_chart
+        self.invalidate()
+        FatigueSystem.watch(self)
+
+    def invalidate(self) -> None:
+        """Drop the cached lineup so the next call rebuilds it from the depth chart."""
+        self._built_from = None
+        self._scheme: Dict[str, int] = {}
+        # Each offensive slot is [position, starter, backup, chosen, lineup index]
+        self._slots: List[List[Any]] = []
+        self._slots_by_player: Dict[int, List[int]] = {}
+        self._dirty: set = set()
+        self._offense_lineup: List[Any] = []
+        self._defense_lineup: List[Any] = []
+
+    def on_fatigue_crossed(self, player: Any, old: float, new: float) -> None:
+        slots = self._slots_by_player.get(id(player))
+        if slots:
+            self._dirty.update(slots)
+
+    def _choose(self, starter: Any, backup: Any) -> Any:
+        threshold = self.fatigue_threshold
+        if backup is not None and hasattr(starter, "fatigue") and starter.fatigue >= threshold:
+            if hasattr(backup, "fatigue") and backup.fatigue < threshold:
+                return backup
+        return starter
+
+    def _record_swap(self, slot: List[Any], previous: Any, fatigue_log: List[str], bench_log: List[str]) -> None:
+        position, chosen = slot[0], slot[3]
+        bench_log.append(f"{position}: {previous.name} → {chosen.name}")
+        fatigue_log.append(f"[SUB] {position}: {previous.name} → {chosen.name} (fatigue {getattr(previous, 'fatigue', 0):.2f} → {getattr(chosen, 'fatigue', 0):.2f})")
+
+    def _build(self, offense: Any, scheme: Dict[str, int], fatigue_log: List[str], bench_log: List[str], record_log: bool) -> None:
+        self.invalidate()
+        self._built_from = self.depth_chart
+        self._scheme = dict(scheme)
+
+        for position, count in scheme.items():
+            depth_list = self.depth_chart.get(position, [])
+            for i in range(count):
+                if i < len(depth_list):
+                    starter = depth_list[i]
+                    backup = depth_list[i + 1] if len(depth_list) > i + 1 else None
+                    slot = [position, starter, backup, self._choose(starter, backup), len(self._offense_lineup)]
+                    index = len(self._slots)
+                    self._slots.append(slot)
+                    self._slots_by_player.setdefault(id(starter), []).append(index)
+                    if backup is not None:
+                        self._slots_by_player.setdefault(id(backup), []).append(index)
+                    self._offense_lineup.append(slot[3])
+                    if record_log and slot[3] is not starter:
+                        self._record_swap(slot, starter, fatigue_log, bench_log)
+                else:
+                    # Not enough players for this position
+                    team_name = getattr(offense, "name", "Unknown")
+                    print(f"[ERROR] SubstitutionManagerV2: Not enough players for {position} on team {team_name} (needed {count}, got {len(depth_list)})")
+
+        for position, count in self.DEFENSE_SCHEME.items():
+            depth_list = self.depth_chart.get(position, [])
+            for i in range(count):
+                if i < len(depth_list):
+                    self._defense_lineup.append(depth_list[i])
+                else:
+                    team_name = getattr(offense, "name", "Unknown")
+                    print(f"[ERROR] SubstitutionManagerV2: Not enough defensive players for {position} on team {team_name} (needed {count}, got {len(depth_list)})")
 
     def get_active_lineup_with_bench_log(
         self,
         formation: Dict[str, int],
         offense: Any,
         fatigue_log: List[str],
-        scheme: Dict[str, int]
+        scheme: Dict[str, int],
+        record_log: bool = True,
     ) -> Tuple[Dict[str, Any], List[str]]:
         """
-        Build an active lineup for the given formation and offense, considering fatigue.
-        Records any substitutions in fatigue_log and returns a bench_log.
+        Return the active lineup for the given formation and offense, considering fatigue.
+        Substitutions are recorded in fatigue_log and the returned bench_log only on the
+        snap where a swap actually happens (both left untouched when record_log is False).
         Returns:
             Tuple of (lineup dict, bench_log list)
         """
         bench_log: List[str] = []
-        offense_lineup: List[Any] = []
-        defense_lineup: List[Any] = []
-        lineup: Dict[str, Any] = {}
 
         # Defensive: Check for valid depth chart
         if not hasattr(self, "depth_chart") or not isinstance(self.depth_chart, dict):
@@ -31,43 +106,18 @@ class SubstitutionManagerV2:
             print(f"[ERROR] SubstitutionManagerV2: Missing or malformed depth_chart for team {team_name}")
             return {"offense": [], "defense": []}, bench_log
 
-        # Build offense lineup
-        for position, count in scheme.items():
-            depth_list = self.depth_chart.get(position, [])
-            chosen = []
-            for i in range(count):
-                if i < len(depth_list):
-                    player = depth_list[i]
-                    fatigue_threshold = 0.9
-                    if hasattr(player, "fatigue") and player.fatigue >= fatigue_threshold and len(depth_list) > i + 1:
-                        backup = depth_list[i + 1]
-                        if hasattr(backup, "fatigue") and backup.fatigue < fatigue_threshold:
-                            chosen.append(backup)
-                            bench_log.append(f"{position}: {player.name} → {backup.name}")
-                            fatigue_log.append(f"[SUB] {position}: {player.name} → {backup.name} (fatigue {getattr(player, 'fatigue', 0):.2f} → {getattr(backup, 'fatigue', 0):.2f})")
-                        else:
-                            chosen.append(player)
-                    else:
-                        chosen.append(player)
-                else:
-                    # Not enough players for this position
-                    team_name = getattr(offense, "name", "Unknown")
-                    print(f"[ERROR] SubstitutionManagerV2: Not enough players for {position} on team {team_name} (needed {count}, got {len(depth_list)})")
-            offense_lineup.extend(chosen)
-
-        # Build standard 11-man defense: 2 DE, 2 DT, 3 LB, 2 CB, 2 S
-        defense_scheme = {"DE": 2, "DT": 2, "LB": 3, "CB": 2, "S": 2}
-        for position, count in defense_scheme.items():
-            depth_list = self.depth_chart.get(position, [])
-            chosen = []
-            for i in range(count):
-                if i < len(depth_list):
-                    player = depth_list[i]
-                    chosen.append(player)
-                else:
-                    team_name = getattr(offense, "name", "Unknown")
-                    print(f"[ERROR] SubstitutionManagerV2: Not enough defensive players for {position} on team {team_name} (needed {count}, got {len(depth_list)})")
-            defense_lineup.extend(chosen)
+        if self._built_from is not self.depth_chart or self._scheme != scheme:
+            self._build(offense, scheme, fatigue_log, bench_log, record_log)
+        elif self._dirty:
+            for index in sorted(self._dirty):
+                slot = self._slots[index]
+                previous = slot[3]
+                slot[3] = self._choose(slot[1], slot[2])
+                if slot[3] is not previous:
+                    self._offense_lineup[slot[4]] = slot[3]
+                    if record_log:
+                        self._record_swap(slot, previous, fatigue_log, bench_log)
+            self._dirty.clear()
 
         # Always return dict with offense and defense keys, each mapping to a list (even if empty)
-        return {"offense": offense_lineup, "defense": defense_lineup}, bench_log
+        return {"offense": list(self._offense_lineup), "defense": list(self._defense_lineup)}, bench_log
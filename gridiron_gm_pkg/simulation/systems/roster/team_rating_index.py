@@ -0,0 +1,301 @@
+"""League-level per-team aggregates for game-day consumers.
+
+``TeamRatingIndex`` keeps, for every team it has been asked about, the roster
+overall sum and count, the roster split by position, the healthy players and
+the depth-chart starters. Game simulation reads these in O(1) instead of
+rescanning rosters for every game.
+
+The aggregates are updated incrementally through the ``notify_*`` hooks, which
+Team, the injury helpers and Player.normalize_ratings call. As a safety net, a
+team whose roster list was swapped out or changed length behind the index's
+back is rebuilt on the next read. All lists preserve roster order, so RNG
+consumers (box score leaders, game injuries) draw exactly as a roster scan would.
+"""
+
+from __future__ import annotations
+
+import bisect
+import weakref
+from typing import Any, Dict, Iterable, List, Optional
+
+from gridiron_gm_pkg.simulation.systems.player.injury_status import normalize_injury_status
+
+_INDEXES: "weakref.WeakSet[TeamRatingIndex]" = weakref.WeakSet()
+_TEAM_INDEX: "weakref.WeakKeyDictionary[Any, TeamRatingIndex]" = weakref.WeakKeyDictionary()
+
+
+def _team_roster(team: Any) -> List[Any]:
+    if not team:
+        return []
+    return getattr(team, "roster", None) or getattr(team, "players", [])
+
+
+def _overall(player: Any) -> float:
+    return float(getattr(player, "overall", 70) or 70)
+
+
+def _position(player: Any) -> Any:
+    if isinstance(player, dict):
+        return player.get("position")
+    return getattr(player, "position", None)
+
+
+def _is_healthy(player: Any) -> bool:
+    return normalize_injury_status(getattr(player, "injury_status", "healthy")) == "healthy"
+
+
+class _TeamRatings:
+    __slots__ = (
+        "team",
+        "roster",
+        "count",
+        "overall_sum",
+        "next_seq",
+        "seq",
+        "overall",
+        "position",
+        "by_position",
+        "by_position_seq",
+        "healthy",
+        "healthy_seq",
+        "starters",
+    )
+
+    def __init__(self, team: Any, roster: List[Any]):
+        self.team = team
+        self.roster = roster
+        self.count = 0
+        self.overall_sum = 0.0
+        self.next_seq = 0
+        self.seq: Dict[int, int] = {}
+        self.overall: Dict[int, float] = {}
+        self.position: Dict[int, Any] = {}
+        self.by_position: Dict[Any, List[Any]] = {}
+        # Roster order of each by_position list, kept in step for bisect.
+        self.by_position_seq: Dict[Any, List[int]] = {}
+        self.healthy: List[Any] = []
+        self.healthy_seq: List[int] = []
+        self.starters: Dict[str, Any] = {}
+
+    def _insert_position(self, position: Any, player: Any, seq: int) -> None:
+        seqs = self.by_position_seq.setdefault(position, [])
+        index = bisect.bisect(seqs, seq)
+        seqs.insert(index, seq)
+        self.by_position.setdefault(position, []).insert(index, player)
+
+    def _drop_position(self, position: Any, seq: int) -> None:
+        seqs = self.by_position_seq.get(position, [])
+        index = bisect.bisect_left(seqs, seq)
+        if index < len(seqs) and seqs[index] == seq:
+            del seqs[index]
+            del self.by_position[position][index]
+
+    def add(self, player: Any) -> None:
+        key = id(player)
+        seq = self.next_seq
+        self.next_seq += 1
+        self.seq[key] = seq
+        self.count += 1
+        self.overall[key] = _overall(player)
+        self.overall_sum += self.overall[key]
+        self.position[key] = _position(player)
+        self.by_position.setdefault(self.position[key], []).append(player)
+        self.by_position_seq.setdefault(self.position[key], []).append(seq)
+        if _is_healthy(player):
+            self.healthy.append(player)
+            self.healthy_seq.append(seq)
+
+    def remove(self, player: Any) -> None:
+        key = id(player)
+        seq = self.seq.pop(key)
+        self.count -= 1
+        self.overall_sum -= self.overall.pop(key)
+        self._drop_position(self.position.pop(key), seq)
+        self._drop_healthy(seq)
+
+    def _drop_healthy(self, seq: int) -> None:
+        index = bisect.bisect_left(self.healthy_seq, seq)
+        if index < len(self.healthy_seq) and self.healthy_seq[index] == seq:
+            del self.healthy_seq[index]
+            del self.healthy[index]
+
+    def update(self, player: Any) -> None:
+        key = id(player)
+        seq = self.seq[key]
+        overall = _overall(player)
+        self.overall_sum += overall - self.overall[key]
+        self.overall[key] = overall
+
+        position = _position(player)
+        if position != self.position[key]:
+            self._drop_position(self.position[key], seq)
+            self.position[key] = position
+            self._insert_position(position, player, seq)
+
+        self._drop_healthy(seq)
+        if _is_healthy(player):
+            index = bisect.bisect(self.healthy_seq, seq)
+            self.healthy_seq.insert(index, seq)
+            self.healthy.insert(index, player)
+
+    def refresh_starters(self) -> None:
+        depth_chart = getattr(self.team, "depth_chart", None)
+        if not isinstance(depth_chart, dict):
+            self.starters = {}
+            return
+        self.starters = {pos: players[0] for pos, players in depth_chart.items() if players}
+
+
+class TeamRatingIndex:
+    """Per-team overall, position and health aggregates, built lazily per team."""
+
+    def __init__(self) -> None:
+        self._entries: Dict[int, _TeamRatings] = {}
+        self._player_entries: Dict[int, _TeamRatings] = {}
+        _INDEXES.add(self)
+
+    # The index is a cache: copies and pickles start empty and rebuild on demand.
+    def __getstate__(self) -> Dict[str, Any]:
+        return {}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()
+
+    def _build(self, team: Any, roster: List[Any]) -> _TeamRatings:
+        self._forget(team)
+        entry = _TeamRatings(team, roster)
+        for player in roster:
+            entry.add(player)
+            self._player_entries[id(player)] = entry
+        entry.refresh_starters()
+        self._entries[id(team)] = entry
+        try:
+            _TEAM_INDEX[team] = self
+        except TypeError:
+            pass
+        return entry
+
+    def _forget(self, team: Any) -> None:
+        entry = self._entries.pop(id(team), None)
+        if entry is None:
+            return
+        for key in entry.seq:
+            if self._player_entries.get(key) is entry:
+                del self._player_entries[key]
+
+    def _current(self, team: Any) -> Optional[_TeamRatings]:
+        entry = self._entries.get(id(team))
+        if entry is None or entry.team is not team:
+            return None
+        roster = _team_roster(team)
+        if entry.roster is not roster or entry.count != len(roster):
+            return None
+        return entry
+
+    def _entry(self, team: Any) -> _TeamRatings:
+        entry = self._current(team)
+        if entry is None:
+            entry = self._build(team, _team_roster(team))
+        return entry
+
+    def strength(self, team: Any, default: float = 70.0) -> float:
+        """Average roster overall (``default`` for an empty roster)."""
+        entry = self._entry(team)
+        if not entry.count:
+            return default
+        return entry.overall_sum / entry.count
+
+    def players_at(self, team: Any, positions: Iterable[Any]) -> List[Any]:
+        """Roster players at any of ``positions``, in roster order."""
+        entry = self._entry(team)
+        groups = [entry.by_position[pos] for pos in positions if entry.by_position.get(pos)]
+        if len(groups) == 1:
+            return list(groups[0])
+        return sorted((p for group in groups for p in group), key=lambda p: entry.seq[id(p)])
+
+    def healthy_players(self, team: Any) -> List[Any]:
+        """Roster players whose injury status is healthy, in roster order."""
+        return list(self._entry(team).healthy)
+
+    def starters(self, team: Any) -> Dict[str, Any]:
+        """Top depth-chart player at each position."""
+        return dict(self._entry(team).starters)
+
+    def invalidate(self, team: Any = None) -> None:
+        """Drop cached aggregates for ``team`` (or every team)."""
+        if team is None:
+            self._entries.clear()
+            self._player_entries.clear()
+        else:
+            self._forget(team)
+
+    def player_added(self, team: Any, player: Any) -> None:
+        entry = self._entries.get(id(team))
+        if entry is None or entry.team is not team:
+            return
+        roster = _team_roster(team)
+        if entry.roster is not roster or entry.count + 1 != len(roster) or id(player) in entry.seq:
+            self._forget(team)
+            return
+        entry.add(player)
+        self._player_entries[id(player)] = entry
+        entry.refresh_starters()
+
+    def player_removed(self, team: Any, player: Any) -> None:
+        entry = self._entries.get(id(team))
+        if entry is None or entry.team is not team:
+            return
+        roster = _team_roster(team)
+        if entry.roster is not roster or id(player) not in entry.seq or entry.count - 1 != len(roster):
+            self._forget(team)
+            return
+        entry.remove(player)
+        if self._player_entries.get(id(player)) is entry:
+            del self._player_entries[id(player)]
+        entry.refresh_starters()
+
+    def player_changed(self, player: Any) -> None:
+        entry = self._player_entries.get(id(player))
+        if entry is None:
+            return
+        if self._current(entry.team) is not entry:
+            self._forget(entry.team)
+            return
+        entry.update(player)
+
+    def depth_chart_changed(self, team: Any) -> None:
+        entry = self._entries.get(id(team))
+        if entry is not None and entry.team is team:
+            entry.refresh_starters()
+
+
+def index_for(team: Any) -> Optional[TeamRatingIndex]:
+    """The TeamRatingIndex currently tracking ``team``, if any."""
+    try:
+        return _TEAM_INDEX.get(team)
+    except TypeError:
+        return None
+
+
+def notify_player_added(team: Any, player: Any) -> None:
+    index = index_for(team)
+    if index is not None:
+        index.player_added(team, player)
+
+
+def notify_player_removed(team: Any, player: Any) -> None:
+    index = index_for(team)
+    if index is not None:
+        index.player_removed(team, player)
+
+
+def notify_depth_chart_changed(team: Any) -> None:
+    index = index_for(team)
+    if index is not None:
+        index.depth_chart_changed(team)
+
+
+def notify_player_changed(player: Any) -> None:
+    """Call after changing a player's overall, position or injury status."""
+    for index in list(_INDEXES):
+        index.player_changed(player)
@@ -1,18 +1,29 @@
 from __future__ import annotations
 
 import datetime
+import heapq
+import itertools
 import random
 import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from types import SimpleNamespace
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from gridiron_gm_pkg.simulation.career.decision_item import DecisionItem
+from gridiron_gm_pkg.simulation.persistence.dirty_chunks import mark_chunks, mark_team_dirty
 from gridiron_gm_pkg.simulation.roster.roster_rules import review_roster_rules
 from gridiron_gm_pkg.simulation.utils.box_score import (
     generate_box_score,
     sanitize_box_score_numbers,
 )
-from gridiron_gm_pkg.simulation.systems.core.data_loader import save_results
+from gridiron_gm_pkg.simulation.systems.core.data_loader import (
+    append_result,
+    flush_results_journal,
+)
+from gridiron_gm_pkg.simulation.systems.player.injury_status import assign_game_injuries, set_injury_fields
+from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import TeamRatingIndex
 
 def _clamp_hour(value: int) -> int:
     return max(0, min(23, int(value)))
@@ -41,6 +52,161 @@ def _derive_seed(base_seed: int, label: str) -> int:
     return seed
 
 
+_INJURY_FIELDS = (
+    "injury_status",
+    "injury_name",
+    "injury_start_date",
+    "injury_end_date",
+    "injury_severity",
+)
+_GAME_POOLS: Dict[int, ProcessPoolExecutor] = {}
+
+
+def _team_roster(team: Any) -> List[Any]:
+    if not team:
+        return []
+    return getattr(team, "roster", None) or getattr(team, "players", [])
+
+
+def _roster_strength(team: Any, index: Optional[TeamRatingIndex] = None) -> float:
+    if index is not None and team:
+        return index.strength(team)
+    roster = _team_roster(team)
+    if not roster:
+        return 70.0
+    total = 0.0
+    count = 0
+    for player in roster:
+        total += float(getattr(player, "overall", 70) or 70)
+        count += 1
+    return total / max(count, 1)
+
+
+def _score_from_strength(strength: float, rng: random.Random) -> int:
+    expected = 20 + (strength - 70) * 0.3
+    expected = max(10.0, min(40.0, expected))
+    score = int(round(expected + rng.randint(-7, 7)))
+    return max(3, min(60, score))
+
+
+def _play_game(
+    home_id: Any,
+    away_id: Any,
+    home_team: Any,
+    away_team: Any,
+    *,
+    league: Any,
+    seed: int,
+    playoff: bool,
+    current_date: datetime.date,
+) -> Tuple[int, int, Dict[str, Any]]:
+    """Score, box score and injuries for one game, all drawn from a single seeded RNG."""
+    rng = random.Random(seed)
+    index = getattr(league, "rating_index", None)
+    home_score = _score_from_strength(_roster_strength(home_team, index), rng)
+    away_score = _score_from_strength(_roster_strength(away_team, index), rng)
+    if playoff and home_score == away_score:
+        if rng.random() < 0.5:
+            home_score += 3
+        else:
+            away_score += 3
+    box_score = generate_box_score(
+        home_id,
+        away_id,
+        home_score,
+        away_score,
+        league=league,
+        rng=rng,
+    )
+    sanitize_box_score_numbers(box_score)
+    if home_team is not None and away_team is not None:
+        assign_game_injuries(home_team, away_team, current_date, rng)
+    return home_score, away_score, box_score
+
+
+def _snapshot_player(player: Any) -> Any:
+    if isinstance(player, dict):
+        return player
+    snapshot = SimpleNamespace(
+        id=getattr(player, "id", None),
+        name=getattr(player, "name", None),
+        position=getattr(player, "position", None),
+        overall=getattr(player, "overall", 70),
+        on_injured_reserve=getattr(player, "on_injured_reserve", False),
+    )
+    for key in _INJURY_FIELDS:
+        setattr(snapshot, key, getattr(player, key, "healthy" if key == "injury_status" else None))
+    return snapshot
+
+
+def _snapshot_team(team: Any) -> Any:
+    """Picklable stand-in carrying only what ``_play_game`` reads from a team."""
+    if team is None:
+        return None
+    roster = getattr(team, "roster", None)
+    snapshot = SimpleNamespace(
+        id=getattr(team, "id", None),
+        abbreviation=getattr(team, "abbreviation", None),
+        team_name=getattr(team, "team_name", None),
+        roster=[_snapshot_player(player) for player in roster] if isinstance(roster, list) else None,
+    )
+    if not roster:
+        snapshot.players = [_snapshot_player(player) for player in getattr(team, "players", []) or []]
+    return snapshot
+
+
+def _injury_state(team: Any) -> List[Tuple[Any, ...]]:
+    return [
+        tuple(getattr(player, key, None) for key in _INJURY_FIELDS)
+        for player in _team_roster(team)
+    ]
+
+
+def _simulate_game_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker entry point: play a snapshotted game and report the injuries it caused."""
+    home, away = job["home"], job["away"]
+    before = {"home": _injury_state(home), "away": _injury_state(away)}
+    home_score, away_score, box_score = _play_game(
+        job["home_id"],
+        job["away_id"],
+        home,
+        away,
+        league=SimpleNamespace(id_to_team={job["home_id"]: home, job["away_id"]: away}),
+        seed=job["seed"],
+        playoff=job["playoff"],
+        current_date=job["current_date"],
+    )
+    injuries = []
+    for side, team in (("home", home), ("away", away)):
+        for index, state in enumerate(_injury_state(team)):
+            if state != before[side][index]:
+                injuries.append((side, index, dict(zip(_INJURY_FIELDS, state))))
+    return {
+        "game_id": job["game_id"],
+        "seed": job["seed"],
+        "current_date": job["current_date"],
+        "home_score": home_score,
+        "away_score": away_score,
+        "box_score": box_score,
+        "injuries": injuries,
+    }
+
+
+def _game_pool(workers: int) -> ProcessPoolExecutor:
+    pool = _GAME_POOLS.get(workers)
+    if pool is None:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        _GAME_POOLS[workers] = pool
+    return pool
+
+
+def shutdown_game_pools() -> None:
+    """Stop any worker processes started for parallel game simulation."""
+    while _GAME_POOLS:
+        _, pool = _GAME_POOLS.popitem()
+        pool.shutdown(wait=True)
+
+
 def _normalize_event_type(event_type: Any) -> str:
     token = str(event_type or "").strip()
     lowered = token.lower().replace("-", "_").replace(" ", "_")
@@ -147,10 +313,27 @@ class SimEvent:
 
 
 class EventQueue:
+    """Min-heap of pending ``SimEvent`` objects ordered by ``sort_key``.
+
+    Sort keys are computed once when an event is pushed. ``remove_matching``
+    tombstones events instead of rebuilding the heap; tombstones are skipped
+    on pop and swept out by ``compact`` once they dominate the heap.
+    """
+
+    COMPACT_MIN_TOMBSTONES = 64
+
     def __init__(self, events: Optional[List[SimEvent]] = None, next_id: int = 1) -> None:
-        self._events: List[SimEvent] = sorted(events or [], key=lambda e: e.sort_key())
+        self._sequence = itertools.count()
+        self._heap: List[Tuple[Tuple[int, int, int, int], int, SimEvent]] = [
+            (event.sort_key(), next(self._sequence), event) for event in (events or [])
+        ]
+        heapq.heapify(self._heap)
+        self._cancelled: set[int] = set()
         self._next_id = max(int(next_id), 1)
 
+    def __len__(self) -> int:
+        return len(self._heap) - len(self._cancelled)
+
     def schedule(
         self,
         date: datetime.date,
@@ -172,35 +355,50 @@ class EventQueue:
         return event
 
     def _insert_event(self, event: SimEvent) -> None:
-        key = event.sort_key()
-        lo = 0
-        hi = len(self._events)
-        while lo < hi:
-            mid = (lo + hi) // 2
-            if self._events[mid].sort_key() < key:
-                lo = mid + 1
-            else:
-                hi = mid
-        self._events.insert(lo, event)
+        heapq.heappush(self._heap, (event.sort_key(), next(self._sequence), event))
+
+    def _discard_cancelled_head(self) -> None:
+        heap = self._heap
+        cancelled = self._cancelled
+        while heap and heap[0][1] in cancelled:
+            cancelled.discard(heapq.heappop(heap)[1])
 
     def peek_next(self) -> Optional[SimEvent]:
-        return self._events[0] if self._events else None
+        self._discard_cancelled_head()
+        return self._heap[0][2] if self._heap else None
 
     def pop_next(self) -> Optional[SimEvent]:
-        if not self._events:
+        self._discard_cancelled_head()
+        if not self._heap:
             return None
-        return self._events.pop(0)
+        return heapq.heappop(self._heap)[2]
 
     def remove_matching(self, predicate) -> None:
-        self._events = [event for event in self._events if not predicate(event)]
+        cancelled = self._cancelled
+        for _, sequence, event in self._heap:
+            if sequence not in cancelled and predicate(event):
+                cancelled.add(sequence)
+        if len(cancelled) >= self.COMPACT_MIN_TOMBSTONES and len(cancelled) * 2 >= len(self._heap):
+            self.compact()
+        else:
+            self._discard_cancelled_head()
+
+    def compact(self) -> None:
+        if not self._cancelled:
+            return
+        cancelled = self._cancelled
+        self._heap = [entry for entry in self._heap if entry[1] not in cancelled]
+        heapq.heapify(self._heap)
+        cancelled.clear()
 
     def events(self) -> List[SimEvent]:
-        return list(self._events)
+        cancelled = self._cancelled
+        return [event for _, sequence, event in sorted(self._heap) if sequence not in cancelled]
 
     def serialize(self) -> Dict[str, Any]:
         return {
             "next_id": self._next_id,
-            "events": [event.serialize() for event in self._events],
+            "events": [event.serialize() for event in self.events()],
         }
 
     @classmethod
@@ -359,39 +557,60 @@ def _deserialize_rng_state(payload: Dict[str, Any]) -> Tuple[Any, Any, Any]:
     return (version, inner_state, gaussian)
 
 
-class AgendaBuilder:
-    def __init__(self, calendar: Any, schedule_by_week: Dict[str, Any]) -> None:
-        self.calendar = calendar
-        self.schedule_by_week = schedule_by_week
-
-    def _week_start_date(self, week: Any) -> Optional[datetime.date]:
+def _parse_schedule_date(value: Any) -> Optional[datetime.date]:
+    if isinstance(value, datetime.date):
+        return value
+    if isinstance(value, str) and value:
         try:
-            week_int = int(week)
-        except (TypeError, ValueError):
-            return None
-        base_date = getattr(self.calendar, "nfl_week1_start_date", None)
-        if not isinstance(base_date, datetime.date):
+            return datetime.date.fromisoformat(value)
+        except ValueError:
             return None
-        return base_date + datetime.timedelta(days=(week_int - 1) * 7)
+    return None
+
+
+class ScheduleIndex:
+    """Lookup tables over ``schedule_by_week`` keyed by week, calendar date and matchup.
+
+    The index is rebuilt only when the schedule's structure changes (a new
+    dict, or a week bucket added, replaced or resized). Playoff games are
+    filled in place by ``advance_playoff_schedule``, so their matchup keys
+    are re-read from the game dicts by ``refresh_playoff_games`` rather than
+    triggering a rebuild.
+    """
+
+    def __init__(self, schedule_by_week: Optional[Dict[str, Any]] = None) -> None:
+        self.schedule_by_week: Dict[str, Any] = {}
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._by_game_week: Dict[str, List[Dict[str, Any]]] = {}
+        self._day_entries: Dict[str, Dict[str, Any]] = {}
+        self._matchups: Dict[str, Dict[Tuple[str, str], Dict[str, Any]]] = {}
+        self._playoff_games: Dict[str, List[Dict[str, Any]]] = {}
+        self._playoff_keys: Dict[int, Tuple[str, str]] = {}
+        self.sync(schedule_by_week if schedule_by_week is not None else {})
+
+    @staticmethod
+    def _structure_signature(schedule_by_week: Dict[str, Any]) -> Tuple[Any, ...]:
+        return (id(schedule_by_week),) + tuple(
+            (key, id(games), len(games) if isinstance(games, list) else -1)
+            for key, games in schedule_by_week.items()
+        )
 
-    def _parse_game_date(self, game: Dict[str, Any]) -> Optional[datetime.date]:
-        value = game.get("date")
-        if isinstance(value, datetime.date):
-            return value
-        if isinstance(value, str) and value:
-            try:
-                return datetime.date.fromisoformat(value)
-            except ValueError:
-                return None
-        return None
+    def sync(self, schedule_by_week: Dict[str, Any]) -> bool:
+        signature = self._structure_signature(schedule_by_week)
+        if signature == self._signature and schedule_by_week is self.schedule_by_week:
+            return False
+        self.schedule_by_week = schedule_by_week
+        self._signature = signature
+        self._rebuild()
+        return True
 
-    def _iter_week_games(self, week: str) -> List[Dict[str, Any]]:
-        week_str = str(week)
-        direct = self.schedule_by_week.get(week_str, [])
-        if isinstance(direct, list) and direct:
-            return [game for game in direct if isinstance(game, dict)]
-        fallback: List[Dict[str, Any]] = []
-        seen: set[tuple[str, str, str]] = set()
+    def _rebuild(self) -> None:
+        self._by_game_week = {}
+        self._day_entries = {}
+        self._matchups = {}
+        self._playoff_games = {}
+        self._playoff_keys = {}
+        seen: set[tuple[str, str, str, str]] = set()
         for bucket_key, games in self.schedule_by_week.items():
             if not isinstance(games, list):
                 continue
@@ -399,9 +618,8 @@ class AgendaBuilder:
                 if not isinstance(game, dict):
                     continue
                 game_week = str(game.get("calendar_week") or game.get("week") or bucket_key or "")
-                if game_week != week_str:
-                    continue
                 dedupe_key = (
+                    game_week,
                     str(game.get("home_id") or ""),
                     str(game.get("away_id") or ""),
                     str(game.get("kickoff") or ""),
@@ -409,17 +627,144 @@ class AgendaBuilder:
                 if dedupe_key in seen:
                     continue
                 seen.add(dedupe_key)
-                fallback.append(game)
-        return fallback
+                self._by_game_week.setdefault(game_week, []).append(game)
+
+    def week_games(self, week: Any) -> List[Dict[str, Any]]:
+        week_str = str(week)
+        direct = self.schedule_by_week.get(week_str, [])
+        if isinstance(direct, list) and direct:
+            return [game for game in direct if isinstance(game, dict)]
+        return list(self._by_game_week.get(week_str, []))
+
+    def _week_day_entries(self, week: str) -> Dict[str, Any]:
+        entries = self._day_entries.get(week)
+        if entries is not None:
+            return entries
+        by_date: Dict[datetime.date, List[Tuple[int, Dict[str, Any], Optional[datetime.date], str]]] = {}
+        by_day: Dict[str, List[Tuple[int, Dict[str, Any], Optional[datetime.date], str]]] = {}
+        undated: List[Tuple[int, Dict[str, Any], Optional[datetime.date], str]] = []
+        for position, game in enumerate(self.week_games(week)):
+            explicit_date = _parse_schedule_date(game.get("date"))
+            game_day = _normalize_day_name(game.get("day", ""))
+            entry = (position, game, explicit_date, game_day)
+            if explicit_date is not None:
+                by_date.setdefault(explicit_date, []).append(entry)
+            elif game_day:
+                by_day.setdefault(game_day, []).append(entry)
+            else:
+                undated.append(entry)
+        entries = {"by_date": by_date, "by_day": by_day, "undated": undated}
+        self._day_entries[week] = entries
+        return entries
+
+    def games_on(
+        self,
+        week: Any,
+        date: datetime.date,
+        fallback_date: Optional[datetime.date] = None,
+    ) -> List[Tuple[int, Dict[str, Any], Optional[datetime.date], str]]:
+        """Return ``(position, game, explicit_date, day)`` entries scheduled for ``date`` in ``week``."""
+        entries = self._week_day_entries(str(week))
+        matched = list(entries["by_date"].get(date, ()))
+        matched.extend(entries["by_day"].get(_normalize_day_name(date.strftime("%A")), ()))
+        if fallback_date is not None and fallback_date == date:
+            matched.extend(entries["undated"])
+        matched.sort(key=lambda entry: entry[0])
+        return matched
+
+    def _week_matchups(self, week: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        matchups = self._matchups.get(week)
+        if matchups is not None:
+            return matchups
+        matchups = {}
+        playoff_games: List[Dict[str, Any]] = []
+        for game in self.week_games(week):
+            key = (str(game.get("home_id") or ""), str(game.get("away_id") or ""))
+            matchups.setdefault(key, game)
+            if game.get("playoff") or _is_placeholder_team_ref(game.get("home_id")) or _is_placeholder_team_ref(
+                game.get("away_id")
+            ):
+                playoff_games.append(game)
+                self._playoff_keys[id(game)] = key
+        self._matchups[week] = matchups
+        self._playoff_games[week] = playoff_games
+        return matchups
+
+    def refresh_playoff_games(self, week: Optional[Any] = None) -> None:
+        """Re-key playoff games whose teams were filled in after indexing."""
+        weeks = [str(week)] if week is not None else list(self._playoff_games)
+        for week_str in weeks:
+            matchups = self._matchups.get(week_str)
+            if matchups is None:
+                continue
+            for game in self._playoff_games.get(week_str, []):
+                old_key = self._playoff_keys.get(id(game))
+                new_key = (str(game.get("home_id") or ""), str(game.get("away_id") or ""))
+                if old_key == new_key:
+                    continue
+                if old_key is not None and matchups.get(old_key) is game:
+                    del matchups[old_key]
+                matchups.setdefault(new_key, game)
+                self._playoff_keys[id(game)] = new_key
+
+    def find_game(self, week: Any, home_id: Any, away_id: Any) -> Optional[Dict[str, Any]]:
+        week_str = str(week)
+        key = (str(home_id or ""), str(away_id or ""))
+        game = self._week_matchups(week_str).get(key)
+        if game is not None and (str(game.get("home_id") or ""), str(game.get("away_id") or "")) == key:
+            return game
+        self.refresh_playoff_games(week_str)
+        game = self._matchups[week_str].get(key)
+        if game is not None and (str(game.get("home_id") or ""), str(game.get("away_id") or "")) == key:
+            return game
+        return None
+
+
+class AgendaBuilder:
+    def __init__(
+        self,
+        calendar: Any,
+        schedule_by_week: Dict[str, Any],
+        index: Optional[ScheduleIndex] = None,
+    ) -> None:
+        self.calendar = calendar
+        self.schedule_by_week = schedule_by_week
+        self._index = index
+
+    @property
+    def index(self) -> ScheduleIndex:
+        if self._index is None:
+            self._index = ScheduleIndex(self.schedule_by_week)
+        else:
+            self._index.sync(self.schedule_by_week)
+        return self._index
+
+    def _week_start_date(self, week: Any) -> Optional[datetime.date]:
+        try:
+            week_int = int(week)
+        except (TypeError, ValueError):
+            return None
+        base_date = getattr(self.calendar, "nfl_week1_start_date", None)
+        if not isinstance(base_date, datetime.date):
+            return None
+        return base_date + datetime.timedelta(days=(week_int - 1) * 7)
+
+    def _parse_game_date(self, game: Dict[str, Any]) -> Optional[datetime.date]:
+        return _parse_schedule_date(game.get("date"))
+
+    def _iter_week_games(self, week: str) -> List[Dict[str, Any]]:
+        return self.index.week_games(week)
+
+    def find_game(self, week: Any, home_id: Any, away_id: Any) -> Optional[Dict[str, Any]]:
+        return self.index.find_game(week, home_id, away_id)
 
     def get_games_for_date(self, week: str, date: datetime.date) -> List[Dict[str, Any]]:
-        day_name = _normalize_day_name(date.strftime("%A"))
         fallback_date = None
         week_start = self._week_start_date(week)
         if week_start is not None:
             fallback_date = week_start + datetime.timedelta(days=6)
         matched: List[Dict[str, Any]] = []
-        for game in self._iter_week_games(week):
+        for _, game, explicit_date, game_day in self.index.games_on(week, date, fallback_date):
             home_id = game.get("home_id")
             away_id = game.get("away_id")
             if (
@@ -429,17 +774,6 @@ class AgendaBuilder:
                 or _is_placeholder_team_ref(away_id)
             ):
                 continue
-            explicit_date = self._parse_game_date(game)
-            game_day = _normalize_day_name(game.get("day", ""))
-            if explicit_date is not None:
-                if explicit_date != date:
-                    continue
-            elif game_day:
-                if game_day != day_name:
-                    continue
-            else:
-                if fallback_date is None or fallback_date != date:
-                    continue
             enriched = dict(game)
             enriched["week"] = str(game.get("week") or game.get("calendar_week") or week)
             if explicit_date is not None:
@@ -500,6 +834,10 @@ class TimeEngine:
     TRAINING_HOURS = (10, 13, 16)
     TRAVEL_HOUR = 18
     DEFAULT_KICKOFF_HOUR = 13
+    # Jump straight over hours with no queued events instead of stepping them.
+    FAST_FORWARD_IDLE_HOURS = True
+    # Worker processes for simulating a time slot's CPU games; 0 keeps them in-process.
+    PARALLEL_GAME_WORKERS = 0
 
     def __init__(
         self,
@@ -512,6 +850,8 @@ class TimeEngine:
         self.calendar = calendar
         self.season_manager = season_manager
         self.schedule_by_week = schedule_by_week or getattr(season_manager, "schedule_by_week", {}) or {}
+        self.schedule_index = ScheduleIndex(self.schedule_by_week)
+        self._agenda_builder = AgendaBuilder(calendar, self.schedule_by_week, self.schedule_index)
         self.clock = self._ensure_clock()
         self.queue = self._ensure_queue()
         self.inboxes = self._ensure_inboxes()
@@ -528,6 +868,7 @@ class TimeEngine:
             self.league.last_phase_token = self.last_phase_token
         self.simulated_games = self._ensure_simulated_games()
         self._debug_game_events: Optional[Dict[str, Any]] = None
+        self._prepared_games: Dict[str, Dict[str, Any]] = {}
         self._sync_calendar_time()
 
     def _ensure_clock(self) -> GameClock:
@@ -726,7 +1067,7 @@ class TimeEngine:
         from gridiron_gm_pkg.simulation.systems.player.injury_status import heal_league_players
 
         heal_league_players(self.league, date)
-        builder = AgendaBuilder(self.calendar, self.schedule_by_week)
+        builder = self._agenda()
         week = str(getattr(self.calendar, "current_week", "1"))
         day_name = _normalize_day_name(getattr(self.calendar, "current_day", date.strftime("%A")))
         games_today = builder.get_games_for_date(week, date)
@@ -817,6 +1158,8 @@ class TimeEngine:
         if self.clock.hour == 0:
             from gridiron_gm_pkg.simulation.systems.player.attribute_xp import apply_weekly_decay
 
+            self.flush_results()
+
             apply_weekly_decay(
                 self.league,
                 year=getattr(self.calendar, "current_year", None),
@@ -829,6 +1172,7 @@ class TimeEngine:
         processed: List[Dict[str, Any]] = []
         paused = False
         pause_event = None
+        self._prepare_parallel_games()
         while True:
             next_event = self.queue.peek_next()
             if not next_event:
@@ -844,6 +1188,7 @@ class TimeEngine:
                 pause_event = self._event_summary(event)
             if pause:
                 paused = True
+        self._prepared_games = {}
         self._persist_rng_state()
         self._persist_queue_state()
         return {"paused": paused, "processed": processed, "pause_event": pause_event}
@@ -1298,6 +1643,7 @@ class TimeEngine:
                     new_notifications=self._collect_new_notifications(inbox_before),
                     debug_game_events=self._finalize_debug_game_events(),
                 )
+            hours_advanced += self._skip_idle_hours(max_hours - hours_advanced - 1, target_datetime)
             result = self.advance_hour()
             hours_advanced += 1
             if result.get("paused"):
@@ -1372,6 +1718,50 @@ class TimeEngine:
             debug_game_events=self._finalize_debug_game_events(),
         )
 
+    def _skip_idle_hours(
+        self,
+        max_skip: int,
+        target_datetime: Optional[datetime.datetime] = None,
+    ) -> int:
+        """Jump the clock over hours where ``advance_hour`` would do nothing.
+
+        Stops one hour short of the next queued event, midnight (where the
+        day rollover and agenda build run) and ``target_datetime`` so the
+        following ``advance_hour`` call lands on them exactly as hour-by-hour
+        stepping would. Returns the number of hours skipped.
+        """
+        if not self.FAST_FORWARD_IDLE_HOURS or max_skip <= 0:
+            return 0
+        stop_hour = 24
+        next_event = self.queue.peek_next()
+        if next_event is not None:
+            if next_event.date < self.clock.current_date:
+                return 0
+            if next_event.date == self.clock.current_date:
+                stop_hour = min(stop_hour, next_event.hour)
+        if target_datetime is not None:
+            if target_datetime.date() < self.clock.current_date:
+                return 0
+            if target_datetime.date() == self.clock.current_date:
+                stop_hour = min(stop_hour, target_datetime.hour)
+        skip = min(stop_hour - self.clock.hour - 1, max_skip)
+        if skip <= 0:
+            return 0
+        self.clock.hour += skip
+        self._sync_calendar_time()
+        return skip
+
+    def _agenda(self) -> AgendaBuilder:
+        builder = self._agenda_builder
+        builder.calendar = self.calendar
+        builder.schedule_by_week = self.schedule_by_week
+        return builder
+
+    def _sync_schedule_index(self) -> None:
+        self.schedule_by_week = getattr(self.season_manager, "schedule_by_week", self.schedule_by_week)
+        if not self.schedule_index.sync(self.schedule_by_week):
+            self.schedule_index.refresh_playoff_games()
+
     def _sync_playoff_schedule_if_ready(self) -> None:
         if self.season_manager is None or self.calendar is None:
             return
@@ -1379,11 +1769,11 @@ class TimeEngine:
             return
         if getattr(self.season_manager, "playoffs_generated", False):
             self.season_manager.advance_playoff_bracket_if_ready()
-            self.schedule_by_week = getattr(self.season_manager, "schedule_by_week", self.schedule_by_week)
+            self._sync_schedule_index()
             return
         self.season_manager.generate_playoff_bracket_if_ready()
         self.season_manager.advance_playoff_bracket_if_ready()
-        self.schedule_by_week = getattr(self.season_manager, "schedule_by_week", self.schedule_by_week)
+        self._sync_schedule_index()
         self.last_agenda_date = None
         self.league.last_agenda_date = None
 
@@ -1422,6 +1812,7 @@ class TimeEngine:
     ) -> Dict[str, Any]:
         processed: List[Dict[str, Any]] = []
         pause_event = None
+        self._prepare_parallel_games()
         while True:
             next_event = self.queue.peek_next()
             if not next_event or not self._event_due(next_event):
@@ -1440,9 +1831,11 @@ class TimeEngine:
                     auto_continue_non_game_pauses=auto_continue_non_game_pauses,
                 ):
                     continue
+                self._prepared_games = {}
                 self._persist_rng_state()
                 self._persist_queue_state()
                 return {"paused": True, "processed": processed, "pause_event": pause_event}
+        self._prepared_games = {}
         self._persist_rng_state()
         self._persist_queue_state()
         return {"paused": False, "processed": processed, "pause_event": pause_event}
@@ -1755,6 +2148,7 @@ class TimeEngine:
         )
         self.decisions.append(decision)
         self.league.decisions = self.decisions
+        mark_chunks(self.league, "inboxes")
         if linked_notification_id:
             self._link_notification_to_decision(str(linked_notification_id), decision)
         return decision
@@ -1893,6 +2287,7 @@ class TimeEngine:
             decision.resolved_at_date = self.clock.current_date.isoformat()
             decision.resolved_at_time = self.clock.current_time_str
             self.league.decisions = self.decisions
+            mark_chunks(self.league, "inboxes")
             self._update_linked_notification_for_resolution(decision)
             return {
                 "ok": True,
@@ -1921,6 +2316,7 @@ class TimeEngine:
         if found:
             self.inboxes[team_id] = messages
             self.league.inboxes = self.inboxes
+            mark_chunks(self.league, "inboxes")
         return found
 
     def mark_read(self, message_id: Any, team_id: Optional[str] = None) -> bool:
@@ -1940,6 +2336,7 @@ class TimeEngine:
         if found:
             self.inboxes[team_id] = messages
             self.league.inboxes = self.inboxes
+            mark_chunks(self.league, "inboxes")
         return found
 
     def mark_all_read(self, team_id: Optional[str] = None) -> int:
@@ -1955,6 +2352,7 @@ class TimeEngine:
         if count:
             self.inboxes[team_id] = messages
             self.league.inboxes = self.inboxes
+            mark_chunks(self.league, "inboxes")
         return count
 
     def latest_inbox_preview(self, team_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
@@ -2135,18 +2533,16 @@ class TimeEngine:
             return None
         week = str(payload.get("week") or "")
         if week:
-            builder = AgendaBuilder(self.calendar, self.schedule_by_week)
-            week_games = builder._iter_week_games(week)
+            builder = self._agenda()
             exact_home = payload.get("home_id")
             exact_away = payload.get("away_id")
             if exact_home and exact_away:
-                for entry in week_games:
-                    if not isinstance(entry, dict):
-                        continue
-                    if entry.get("home_id") == exact_home and entry.get("away_id") == exact_away:
-                        resolved = dict(entry)
-                        resolved["week"] = week
-                        return resolved
+                entry = builder.find_game(week, exact_home, exact_away)
+                if entry is not None:
+                    resolved = dict(entry)
+                    resolved["week"] = week
+                    return resolved
+            week_games = builder._iter_week_games(week)
             for entry in week_games:
                 if not isinstance(entry, dict):
                     continue
@@ -2185,36 +2581,34 @@ class TimeEngine:
         game_id = make_game_id(week, home_id, away_id)
         season_phase = getattr(self.calendar, "season_phase", None) if self.calendar is not None else None
         seed = self.rng_streams.seed_for("games", game_id)
-        rng = random.Random(seed)
-        home_strength = self._team_strength(home_id)
-        away_strength = self._team_strength(away_id)
-        home_score = self._compute_score(home_strength, rng)
-        away_score = self._compute_score(away_strength, rng)
-        if (game.get("playoff") or game.get("season_type") == "playoffs") and home_score == away_score:
-            if rng.random() < 0.5:
-                home_score += 3
-            else:
-                away_score += 3
+        home_team = self.league.id_to_team.get(home_id) if hasattr(self.league, "id_to_team") else None
+        away_team = self.league.id_to_team.get(away_id) if hasattr(self.league, "id_to_team") else None
+        prepared = self._prepared_games.pop(game_id, None)
+        if (
+            prepared is not None
+            and prepared["seed"] == seed
+            and prepared["current_date"] == self.clock.current_date
+        ):
+            home_score = prepared["home_score"]
+            away_score = prepared["away_score"]
+            box_score = prepared["box_score"]
+            self._apply_prepared_injuries(prepared, home_team, away_team)
+        else:
+            home_score, away_score, box_score = _play_game(
+                home_id,
+                away_id,
+                home_team,
+                away_team,
+                league=self.league,
+                seed=seed,
+                playoff=bool(game.get("playoff") or game.get("season_type") == "playoffs"),
+                current_date=self.clock.current_date,
+            )
         winner_id = None
         if home_score > away_score:
             winner_id = home_id
         elif away_score > home_score:
             winner_id = away_id
-        box_score = generate_box_score(
-            home_id,
-            away_id,
-            home_score,
-            away_score,
-            league=self.league,
-            rng=rng,
-        )
-        sanitize_box_score_numbers(box_score)
-        home_team = self.league.id_to_team.get(home_id) if hasattr(self.league, "id_to_team") else None
-        away_team = self.league.id_to_team.get(away_id) if hasattr(self.league, "id_to_team") else None
-        if home_team is not None and away_team is not None:
-            from gridiron_gm_pkg.simulation.systems.player.injury_status import assign_game_injuries
-
-            assign_game_injuries(home_team, away_team, self.clock.current_date, rng)
         result = {
             "game_id": game_id,
             "week": week,
@@ -2245,6 +2639,74 @@ class TimeEngine:
         self._record_result(result)
         return result
 
+    def _prepare_parallel_games(self) -> None:
+        """Simulate the CPU games wrapping at the current time in worker processes.
+
+        Outcomes are parked by game_id and consumed by ``_simulate_game`` as the
+        GameWrap events are handled, so results are still recorded one at a
+        time in queue order exactly as the serial path would record them.
+        """
+        self._prepared_games = {}
+        if self.PARALLEL_GAME_WORKERS <= 0:
+            return
+        jobs: List[Dict[str, Any]] = []
+        for event in self.queue.events():
+            if not self._event_due(event):
+                break
+            if _normalize_event_type(event.type) != "GameWrap":
+                continue
+            game = self._resolve_game_by_payload(event.payload)
+            if not game or self._is_user_game(game):
+                continue
+            if _is_placeholder_team_ref(game.get("home_id")) or _is_placeholder_team_ref(game.get("away_id")):
+                continue
+            game = {**game, **self._lookup_game_details(game)}
+            game_id = make_game_id(str(game.get("week", "")), game.get("home_id"), game.get("away_id"))
+            if game_id in self.simulated_games or self._find_result(game_id) is not None:
+                continue
+            job = self._game_job(game_id, game)
+            if job["home"] is None or job["away"] is None:
+                continue
+            jobs.append(job)
+        if len(jobs) < 2:
+            return
+        try:
+            outcomes = list(_game_pool(self.PARALLEL_GAME_WORKERS).map(_simulate_game_job, jobs))
+        except (BrokenProcessPool, OSError):
+            shutdown_game_pools()
+            return
+        self._prepared_games = {outcome["game_id"]: outcome for outcome in outcomes}
+
+    def _game_job(self, game_id: str, game: Dict[str, Any]) -> Dict[str, Any]:
+        home_id = game.get("home_id")
+        away_id = game.get("away_id")
+        id_to_team = getattr(self.league, "id_to_team", None) or {}
+        return {
+            "game_id": game_id,
+            "home_id": home_id,
+            "away_id": away_id,
+            "home": _snapshot_team(id_to_team.get(home_id)),
+            "away": _snapshot_team(id_to_team.get(away_id)),
+            "seed": self.rng_streams.seed_for("games", game_id),
+            "playoff": bool(game.get("playoff") or game.get("season_type") == "playoffs"),
+            "current_date": self.clock.current_date,
+        }
+
+    def _apply_prepared_injuries(self, prepared: Dict[str, Any], home_team: Any, away_team: Any) -> None:
+        if home_team is None or away_team is None:
+            return
+        teams = {"home": home_team, "away": away_team}
+        for side, index, fields in prepared.get("injuries", []):
+            player = _team_roster(teams[side])[index]
+            set_injury_fields(
+                player,
+                fields["injury_status"],
+                fields["injury_name"],
+                fields["injury_start_date"],
+                fields["injury_end_date"],
+                fields["injury_severity"],
+            )
+
     def _record_result(self, result: Dict[str, Any]) -> None:
         result = self._canonicalize_result(result)
         week = str(result.get("week", ""))
@@ -2264,34 +2726,36 @@ class TimeEngine:
         else:
             self._update_league_standings(result)
             self._update_team_records(result)
+            mark_chunks(self.league, "league")
         self.league.results_by_week = results_by_week
         if self.season_manager is not None:
             self.season_manager.results_by_week = results_by_week
             self.season_manager.advance_playoff_bracket_if_ready()
-            self.schedule_by_week = getattr(self.season_manager, "schedule_by_week", self.schedule_by_week)
-            save_results(results_by_week, getattr(self.season_manager, "save_name", "test_league"))
+            self._sync_schedule_index()
+            append_result(result, getattr(self.season_manager, "save_name", "test_league"))
+
+    def flush_results(self, compact: bool = False) -> None:
+        """Write journaled results to disk; ``compact`` folds them into the snapshot."""
+        if self.season_manager is None:
+            return
+        flush_results_journal(
+            getattr(self.season_manager, "save_name", "test_league"),
+            getattr(self.season_manager, "results_by_week", None),
+            compact=compact,
+        )
 
     def _canonicalize_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
         week = str(result.get("week", "") or "")
         if not week:
             return result
-        schedule_games = AgendaBuilder(self.calendar, self.schedule_by_week)._iter_week_games(week)
+        builder = self._agenda()
         home_id = str(result.get("home_id") or result.get("home") or "")
         away_id = str(result.get("away_id") or result.get("away") or "")
-        exact_match = next(
-            (
-                game for game in schedule_games
-                if isinstance(game, dict)
-                and str(game.get("home_id") or "") == home_id
-                and str(game.get("away_id") or "") == away_id
-            ),
-            None,
-        )
-        target_game = exact_match
+        target_game = builder.find_game(week, home_id, away_id)
         if target_game is None and result.get("season_type") == "playoffs":
             target_game = next(
                 (
-                    game for game in schedule_games
+                    game for game in builder._iter_week_games(week)
                     if isinstance(game, dict)
                     and game.get("round") == result.get("round")
                     and game.get("conference") == result.get("conference")
@@ -2369,6 +2833,7 @@ class TimeEngine:
             return
         self.inboxes.setdefault(team_id, []).append(message)
         self.league.inboxes = self.inboxes
+        mark_chunks(self.league, "inboxes")
 
     def _link_notification_to_decision(self, notification_id: str, decision: DecisionItem) -> None:
         for messages in self.inboxes.values():
@@ -2379,6 +2844,7 @@ class TimeEngine:
                 msg.decision_type = decision.decision_type
                 msg.blocks_advancement = bool(decision.blocks_advancement)
                 msg.requires_user_attention = True
+                mark_chunks(self.league, "inboxes")
                 return
 
     def _next_message_id(self, team_id: Optional[str]) -> int:
@@ -2429,6 +2895,7 @@ class TimeEngine:
             for action in msg.actions or []:
                 if isinstance(action, dict) and str(action.get("game_id")) == str(game_id):
                     msg.requires_ack = False
+                    mark_chunks(self.league, "inboxes")
                     return
 
     def _update_linked_notification_for_resolution(self, decision: DecisionItem) -> None:
@@ -2444,6 +2911,7 @@ class TimeEngine:
                 msg.requires_ack = False
                 msg.requires_user_attention = False
                 msg.blocks_advancement = False
+                mark_chunks(self.league, "inboxes")
                 return
 
     def _has_kickoff_message(self, game_id: str) -> bool:
@@ -2617,51 +3085,46 @@ class TimeEngine:
         week = str(game.get("week", ""))
         home_id = game.get("home_id")
         away_id = game.get("away_id")
-        builder = AgendaBuilder(self.calendar, self.schedule_by_week)
-        games = builder._iter_week_games(week)
-        for entry in games:
-            if (
-                entry.get("home_id") == home_id
-                and entry.get("away_id") == away_id
-            ):
-                details: Dict[str, Any] = {}
-                kickoff = entry.get("kickoff")
-                if kickoff is not None:
-                    details["kickoff_time"] = kickoff
-                day = entry.get("day")
-                if day is not None:
-                    details["day"] = day
-                label = entry.get("label")
-                if label is not None:
-                    details["label"] = label
-                elif entry.get("playoff"):
-                    details["label"] = "Playoffs"
-                season_type = entry.get("season_type")
-                if season_type is not None:
-                    details["season_type"] = season_type
-                elif entry.get("playoff"):
-                    details["season_type"] = "playoffs"
-                if "playoff" in entry:
-                    details["playoff"] = entry.get("playoff")
-                if entry.get("round") is not None:
-                    details["round"] = entry.get("round")
-                if entry.get("conference") is not None:
-                    details["conference"] = entry.get("conference")
-                if entry.get("home_seed") is not None:
-                    details["home_seed"] = entry.get("home_seed")
-                if entry.get("away_seed") is not None:
-                    details["away_seed"] = entry.get("away_seed")
-                week_key = entry.get("week_key")
-                if week_key is not None:
-                    details["week_key"] = week_key
-                season_week = entry.get("season_week")
-                if season_week is not None:
-                    details["season_week"] = season_week
-                calendar_week = entry.get("calendar_week")
-                if calendar_week is not None:
-                    details["calendar_week"] = calendar_week
-                return details
-        return {}
+        entry = self._agenda().find_game(week, home_id, away_id)
+        if entry is None:
+            return {}
+        details: Dict[str, Any] = {}
+        kickoff = entry.get("kickoff")
+        if kickoff is not None:
+            details["kickoff_time"] = kickoff
+        day = entry.get("day")
+        if day is not None:
+            details["day"] = day
+        label = entry.get("label")
+        if label is not None:
+            details["label"] = label
+        elif entry.get("playoff"):
+            details["label"] = "Playoffs"
+        season_type = entry.get("season_type")
+        if season_type is not None:
+            details["season_type"] = season_type
+        elif entry.get("playoff"):
+            details["season_type"] = "playoffs"
+        if "playoff" in entry:
+            details["playoff"] = entry.get("playoff")
+        if entry.get("round") is not None:
+            details["round"] = entry.get("round")
+        if entry.get("conference") is not None:
+            details["conference"] = entry.get("conference")
+        if entry.get("home_seed") is not None:
+            details["home_seed"] = entry.get("home_seed")
+        if entry.get("away_seed") is not None:
+            details["away_seed"] = entry.get("away_seed")
+        week_key = entry.get("week_key")
+        if week_key is not None:
+            details["week_key"] = week_key
+        season_week = entry.get("season_week")
+        if season_week is not None:
+            details["season_week"] = season_week
+        calendar_week = entry.get("calendar_week")
+        if calendar_week is not None:
+            details["calendar_week"] = calendar_week
+        return details
 
     def _find_result(self, game_id: Optional[str]) -> Optional[Dict[str, Any]]:
         if not game_id:
@@ -2682,31 +3145,6 @@ class TimeEngine:
                         return result
         return None
 
-    def _team_strength(self, team_id: Optional[str]) -> float:
-        if not team_id:
-            return 70.0
-        team = None
-        if hasattr(self.league, "id_to_team"):
-            team = self.league.id_to_team.get(team_id)
-        if not team:
-            roster = []
-        else:
-            roster = getattr(team, "roster", None) or getattr(team, "players", [])
-        if not roster:
-            return 70.0
-        total = 0.0
-        count = 0
-        for player in roster:
-            total += float(getattr(player, "overall", 70) or 70)
-            count += 1
-        return total / max(count, 1)
-
-    def _compute_score(self, strength: float, rng: random.Random) -> int:
-        expected = 20 + (strength - 70) * 0.3
-        expected = max(10.0, min(40.0, expected))
-        score = int(round(expected + rng.randint(-7, 7)))
-        return max(3, min(60, score))
-
     def _summary_text(self, home_id: Optional[str], away_id: Optional[str], home_score: int, away_score: int) -> str:
         home_name = self._team_label(home_id)
         away_name = self._team_label(away_id)
@@ -2776,6 +3214,7 @@ class TimeEngine:
             record.setdefault("PF", 0)
             record.setdefault("PA", 0)
             team.team_record = record
+            mark_team_dirty(team)
         if home_team:
             home_team.team_record["points_for"] += home_score
             home_team.team_record["points_against"] += away_score
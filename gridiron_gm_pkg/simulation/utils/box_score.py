@@ -1,6 +1,8 @@
 import random
 from typing import Any, Dict, List
 
+from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import index_for
+
 
 def _split_points(total: int, rng: random.Random) -> List[int]:
     if total <= 0:
@@ -75,11 +77,15 @@ def _get_player_attr(player: Any, key: str) -> Any:
 def _pick_player(team: Any, positions: set[str], rng: random.Random) -> Any | None:
     roster = getattr(team, "roster", None) if team is not None else None
     roster = roster if isinstance(roster, list) else []
-    candidates = []
-    for player in roster:
-        pos = _get_player_attr(player, "position")
-        if positions and pos in positions:
-            candidates.append(player)
+    index = index_for(team) if roster else None
+    if index is not None and positions:
+        candidates = index.players_at(team, sorted(positions))
+    else:
+        candidates = []
+        for player in roster:
+            pos = _get_player_attr(player, "position")
+            if positions and pos in positions:
+                candidates.append(player)
     if not candidates:
         candidates = roster
     if not candidates:
@@ -0,0 +1,111 @@
+"""Attributes that a save loader builds on first access.
+
+A loader that wants to skip decoding part of a save calls ``defer_section`` with
+the attribute names that part fills in and a ``PendingSection`` that knows how
+to build them. Those attributes are removed from the instance, so the first read
+of any of them falls through to ``LazySections.__getattr__``. That call builds
+the whole section and then returns the value. Objects that were never deferred
+pay nothing extra, because ``__getattr__`` only runs when normal lookup fails.
+
+Assigning to a deferred attribute before it has been read simply sets it, and
+the later build leaves it alone. ``pending_payload`` hands serializers the raw
+section of something that was never built, so saving a lazily loaded object
+does not build it either.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+
+class PendingSection:
+    """One unbuilt save section: ``build(owner, source.section(name), context)``."""
+
+    __slots__ = ("fields", "source", "name", "build", "context")
+
+    def __init__(
+        self,
+        fields: Iterable[str],
+        source: Any,
+        name: str,
+        build: Callable[[Any, Any, Any], None],
+        context: Any = None,
+    ) -> None:
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self.source = source
+        self.name = name
+        self.build = build
+        self.context = context
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+
+def defer_section(owner: Any, pending: PendingSection) -> None:
+    """Drop ``pending.fields`` from ``owner`` until one of them is read."""
+    state = owner.__dict__
+    sections = state.setdefault("_pending_sections", {})
+    for field in pending.fields:
+        state.pop(field, None)
+        sections[field] = pending
+
+
+def has_pending_sections(owner: Any) -> bool:
+    return bool(getattr(owner, "__dict__", {}).get("_pending_sections"))
+
+
+def pending_payload(owner: Any, field: str) -> Any:
+    """The decoded save section ``field`` would be built from, or None once built.
+
+    Lets serializers write a section that was never loaded without building it.
+    Also None if any attribute of the section has been assigned since.
+    """
+    state = getattr(owner, "__dict__", {})
+    pending = (state.get("_pending_sections") or {}).get(field)
+    if pending is None or any(name in state for name in pending.fields):
+        return None
+    return pending.source.section(pending.name)
+
+
+def load_section(owner: Any, pending: PendingSection) -> None:
+    """Build ``pending`` now (a no-op once it has been built)."""
+    state = owner.__dict__
+    sections = state.get("_pending_sections") or {}
+    fields = [field for field in pending.fields if sections.get(field) is pending]
+    if not fields:
+        return
+    # Attributes assigned since the section was deferred are newer than the save.
+    kept = {field: state[field] for field in fields if field in state}
+    for field in fields:
+        del sections[field]
+    try:
+        pending.build(owner, pending.source.section(pending.name), pending.context)
+    except BaseException:
+        for field in fields:
+            sections[field] = pending
+        raise
+    state.update(kept)
+    if not sections:
+        state.pop("_pending_sections", None)
+
+
+def load_all_sections(owner: Any) -> None:
+    """Build every section still pending on ``owner``."""
+    sections = getattr(owner, "__dict__", {}).get("_pending_sections") or {}
+    for pending in {id(pending): pending for pending in sections.values()}.values():
+        load_section(owner, pending)
+
+
+class LazySections:
+    """Mixin for entities whose attributes can be deferred with ``defer_section``."""
+
+    def __getattr__(self, name: str) -> Any:
+        sections = self.__dict__.get("_pending_sections")
+        if sections and name in sections:
+            load_section(self, sections[name])
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
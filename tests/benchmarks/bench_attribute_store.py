@@ -0,0 +1,71 @@
+"""League-wide rating scans with and without the columnar AttributeStore.
+
+Compares per-player ``_compute_overall``/``normalize_ratings`` loops against the
+store's column operations for the same player pool. Run from the repository root:
+
+    python tests/benchmarks/bench_attribute_store.py [players]
+"""
+import contextlib
+import copy
+import datetime
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.systems.player.attribute_store import AttributeStore
+
+_POSITIONS = ("QB", "RB", "WR", "TE", "LT", "LG", "C", "RG", "RT", "DE", "DT", "LB", "CB", "S", "K", "P")
+
+
+def _players(count):
+    random.seed(7)
+    return [
+        Player(
+            name=f"Player {idx}",
+            position=_POSITIONS[idx % len(_POSITIONS)],
+            age=random.randint(21, 38),
+            dob=datetime.date(2000, 1, 1),
+            college="U",
+            birth_location="USA",
+            jersey_number=idx % 99 + 1,
+            overall=random.randint(55, 90),
+        )
+        for idx in range(count)
+    ]
+
+
+def _time(fn, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main(players=2500, repeats=20):
+    with contextlib.redirect_stdout(io.StringIO()):
+        plain = _players(players)
+    stored = copy.deepcopy(plain)
+    store = AttributeStore()
+    store.attach_all(stored)
+    slots = store.slots(stored)
+
+    scan = _time(lambda: [player._compute_overall() for player in plain], repeats)
+    column_scan = _time(lambda: store.overalls(slots), repeats)
+    print(f"{players} players: overall scan {scan:.2f} ms dicts, {column_scan:.2f} ms columns")
+
+    def normalize_all():
+        for player in plain:
+            player.normalize_ratings()
+
+    normalize = _time(normalize_all, repeats)
+    column_normalize = _time(lambda: store.normalize(stored), repeats)
+    print(f"{players} players: normalize {normalize:.2f} ms dicts, {column_normalize:.2f} ms columns")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2500)
@@ -0,0 +1,94 @@
+"""Cold load of a late-career save: JSON vs the lazily loaded binary format.
+
+The league comes from a new game, padded with the free-agent, draft-prospect and
+college pools and weekly results a save carries after several seasons.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_binary_load.py
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
+from gridiron_gm_pkg.simulation.persistence.savegame import convert_save, load_league, save_league
+
+FREE_AGENTS = 400
+PROSPECTS = 2000
+COLLEGE = 4000
+SEASONS = 6
+
+
+def _late_career_payload(path):
+    with contextlib.redirect_stdout(io.StringIO()):
+        facade = GameFacade(save_name=os.path.join(os.path.dirname(path), "save"))
+        facade.new_game()
+        save_league(path, facade.league)
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    league = payload["league"]
+    players = [player for team in league["teams"] for player in team["players"]]
+
+    def pool(size, tag):
+        copies = []
+        for idx in range(size):
+            player = dict(players[idx % len(players)])
+            player["id"] = f"{tag}-{idx}"
+            copies.append(player)
+        return copies
+
+    league["free_agents"] = pool(FREE_AGENTS, "fa")
+    league["draft_prospects"] = pool(PROSPECTS, "dp")
+    league["college_db"] = pool(COLLEGE, "col")
+    team_ids = [team["id"] for team in league["teams"]]
+    league["results_by_week"] = {
+        f"{season}-{week}": [
+            {"home": team_ids[idx], "away": team_ids[-idx - 1], "score": [24, 17]} for idx in range(16)
+        ]
+        for season in range(SEASONS)
+        for week in range(1, 19)
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+
+
+def _timed(fn, repeats=3):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    json_path = os.path.join(directory, "late.json")
+    binary_path = os.path.join(directory, "late.ggsave")
+    _late_career_payload(json_path)
+    convert_save(json_path, binary_path)
+
+    json_ms = _timed(lambda: load_league(json_path), 1)
+    binary_ms = _timed(lambda: load_league(binary_path))
+
+    def first_screen():
+        league = load_league(binary_path)
+        league.teams[0].roster
+
+    screen_ms = _timed(first_screen)
+    print(f"JSON save {os.path.getsize(json_path) / 1e6:.1f} MB, binary {os.path.getsize(binary_path) / 1e6:.1f} MB")
+    print(f"load_league, JSON: {json_ms:.0f} ms")
+    print(f"load_league, binary: {binary_ms:.1f} ms")
+    print(f"binary load + one roster: {screen_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Autosave cost: full JSON save vs delta saves after narrow and broad changes.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_delta_save.py
+"""
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
+from gridiron_gm_pkg.simulation.persistence.savegame import save_league, team_chunk
+
+
+def _timed(fn, repeats=3):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats * 1000
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    with contextlib.redirect_stdout(io.StringIO()):
+        facade = GameFacade(save_name=os.path.join(directory, "save"))
+        facade.new_game()
+    league = facade.league
+    team = league.teams[0]
+    full_path = os.path.join(directory, "full.json")
+    delta_path = os.path.join(directory, "delta.json")
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        full_ms = _timed(lambda: save_league(full_path, league))
+        save_league(delta_path, league, delta=True)
+
+        def broad():
+            league.mark_dirty()
+            save_league(delta_path, league, delta=True)
+
+        def one_team():
+            league.mark_dirty(team_chunk(team))
+            save_league(delta_path, league, delta=True)
+
+        def inbox():
+            league.mark_dirty("inboxes")
+            save_league(delta_path, league, delta=True)
+
+        broad_ms = _timed(broad)
+        team_ms = _timed(one_team, 10)
+        inbox_ms = _timed(inbox, 10)
+
+    print(f"{len(league.teams)} teams, {sum(len(t.roster) for t in league.teams)} rostered players")
+    print(f"full save (indent=2): {full_ms:.0f} ms")
+    print(f"delta, everything dirty: {broad_ms:.0f} ms")
+    print(f"delta, one team dirty: {team_ms:.1f} ms")
+    print(f"delta, inboxes dirty: {inbox_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Daily heal_league_players over a season: full league scan vs the injury-expiry index.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_injury_heal.py [players]
+"""
+import contextlib
+import datetime
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.systems.player.injury_status import apply_simple_injury, heal_league_players
+
+START = datetime.date(2030, 9, 1)
+
+
+def _league(players):
+    random.seed(7)
+    league = LeagueManager()
+    for idx in range(players):
+        league.free_agents.append(
+            Player(
+                name=f"Player {idx}",
+                position="LB",
+                age=26,
+                dob=datetime.date(2004, 1, 1),
+                college="U",
+                birth_location="USA",
+                jersey_number=idx % 99 + 1,
+                overall=random.randint(55, 90),
+            )
+        )
+    return league
+
+
+def _season(league, days=180):
+    rng = random.Random(3)
+    healed = 0
+    elapsed = 0.0
+    for offset in range(days):
+        day = START + datetime.timedelta(days=offset)
+        for player in rng.sample(league.free_agents, 3):
+            if player.injury_status == "healthy":
+                apply_simple_injury(player, day, rng.randint(1, 42), "Sprain")
+        start = time.perf_counter()
+        healed += heal_league_players(league, day)
+        elapsed += time.perf_counter() - start
+    return healed, elapsed
+
+
+def main(players=2500):
+    with contextlib.redirect_stdout(io.StringIO()):
+        scanned, indexed = _league(players), _league(players)
+    scanned.injury_index = None
+    scan_healed, scan_s = _season(scanned)
+    index_healed, index_s = _season(indexed)
+    assert scan_healed == index_healed
+    print(f"{players} players, 180 days, {scan_healed} heals")
+    print(f"full scan: {scan_s * 1000:.1f} ms, index: {index_s * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:]))
@@ -0,0 +1,53 @@
+"""Catalog injury picks: rebuilding the candidate list per roll vs the alias-table sampler.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_injury_sampler.py
+"""
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.config.injury_catalog import INJURY_CATALOG
+from gridiron_gm_pkg.simulation.systems.player.injury_sampler import injury_sampler
+
+
+def _legacy_pick(rng):
+    allowed = {"either", "on_field"}
+    candidates = [
+        (name, data) for name, data in INJURY_CATALOG.items() if data.get("injury_context", "on_field") in allowed
+    ]
+    return rng.choice(candidates)
+
+
+def main():
+    draws = 200_000
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(draws):
+        _legacy_pick(rng)
+    legacy_ns = (time.perf_counter() - start) / draws * 1e9
+
+    sampler = injury_sampler("game")
+    rng = random.Random(1)
+    start = time.perf_counter()
+    for _ in range(draws):
+        sampler.sample(rng, "WR")
+    sampler_ns = (time.perf_counter() - start) / draws * 1e9
+    print(f"scalar: rebuild + choice {legacy_ns:.0f} ns/draw, sampler {sampler_ns:.0f} ns/draw")
+
+    positions = ["QB", "RB", "WR", "TE", "OL", "DL", "LB", "CB", "S", "K"] * (draws // 10)
+    generator = np.random.default_rng(1)
+    start = time.perf_counter()
+    sampler.sample_batch(positions, generator)
+    batch_ms = (time.perf_counter() - start) * 1000
+    print(f"batch: {len(positions)} draws in {batch_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Plays/sec for simulate_pass_play with and without a shared PlayContext.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_pass_play.py [plays]
+"""
+import datetime
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.engine.game_engine import PlayContext, simulate_pass_play
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.team import Team
+
+
+def _make_team(abbr):
+    team = Team(f"{abbr} Team", f"{abbr} City", abbr)
+    for idx, position in enumerate(("QB", "WR", "WR", "WR", "CB", "CB", "S")):
+        team.add_player(
+            Player(
+                name=f"{abbr} {position}{idx}",
+                position=position,
+                age=26,
+                dob=datetime.date(2000, 1, 1),
+                college="U",
+                birth_location="USA",
+                jersey_number=idx + 1,
+                overall=75,
+            )
+        )
+    team.generate_depth_chart()
+    return team
+
+
+def _reset_fatigue(players):
+    for player in players:
+        player.fatigue = 0.0
+
+
+def _run(offense, defense, plays, shared):
+    qb = offense.depth_chart["QB"][0]
+    receivers = offense.depth_chart["WR"]
+    context = {"offense": offense, "defense": defense, "weather": None}
+    play_context = PlayContext(context) if shared else None
+    depths = ("short", "medium", "deep")
+    random.seed(1)
+    start = time.perf_counter()
+    for idx in range(plays):
+        if idx % 60 == 0:
+            # One "drive" worth of snaps, then everyone catches their breath.
+            _reset_fatigue(offense.roster)
+            if shared:
+                play_context = PlayContext(context)
+        simulate_pass_play(qb, receivers, depths[idx % 3], context, play_context=play_context)
+    return plays / (time.perf_counter() - start)
+
+
+def main(plays=200_000):
+    offense, defense = _make_team("OFF"), _make_team("DEF")
+    per_snap = _run(offense, defense, plays, shared=False)
+    shared = _run(offense, defense, plays, shared=True)
+    print(f"per-snap lookups : {per_snap:12,.0f} plays/sec")
+    print(f"shared PlayContext: {shared:12,.0f} plays/sec ({shared / per_snap:.2f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,69 @@
+"""Load time and resident size of a prospect pool as Players vs compact Prospect records.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_prospect_pool.py [prospects]
+"""
+import contextlib
+import datetime
+import gc
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.prospect import load_prospects
+
+_POSITIONS = ("QB", "RB", "WR", "TE", "LT", "LG", "C", "RG", "RT", "DE", "DT", "LB", "CB", "S", "K", "P")
+
+
+def _payloads(count):
+    random.seed(7)
+    return [
+        Player(
+            name=f"Prospect {idx}",
+            position=_POSITIONS[idx % len(_POSITIONS)],
+            age=random.randint(19, 22),
+            dob=datetime.date(2004, 1, 1),
+            college="State",
+            birth_location="USA",
+            jersey_number=idx % 99 + 1,
+            overall=random.randint(45, 75),
+            is_college=True,
+        ).to_dict()
+        for idx in range(count)
+    ]
+
+
+def _measure(load, text):
+    # Decode the saved JSON inside the measurement, as load_league does, so objects a
+    # pool keeps referencing from the payload are counted and the rest is freed.
+    start = time.perf_counter()
+    load(json.loads(text))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    tracemalloc.start()
+    pool = load(json.loads(text))
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return pool, elapsed, size
+
+
+def main(prospects=5000):
+    with contextlib.redirect_stdout(io.StringIO()):
+        text = json.dumps(_payloads(prospects))
+        _, player_time, player_size = _measure(lambda data: [Player.from_dict(p) for p in data], text)
+    _, record_time, record_size = _measure(load_prospects, text)
+    print(f"{prospects} prospects as Player:   {player_time:.2f}s load, {player_size / 2**20:.1f} MiB")
+    print(f"{prospects} prospects as Prospect: {record_time:.2f}s load, {record_size / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,126 @@
+"""Save compression: write time, read time and size per codec.
+
+Generates a 10-season league payload (a new game padded with the player pools,
+weekly results and yearly standings ten seasons leave behind) and writes it as
+a JSON save, a binary save, results_by_week.json and standings files with each
+stdlib codec.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_save_compression.py
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
+from gridiron_gm_pkg.simulation.persistence.compression import COMPRESSIONS, read_json, write_json
+from gridiron_gm_pkg.simulation.persistence.savegame import convert_save, read_save_payload, save_league
+
+SEASONS = 10
+FREE_AGENTS = 400
+PROSPECTS = 2000
+COLLEGE = 4000
+
+
+def _ten_season_league(directory):
+    path = os.path.join(directory, "source.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        facade = GameFacade(save_name=os.path.join(directory, "save"))
+        facade.new_game()
+        save_league(path, facade.league)
+    with open(path, encoding="utf-8") as f:
+        payload = json.load(f)
+    league = payload["league"]
+    players = [player for team in league["teams"] for player in team["players"]]
+
+    def pool(size, tag):
+        return [dict(players[idx % len(players)], id=f"{tag}-{idx}") for idx in range(size)]
+
+    league["free_agents"] = pool(FREE_AGENTS, "fa")
+    league["draft_prospects"] = pool(PROSPECTS, "dp")
+    league["college_db"] = pool(COLLEGE, "col")
+    team_ids = [team["id"] for team in league["teams"]]
+    results = {}
+    for season in range(SEASONS):
+        for week in range(1, 19):
+            results[f"{2025 + season}-{week}"] = [
+                {
+                    "game_id": f"{2025 + season}-{week}|{team_ids[idx]}|{team_ids[-idx - 1]}",
+                    "week": f"{2025 + season}-{week}",
+                    "home": team_ids[idx],
+                    "away": team_ids[-idx - 1],
+                    "home_score": 17 + (idx * 7 + week) % 21,
+                    "away_score": 10 + (idx * 3 + week) % 24,
+                    "label": "Regular Season",
+                    "box_score": {"passing_yards": [231 + idx, 198 + week], "rushing_yards": [104, 87 + idx]},
+                }
+                for idx in range(16)
+            ]
+    league["results_by_week"] = results
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    standings = {
+        team_id: {"abbr": f"T{idx}", "W": 9, "L": 8, "T": 0, "PF": 380, "PA": 351, "victories": team_ids[:9], "opponents": team_ids[:17]}
+        for idx, team_id in enumerate(team_ids)
+    }
+    return path, results, standings
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def _row(label, path, write, read):
+    write_ms = _timed(write)
+    read_ms = _timed(read)
+    print(f"  {label:<6} write {write_ms:7.0f} ms   read {read_ms:6.0f} ms   size {os.path.getsize(path) / 1e6:6.2f} MB")
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    source, results, standings = _ten_season_league(directory)
+    codecs = (None,) + COMPRESSIONS
+
+    print("league.json (convert_save / read_save_payload)")
+    for codec in codecs:
+        path = os.path.join(directory, f"league-{codec}.json")
+        _row(str(codec), path, lambda: convert_save(source, path, codec), lambda: read_save_payload(path))
+
+    print("league.ggsave, per-section compression")
+    for codec in codecs:
+        path = os.path.join(directory, f"league-{codec}.ggsave")
+        _row(str(codec), path, lambda: convert_save(source, path, codec), lambda: read_save_payload(path))
+
+    print(f"results_by_week.json ({SEASONS} seasons)")
+    for codec in codecs:
+        path = os.path.join(directory, f"results-{codec}.json")
+        _row(str(codec), path, lambda: write_json(path, results, codec), lambda: read_json(path))
+
+    print(f"standings_{{year}}.json x {SEASONS}")
+    for codec in codecs:
+        paths = [os.path.join(directory, f"standings_{2025 + year}-{codec}.json") for year in range(SEASONS)]
+
+        def write():
+            for path in paths:
+                write_json(path, standings, codec)
+
+        def read():
+            for path in paths:
+                read_json(path)
+
+        write_ms, read_ms = _timed(write), _timed(read)
+        size = sum(os.path.getsize(path) for path in paths)
+        print(f"  {str(codec):<6} write {write_ms:7.0f} ms   read {read_ms:6.0f} ms   size {size / 1e6:6.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Wall time of one apply_season_progression pass over a league-sized player pool.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_season_progression.py [players]
+"""
+import contextlib
+import datetime
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.systems.player.season_progression import apply_season_progression
+
+_POSITIONS = ("QB", "RB", "WR", "TE", "LT", "LG", "C", "RG", "RT", "DE", "DT", "LB", "CB", "S", "K", "P")
+
+
+def _league(players):
+    random.seed(7)
+    league = LeagueManager()
+    league.base_seed = 2025
+    for idx in range(players):
+        league.free_agents.append(
+            Player(
+                name=f"Player {idx}",
+                position=_POSITIONS[idx % len(_POSITIONS)],
+                age=random.randint(21, 38),
+                dob=datetime.date(2000, 1, 1),
+                college="U",
+                birth_location="USA",
+                jersey_number=idx % 99 + 1,
+                overall=random.randint(55, 90),
+            )
+        )
+    return league
+
+
+def main(players=2500, seasons=3):
+    with contextlib.redirect_stdout(io.StringIO()):
+        league = _league(players)
+    start = time.perf_counter()
+    for season in range(seasons):
+        apply_season_progression(league, 2025 + season)
+    elapsed = (time.perf_counter() - start) / seasons
+    print(f"{players} players: {elapsed * 1000:.1f} ms per season progression pass")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2500)
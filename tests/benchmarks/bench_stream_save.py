@@ -0,0 +1,60 @@
+"""Full JSON save: building to_dict and json.dump vs the streaming writer.
+
+Reports wall time and the peak memory allocated while saving (tracemalloc).
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_stream_save.py
+"""
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
+from gridiron_gm_pkg.simulation.persistence.savegame import SCHEMA_VERSION, save_league
+
+
+def _measure(fn):
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed * 1000, peak / 1e6
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    with contextlib.redirect_stdout(io.StringIO()):
+        facade = GameFacade(save_name=os.path.join(directory, "save"))
+        facade.new_game()
+    league = facade.league
+    path = os.path.join(directory, "league.json")
+
+    def dict_dump():
+        payload = {"schema_version": SCHEMA_VERSION, "league": league.to_dict()}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2)
+
+    rows = [
+        ("to_dict + json.dump(indent=2)", dict_dump),
+        ("streamed, indent=2", lambda: save_league(path, league)),
+        ("streamed, compact", lambda: save_league(path, league, compact=True)),
+    ]
+    for label, fn in rows:
+        ms, peak = _measure(fn)
+        print(f"{label}: {ms:.0f} ms, peak {peak:.1f} MB, file {os.path.getsize(path) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
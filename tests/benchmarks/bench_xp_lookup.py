@@ -0,0 +1,57 @@
+"""rating_from_xp / ratings_from_xp against bisecting the XP table.
+
+Run from the repository root:
+
+    python tests/benchmarks/bench_xp_lookup.py
+"""
+import bisect
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+
+from gridiron_gm_pkg.simulation.systems.player.attribute_xp import (
+    XP_TABLE,
+    _XP_TABLE_ARRAY,
+    rating_from_xp,
+    ratings_from_xp,
+)
+
+
+def _per_call(fn, values, repeats=5):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for value in values:
+            fn(value)
+    return (time.perf_counter() - start) / (repeats * len(values)) * 1e9
+
+
+def main():
+    rng = np.random.default_rng(7)
+    xp = rng.integers(0, 1_000_001, size=200_000)
+    scalars = [int(v) for v in xp[:50_000]]
+
+    bisect_ns = _per_call(lambda v: bisect.bisect_right(XP_TABLE, v) - 1, scalars)
+    clamped_ns = _per_call(
+        lambda v: max(0, min(99, bisect.bisect_right(XP_TABLE, max(0, min(1_000_000, v))) - 1)), scalars
+    )
+    lookup_ns = _per_call(rating_from_xp, scalars)
+    print(f"scalar: bisect {bisect_ns:.0f} ns/call, clamped bisect {clamped_ns:.0f} ns/call")
+    print(f"        rating_from_xp {lookup_ns:.0f} ns/call ({clamped_ns / lookup_ns:.2f}x the clamped bisect)")
+
+    start = time.perf_counter()
+    for _ in range(20):
+        np.searchsorted(_XP_TABLE_ARRAY, xp, side="right") - 1
+    search_ms = (time.perf_counter() - start) / 20 * 1000
+    start = time.perf_counter()
+    for _ in range(20):
+        ratings_from_xp(xp)
+    table_ms = (time.perf_counter() - start) / 20 * 1000
+    print(f"vector ({len(xp)} totals): searchsorted {search_ms:.2f} ms, ratings_from_xp {table_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+import copy
+import datetime
+import json
+
+import numpy as np
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import AttributeSet, Player
+from gridiron_gm_pkg.simulation.systems.player.attribute_store import AttributeStore, StoredAttributeSet
+from gridiron_gm_pkg.simulation.systems.player.attribute_xp import apply_weekly_decay
+from gridiron_gm_pkg.simulation.systems.player.season_progression import apply_season_progression
+
+
+def _player(name: str, position: str = "RB", age: int = 25) -> Player:
+    return Player(
+        name=name,
+        position=position,
+        age=age,
+        dob=datetime.date(2000, 1, 1),
+        college="U",
+        birth_location="USA",
+        jersey_number=1,
+        overall=70,
+    )
+
+
+def _payload(player: Player) -> str:
+    return json.dumps(player.to_dict(), sort_keys=True)
+
+
+def test_attached_players_round_trip_through_to_dict_unchanged():
+    players = [_player(f"P{idx}", position) for idx, position in enumerate(["QB", "P", "WR", "K"] * 5)]
+    players[0].attributes.core["discipline"] = None
+    players[4].attributes.core["discipline"] = True
+    expected = [_payload(player) for player in players]
+
+    store = AttributeStore(capacity=2)
+    assert store.attach_all(players) == len(players)
+    assert all(isinstance(player.attributes, StoredAttributeSet) for player in players)
+    assert [_payload(player) for player in players] == expected
+    assert players[0].attributes.core["discipline"] is None
+    assert players[4].attributes.core["discipline"] is True
+
+    restored = Player.from_dict(players[1].to_dict())
+    assert isinstance(restored.attributes, AttributeSet)
+    assert restored.to_dict()["attributes"] == players[1].to_dict()["attributes"]
+
+    speed = players[2].speed
+    clone = copy.deepcopy(players[2])
+    assert isinstance(clone.attributes, AttributeSet)
+    clone.attributes.core["speed"] = speed + 1
+    assert players[2].speed == speed
+
+    store.detach(players[3])
+    assert isinstance(players[3].attributes, AttributeSet)
+    assert _payload(players[3]) == expected[3]
+    assert len(store) == len(players) - 1
+
+
+def test_views_write_through_to_columns():
+    players = [_player(f"P{idx}") for idx in range(6)]
+    store = AttributeStore()
+    store.attach_all(players)
+
+    players[2].speed = 88
+    players[4].attributes.core["speed"] = 41
+    speed = store.column("speed", store.slots(players))
+    assert speed[2] == 88 and speed[4] == 41
+    assert list(speed) == [player.speed for player in players]
+
+    ratings = store.ratings(["speed", "agility"], store.slots(players[:2]))
+    assert ratings.shape == (2, 2)
+    assert ratings[1, 1] == players[1].agility
+
+    overalls = store.overalls(store.slots(players))
+    assert [int(value) for value in overalls] == [player._compute_overall() for player in players]
+
+
+def test_store_normalize_matches_player_normalize():
+    players = [_player(f"P{idx}", position) for idx, position in enumerate(["QB", "P", "CB"] * 4)]
+    for idx, player in enumerate(players):
+        player.attributes.core["speed"] = 100 + idx * 0.5
+        player.attributes.core["agility"] = -3
+        player.attributes.core["discipline"] = idx % 2 == 0
+        player.pot = 10
+    plain = copy.deepcopy(players)
+    store = AttributeStore()
+    store.attach_all(players)
+
+    for player in plain:
+        player.normalize_ratings()
+    assert store.normalize() == len(players)
+    assert [_payload(player) for player in players] == [_payload(player) for player in plain]
+
+
+def test_league_scans_give_same_results_with_store():
+    players = [_player(f"V{idx}", age=33 + idx % 6) for idx in range(10)]
+    players += [_player(f"Y{idx}", age=21 + idx % 3) for idx in range(10)]
+    plain, stored, lazy = LeagueManager(), LeagueManager(), LeagueManager()
+    plain.attribute_store = None
+    plain.base_seed = stored.base_seed = lazy.base_seed = 5
+    plain.free_agents = players
+    stored.free_agents = copy.deepcopy(players)
+    lazy.free_agents = copy.deepcopy(players)
+    store = stored.enable_attribute_store()
+    assert len(store) == len(players)
+    assert len(lazy.attribute_store) == 0
+
+    for league in (plain, stored, lazy):
+        for week in range(1, 6):
+            apply_weekly_decay(league, year=2030, week=week)
+        apply_season_progression(league, 2030)
+
+    assert len(lazy.attribute_store) == len(players)
+    for a, b, c in zip(plain.free_agents, stored.free_agents, lazy.free_agents):
+        assert isinstance(b.attributes, StoredAttributeSet)
+        assert isinstance(c.attributes, StoredAttributeSet)
+        assert json.dumps(a.to_dict(), sort_keys=True) == json.dumps(b.to_dict(), sort_keys=True)
+        assert json.dumps(a.to_dict(), sort_keys=True) == json.dumps(c.to_dict(), sort_keys=True)
+    slots = store.slots(stored.free_agents)
+    assert np.array_equal(store.overalls(slots), [player.overall for player in stored.free_agents])
@@ -1,15 +1,24 @@
+import bisect
 import datetime
 
+import numpy as np
+
 from gridiron_gm_pkg.simulation.entities.league import LeagueManager
 from gridiron_gm_pkg.simulation.entities.player import Player
 from gridiron_gm_pkg.simulation.entities.team import Team
 from gridiron_gm_pkg.simulation.systems.player.attribute_xp import (
     XP_TABLE,
+    _counter_uniform,
+    _derive_seed,
+    _gather_decay_rows,
+    _weekly_decay_losses,
     add_xp,
     apply_weekly_decay,
     rating_from_xp,
+    ratings_from_xp,
     weekly_decay_xp,
     xp_at_value,
+    xp_at_values,
 )
 
 
@@ -112,3 +121,73 @@ def test_dna_caps_are_respected():
     player.hidden_caps[attr] = cap
     add_xp(player, attr, 1_000_000)
     assert player.attributes.core[attr] <= cap
+
+
+class _FixedUniform:
+    def __init__(self, value):
+        self.value = value
+
+    def uniform(self, low, high):
+        return self.value
+
+
+def test_vectorized_decay_matches_scalar_formula_and_counter_rng():
+    players = []
+    for idx, age in enumerate((24, 31, 33, 36, 40)):
+        player = _make_player(position=("RB", "QB", "WR", "LT", "CB")[idx])
+        player.age = age
+        players.append(player)
+    base_seed = 77
+    token = "2025-W9"
+
+    rows, arrays = _gather_decay_rows(players, token, base_seed)
+    losses = _weekly_decay_losses(arrays)
+
+    assert rows
+    assert all(player.age >= 30 for player, _ in rows)
+    for (player, attr), loss in zip(rows, losses):
+        key = _derive_seed(base_seed, f"decay|{token}|{player.id}|{attr}")
+        jitter = float(_counter_uniform(np.array([key], dtype=np.uint64), 0.9, 1.1)[0])
+        assert 0.9 <= jitter < 1.1
+        assert loss == weekly_decay_xp(player, attr, rng=_FixedUniform(jitter))
+
+
+def test_weekly_decay_writes_back_xp_and_ratings():
+    league = LeagueManager()
+    team = Team("XP Team", "City", "XPT")
+    player = _make_player()
+    player.age = 40
+    attr = "speed"
+    player.dna.attribute_caps[attr]["hard_cap"] = 99
+    player.attributes.core[attr] = 50
+    player.attribute_xp[attr] = xp_at_value(50)
+    team.add_player(player)
+    league.add_team(team)
+
+    weeks = 0
+    while player.attributes.core[attr] == 50:
+        weeks += 1
+        xp_before = player.attribute_xp[attr]
+        assert apply_weekly_decay(league, year=2025, week=weeks)
+        assert player.attribute_xp[attr] < xp_before
+        assert weeks < 60
+    assert player.attributes.core[attr] == rating_from_xp(player.attribute_xp[attr]) == 49
+
+
+def test_xp_lookup_tables_match_bisect_over_full_range():
+    def reference(xp_total):
+        return max(0, min(99, bisect.bisect_right(XP_TABLE, max(0, min(1_000_000, xp_total))) - 1))
+
+    assert isinstance(XP_TABLE, tuple)
+    edges = [xp + offset for xp in XP_TABLE for offset in (-1, 0, 1)] + [-50, 1_000_050]
+    assert [rating_from_xp(xp) for xp in edges] == [reference(xp) for xp in edges]
+    assert [xp_at_value(rating) for rating in range(100)] == list(XP_TABLE)
+    assert list(xp_at_values(range(-2, 102))) == [xp_at_value(rating) for rating in range(-2, 102)]
+
+    every_xp = np.arange(0, 1_000_001, dtype=np.int64)
+    expected = np.searchsorted(np.asarray(XP_TABLE), every_xp, side="right") - 1
+    assert np.array_equal(ratings_from_xp(every_xp), expected)
+    assert list(ratings_from_xp([-5.0, 150.4, 2e6])) == [0, rating_from_xp(150), 99]
+
+    samples = range(0, 1_000_001, 37)
+    assert [rating_from_xp(xp) for xp in samples] == [reference(xp) for xp in samples]
@@ -0,0 +1,138 @@
+import datetime
+import json
+import threading
+import urllib.request
+
+from gridiron_gm_pkg.api.autosave import AutosaveWorker
+from gridiron_gm_pkg.api.rpc_server import RpcServer
+from gridiron_gm_pkg.api.server import _Handler, make_server
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.team import Team
+from gridiron_gm_pkg.simulation.facade.game_facade import GameFacade
+from gridiron_gm_pkg.simulation.persistence.savegame import load_league, snapshot_league
+
+
+class _LeagueOnlyFacade:
+    """The two GameFacade hooks AutosaveWorker uses, for a hand-built league."""
+
+    def __init__(self, league):
+        self.league = league
+        self.snapshots = 0
+
+    def note_save(self, scoped=False):
+        self.league.mark_dirty()
+
+    def snapshot_save(self, path):
+        self.snapshots += 1
+        return snapshot_league(path, self.league)
+
+
+def _league():
+    league = LeagueManager()
+    team = Team("Testers", "City", "TST")
+    league.add_team(team)
+    team.add_player(
+        Player(
+            name="Tester One",
+            position="QB",
+            age=25,
+            dob=datetime.date(2000, 1, 1),
+            college="U",
+            birth_location="USA",
+            jersey_number=12,
+            overall=75,
+        )
+    )
+    return league
+
+
+def test_worker_coalesces_a_burst_into_one_save(tmp_path):
+    facade = _LeagueOnlyFacade(_league())
+    lock = threading.Lock()
+    path = tmp_path / "league.json"
+    worker = AutosaveWorker(lambda: facade, str(path), lock, delay=0.5)
+
+    for number in range(10):
+        with lock:
+            facade.league.teams[0].roster[0].jersey_number = number
+            worker.request()
+    assert worker.pending and not path.exists()
+
+    assert worker.flush(timeout=10)
+    assert worker.saves == 1 and facade.snapshots == 1
+    assert load_league(path).teams[0].roster[0].jersey_number == 9
+    assert facade.league.dirty_chunks == set()
+
+    with lock:
+        facade.league.teams[0].roster[0].jersey_number = 42
+        worker.request()
+    assert worker.stop(timeout=10)
+    assert worker.saves == 2
+    assert load_league(path).teams[0].roster[0].jersey_number == 42
+
+
+def test_snapshot_is_independent_of_later_changes(tmp_path):
+    league = _league()
+    path = tmp_path / "league.json"
+    snapshot = snapshot_league(path, league)
+    assert all(isinstance(blob, bytes) for blob in snapshot.blobs.values())
+
+    league.teams[0].roster[0].jersey_number = 99
+    snapshot.write()
+    assert load_league(path).teams[0].roster[0].jersey_number == 12
+
+
+def test_rpc_autosave_runs_in_background_and_flushes(tmp_path):
+    path = tmp_path / "savegame.json"
+    rpc = RpcServer(save_path=str(path), parent_pid=0)
+    rpc.facade = GameFacade(save_name="unit_test_rpc_autosave")
+    rpc.facade.new_game()
+
+    status, _ = rpc.dispatch("POST", "/auto_fill_depth_chart", {})
+    assert status == 200
+    rpc.flush_autosave()
+    assert json.loads(path.read_text())["format"] == "delta"
+    assert rpc.autosave.saves == 1
+    assert not rpc.autosave.pending
+
+
+def _post_with_autosave(facade, path, route, payload):
+    """POST once to an autosaving HTTP server and return (response, worker) after it closes."""
+    server = make_server("127.0.0.1", 0, facade, str(path), autosave=True)
+    worker = server.RequestHandlerClass.autosave
+    host, port = server.server_address
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    request = urllib.request.Request(
+        f"http://{host}:{port}{route}",
+        data=json.dumps(payload).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=10) as resp:
+            response = json.loads(resp.read().decode("utf-8"))
+    finally:
+        server.shutdown()
+        server.server_close()  # joins the handler thread, so do_POST has returned
+    return response, worker
+
+
+def test_http_autosave_only_follows_successful_posts(tmp_path, monkeypatch):
+    # make_server configures the handler class; put it back for the other server tests.
+    for name in ("facade", "save_path", "autosave"):
+        monkeypatch.setattr(_Handler, name, getattr(_Handler, name))
+    path = tmp_path / "savegame.json"
+    facade = GameFacade(save_name=str(tmp_path / "save"))
+    facade.new_game()
+
+    failed, worker = _post_with_autosave(
+        facade, path, "/update_depth_chart", {"position": "QB", "player_id": "p_001", "action": "promote"}
+    )
+    assert failed["ok"] is False
+    assert not worker.pending
+    assert worker.stop(timeout=10) and worker.saves == 0 and not path.exists()
+
+    _, worker = _post_with_autosave(facade, path, "/auto_fill_depth_chart", {})
+    assert worker.stop(timeout=10)
+    assert worker.saves == 1
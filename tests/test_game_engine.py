@@ -0,0 +1,193 @@
+import copy
+import datetime
+import json
+import random
+
+import pytest
+
+from gridiron_gm_pkg.simulation.engine import game_engine
+from gridiron_gm_pkg.simulation.engine.game_engine import (
+    DETAIL_FULL_PBP,
+    DETAIL_STATS_ONLY,
+    DETAIL_SUMMARY,
+    PlayContext,
+    simulate_game,
+    simulate_pass_play,
+)
+from gridiron_gm_pkg.simulation.engine.penalty_engine import PenaltyProfileCache, simulate_penalty
+from gridiron_gm_pkg.simulation.engine.play_record import PlayRecord
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.team import Team
+
+_LINEUP = (
+    ("QB", 2), ("RB", 2), ("WR", 3), ("TE", 1),
+    ("LT", 1), ("LG", 1), ("C", 1), ("RG", 1), ("RT", 1),
+    ("DE", 2), ("DT", 2), ("LB", 3), ("CB", 2), ("S", 2),
+)
+
+
+def _make_team(abbr):
+    team = Team(f"{abbr} Team", f"{abbr} City", abbr)
+    number = 1
+    for position, count in _LINEUP:
+        for idx in range(count):
+            team.add_player(
+                Player(
+                    name=f"{abbr} {position}{idx + 1}",
+                    position=position,
+                    age=26,
+                    dob=datetime.date(2000, 1, 1),
+                    college="U",
+                    birth_location="USA",
+                    jersey_number=number,
+                    overall=70 + (number * 3) % 15,
+                )
+            )
+            number += 1
+    team.generate_depth_chart()
+    return team
+
+
+def _play(teams, detail_level, seed=11, play_record=None):
+    home, away = copy.deepcopy(teams)
+    random.seed(seed)
+    context = {"weather": None, "current_date": datetime.date(2025, 9, 7)}
+    home_stats, away_stats = simulate_game(home, away, context=context, detail_level=detail_level, play_record=play_record)
+    return home_stats, away_stats, random.random()
+
+
+def _without_log(stats):
+    return {key: value for key, value in stats.items() if key != "log"}
+
+
+def test_detail_levels_share_stats_and_rng_draws():
+    teams = (_make_team("HOM"), _make_team("AWY"))
+    full_home, full_away, full_next = _play(teams, DETAIL_FULL_PBP)
+    summary_home, summary_away, summary_next = _play(teams, DETAIL_SUMMARY)
+    fast_home, fast_away, fast_next = _play(teams, DETAIL_STATS_ONLY)
+
+    assert full_next == summary_next == fast_next
+    assert _without_log(full_home) == _without_log(summary_home) == _without_log(fast_home)
+    assert _without_log(full_away) == _without_log(summary_away) == _without_log(fast_away)
+    assert any(line.startswith("Play ") for line in full_home["log"])
+    assert summary_home["log"] and all(line.startswith("Drive summary:") for line in summary_home["log"])
+    assert fast_home["log"] == [] and fast_away["log"] == []
+
+
+def test_unknown_detail_level_is_rejected():
+    with pytest.raises(ValueError):
+        simulate_game(_make_team("HOM"), _make_team("AWY"), detail_level="verbose")
+
+
+def test_recorded_games_render_the_log_on_demand():
+    teams = (_make_team("HOM"), _make_team("AWY"))
+    text_home, text_away, text_next = _play(teams, DETAIL_FULL_PBP)
+    record = PlayRecord()
+    home_stats, away_stats, next_draw = _play(teams, DETAIL_FULL_PBP, play_record=record)
+
+    assert home_stats["log"] == [] and away_stats["log"] == []
+    assert _without_log(home_stats) == _without_log(text_home)
+    assert next_draw == text_next
+    assert record.render("HOM") == text_home["log"]
+    assert record.render("AWY") == text_away["log"]
+    chart = PlayRecord.from_dict(json.loads(json.dumps(record.to_dict()))).drive_chart()
+    assert chart == record.drive_chart()
+    assert {drive["team"] for drive in chart} == {"HOM", "AWY"}
+    assert sum(drive["points"] for drive in chart if drive["team"] == "HOM") == home_stats["points"]
+
+
+def test_play_record_renders_full_log_and_round_trips():
+    teams = (_make_team("HOM"), _make_team("AWY"))
+    home_stats, away_stats, _ = _play(teams, DETAIL_FULL_PBP, seed=23)
+    home_log, away_log = home_stats["log"], away_stats["log"]
+    records = {}
+    for detail_level in (DETAIL_FULL_PBP, DETAIL_STATS_ONLY):
+        records[detail_level] = PlayRecord()
+        _play(teams, detail_level, seed=23, play_record=records[detail_level])
+
+    record = records[DETAIL_FULL_PBP]
+    assert record.render("HOM") == home_log
+    assert record.render("AWY") == away_log
+    assert records[DETAIL_STATS_ONLY].to_dict() == record.to_dict()
+
+    decoded = PlayRecord.from_dict(json.loads(json.dumps(record.to_dict())))
+    assert decoded.render("HOM") == home_log
+    assert decoded.drive_chart() == record.drive_chart()
+    assert sum(drive["plays"] for drive in decoded.drive_chart()) > 0
+
+
+def test_shared_play_context_matches_per_snap_lookups():
+    teams = (_make_team("HOM"), _make_team("AWY"))
+
+    def run(shared):
+        home, away = copy.deepcopy(teams)
+        qb = home.depth_chart["QB"][0]
+        receivers = home.depth_chart["WR"]
+        context = {"offense": home, "defense": away, "weather": None, "game_injuries": []}
+        play_context = PlayContext(context) if shared else None
+        random.seed(5)
+        results = [
+            simulate_pass_play(qb, receivers, depth, context, play_context=play_context)
+            for depth in ("short", "medium", "deep") * 40
+        ]
+        return [(r["yards"], r["log"], r["seconds_burned"]) for r in results], random.random()
+
+    assert run(shared=True) == run(shared=False)
+
+
+def test_simulated_drives_resolve_speeds_through_the_play_context(monkeypatch):
+    resolved = []
+    resolve = game_engine.resolve_player_speed
+    monkeypatch.setattr(game_engine, "resolve_player_speed", lambda player: resolved.append(player) or resolve(player))
+    record = PlayRecord()
+    _play((_make_team("HOM"), _make_team("AWY")), DETAIL_FULL_PBP, play_record=record)
+    snaps = sum(1 for snap in record.snaps() if snap["play_type"])
+    # At most one lookup per player per drive instead of one per snap.
+    assert len(resolved) <= 4 * record.drive_count < snaps
+
+
+def test_penalty_profiles_rebuild_only_on_discipline_or_trait_change():
+    player = _make_team("PEN").depth_chart["LT"][0]
+    player.discipline = 60
+    cache = PenaltyProfileCache()
+
+    cache.begin_drive()
+    profile = cache.profile(player)
+    assert profile.player is player
+    assert profile.discipline_rating == 60
+    assert profile.traits == frozenset(player.traits)
+    with pytest.raises(AttributeError):
+        profile.discipline_rating = 99
+
+    cache.begin_drive()
+    assert cache.profile(player) is profile
+
+    player.discipline = 40
+    cache.begin_drive()
+    rebuilt = cache.profile(player)
+    assert rebuilt is not profile
+    assert rebuilt.discipline_rating == 40
+
+    # Traits are matched exactly as simulate_penalty matches player.traits.
+    player.traits = ["Hot-Headed"]
+    cache.begin_drive()
+    assert cache.profile(player).traits == frozenset({"Hot-Headed"})
+    assert len(cache) == 1
+
+
+@pytest.mark.parametrize("trait", ["Hot-Headed", "Disciplined"])
+@pytest.mark.parametrize("as_list", [False, True])
+def test_penalty_profiles_keep_trait_penalty_odds(trait, as_list):
+    player = _make_team("PEN").depth_chart["LT"][0]
+    player.discipline = 55
+    if as_list:
+        player.traits = [trait]
+    else:
+        player.add_trait("mental", trait)
+    profile = PenaltyProfileCache().profile(player)
+
+    def rolls(subject):
+        random.seed(31)
+        return [simulate_penalty(subject) for _ in range(4000)]
+
+    assert rolls(profile) == rolls(player)
@@ -0,0 +1,100 @@
+import datetime
+
+import pytest
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.team import Team
+from gridiron_gm_pkg.simulation.persistence.savegame import load_league, save_league
+from gridiron_gm_pkg.simulation.systems.player import injury_index
+from gridiron_gm_pkg.simulation.systems.player.injury_status import (
+    apply_simple_injury,
+    clear_injury_fields,
+    heal_if_due,
+    heal_league_players,
+)
+
+START = datetime.date(2030, 9, 1)
+
+
+def _player(name: str) -> Player:
+    return Player(
+        name=name,
+        position="LB",
+        age=26,
+        dob=datetime.date(2004, 1, 1),
+        college="U",
+        birth_location="USA",
+        jersey_number=50,
+        overall=70,
+    )
+
+
+def _league() -> LeagueManager:
+    league = LeagueManager()
+    team = Team("Testers", "City", "TST")
+    league.add_team(team)
+    for idx in range(8):
+        team.add_player(_player(f"R{idx}"))
+    league.free_agents = [_player(f"F{idx}") for idx in range(4)]
+    return league
+
+
+def test_index_heals_the_same_players_as_a_full_scan(monkeypatch):
+    monkeypatch.setattr(injury_index, "DEBUG_INJURY_INDEX", True)
+    league = _league()
+    players = league.teams[0].roster + league.free_agents
+    heal_league_players(league, START)
+    assert league.injury_index.built and len(league.injury_index) == 0
+
+    for idx, player in enumerate(players[:6]):
+        apply_simple_injury(player, START, 1 + idx * 3, "Sprain")
+    apply_simple_injury(players[0], START, 20, "Re-aggravated Sprain")
+    clear_injury_fields(players[1])
+    outsider = _player("Elsewhere")
+    apply_simple_injury(outsider, START, 1, "Sprain")
+    assert len(league.injury_index) == 6  # five league players and the outsider
+
+    day = START
+    for _ in range(25):
+        day += datetime.timedelta(days=1)
+        expected = sorted(p.name for p in players if p.injury_end_date and day >= p.injury_end_date)
+        before = {p.name for p in players if p.injury_end_date}
+        assert heal_league_players(league, day) == len(expected)
+        assert sorted(before - {p.name for p in players if p.injury_end_date}) == expected
+    assert all(p.injury_status == "healthy" for p in players)
+    assert outsider.injury_status == "questionable"
+    assert len(league.injury_index) == 0
+
+    players[2].injury_end_date = day
+    with pytest.raises(RuntimeError):
+        heal_league_players(league, day)
+    assert heal_if_due(players[2], day)
+
+
+def test_load_league_rebuilds_the_index(tmp_path):
+    league = _league()
+    player = league.free_agents[0]
+    apply_simple_injury(player, START, 9, "Concussion")
+    save_league(tmp_path / "league.json", league)
+
+    loaded = load_league(tmp_path / "league.json")
+    assert loaded.injury_index.built and len(loaded.injury_index) == 1
+    assert loaded.injury_index.verify(loaded) == []
+    assert heal_league_players(loaded, START + datetime.timedelta(days=8)) == 0
+    assert heal_league_players(loaded, START + datetime.timedelta(days=9)) == 1
+    assert loaded.free_agents[0].injury_status == "healthy"
+
+
+def test_legacy_add_injury_keeps_the_index_in_step():
+    league = _league()
+    heal_league_players(league, START)
+    player = league.teams[0].roster[0]
+    apply_simple_injury(player, START, 14, "Sprain")
+    assert len(league.injury_index) == 1
+
+    # A legacy injury with no duration has no end date, so it leaves the index.
+    player.add_injury("Mystery Ailment")
+    assert player.injury_status == "out" and player.injury_end_date is None
+    assert len(league.injury_index) == 0
+    assert league.injury_index.verify(league) == []
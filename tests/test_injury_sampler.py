@@ -0,0 +1,60 @@
+import datetime
+import random
+from collections import Counter
+from types import SimpleNamespace
+
+import numpy as np
+
+from gridiron_gm_pkg.config.injury_catalog import INJURY_CATALOG
+from gridiron_gm_pkg.simulation.systems.player.injury_sampler import AliasTable, InjurySampler, injury_sampler
+from gridiron_gm_pkg.simulation.systems.player.injury_status import assign_catalog_injury
+
+
+def test_unweighted_catalog_draws_match_uniform_choice():
+    legacy = [
+        (name, data)
+        for name, data in INJURY_CATALOG.items()
+        if data.get("injury_context", "on_field") in {"on_field", "either"}
+    ]
+    sampler = injury_sampler("game")
+    assert sampler.entries == legacy
+
+    ours, theirs = random.Random(11), random.Random(11)
+    for _ in range(500):
+        assert sampler.sample(ours, "QB") == theirs.choice(legacy)
+
+    player = SimpleNamespace(name="X", position="WR", injury_status="healthy")
+    payload = assign_catalog_injury(player, datetime.date(2030, 9, 8), context="off_field", rng=random.Random(3))
+    assert INJURY_CATALOG[payload["injury_name"]]["injury_context"] in {"off_field", "either"}
+    assert player.injury_end_date == datetime.date(2030, 9, 8) + datetime.timedelta(days=payload["duration_days"])
+
+
+def test_frequency_and_position_weights():
+    catalog = {
+        "Common": {"frequency": 6, "injury_context": "on_field"},
+        "Rare": {"frequency": 1, "injury_context": "either"},
+        "Throwing": {"frequency": 3, "position_weights": {"QB": 1, "K": 0}, "injury_context": "on_field"},
+        "Car Accident": {"injury_context": "off_field"},
+    }
+    sampler = InjurySampler(catalog, "practice")
+    assert [name for name, _ in sampler.entries] == ["Common", "Rare", "Throwing"]
+
+    table = AliasTable([6, 1, 3])
+    expected = np.array([0.6, 0.1, 0.3])
+    exact = np.zeros(3)
+    for idx in range(3):
+        exact[idx] += table.prob[idx] / 3
+        exact[table.alias[idx]] += (1 - table.prob[idx]) / 3
+    assert np.allclose(exact, expected)
+
+    rng = random.Random(5)
+    kicker = Counter(sampler.sample(rng, "K")[0] for _ in range(4000))
+    assert "Throwing" not in kicker
+    assert 5.0 < kicker["Common"] / kicker["Rare"] < 7.2
+
+    batch = sampler.sample_batch(["QB"] * 20000 + ["K"] * 100, np.random.default_rng(2))
+    assert len(batch) == 20100
+    assert all(name != "Throwing" for name, _ in batch[20000:])
+    counts = Counter(name for name, _ in batch[:20000])
+    assert abs(counts["Throwing"] / 20000 - 0.3) < 0.02
+    assert InjurySampler({}, "game").sample(rng) is None
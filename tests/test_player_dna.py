@@ -163,3 +163,69 @@ def test_dna_long_term_progression(tmp_path):
             writer.writerow(row)
 
     assert csv_file.exists() and csv_file.stat().st_size > 0
+
+
+def test_lazy_dna_fields_match_eager_materialization_in_any_order():
+    from gridiron_gm_pkg.simulation.systems.player.player_dna import LAZY_FIELDS
+    import copy
+    import pickle
+
+    random.seed(7)
+    dna = PlayerDNA()
+    assert not any(dna.is_materialized(name) for name in LAZY_FIELDS)
+    assert set(dna.to_dict()).isdisjoint(LAZY_FIELDS)
+
+    eager = PlayerDNA.from_dict(dna.to_dict()).materialize()
+    lazy = pickle.loads(pickle.dumps(copy.deepcopy(dna)))
+    for name in reversed(LAZY_FIELDS):
+        getattr(lazy, name)
+    assert lazy.to_dict() == eager.to_dict()
+    assert len(eager.career_arc) == 20
+
+    dna.mutations = [MutationType.BuiltToLast]
+    saved = dna.to_dict()
+    assert saved["mutations"] == ["BuiltToLast"] and "career_arc" not in saved
+    assert PlayerDNA.from_dict(saved).career_arc == eager.career_arc
+
+
+def test_legacy_dna_payload_without_seed_loads_as_before():
+    dna = PlayerDNA().materialize()
+    legacy = dna.to_dict()
+    del legacy["seed"]
+    clone = PlayerDNA.from_dict(legacy)
+    assert clone.seed is None
+    assert clone.to_dict() == dict(legacy, seed=None)
+
+
+def test_seeded_dna_values_are_pinned():
+    # Lazy DNA draws fewer values from the global RNG than the old eager
+    # __post_init__ did, so seeded leagues changed once; keep them fixed now.
+    random.seed(2024)
+    dna = PlayerDNA.generate_random_dna("QB", is_college=True)
+
+    assert dna.seed == 1052982742
+    assert (dna.rise_duration, dna.prime_duration, dna.fall_duration) == (4, 3, 13)
+    assert (dna.peak_value, dna.stability, dna.dev_speed) == (0.96, 0.022, 0.763)
+    assert dna.traits == ["Resilient", "System Dependent"]
+    assert random.random() == 0.6445511519170969
+
+    assert [round(x, 4) for x in dna.career_arc[:6]] == [0.0, 0.1848, 0.5226, 0.96, 0.9412, 0.9891]
+    assert {k: round(v, 4) for k, v in dna.dev_focus.items()} == {
+        "physical": 0.286,
+        "mental": 0.3966,
+        "technical": 0.3173,
+    }
+    assert dna.mutations == []
+    caps = {attr: (c["current"], c["soft_cap"], c["hard_cap"]) for attr, c in dna.attribute_caps.items()}
+    assert list(caps.items())[:4] == [
+        ("speed", (77, 80, 83)),
+        ("acceleration", (77, 78, 80)),
+        ("agility", (67, 71, 73)),
+        ("strength", (79, 84, 87)),
+    ]
+    assert list(dna.scouted_caps.items())[:4] == [
+        ("speed", 80),
+        ("acceleration", 80),
+        ("agility", 75),
+        ("strength", 97),
+    ]
@@ -44,3 +44,52 @@ def test_potential_round_trip():
     data = player.to_dict()
     loaded = Player.from_dict(data)
     assert loaded.potential == 91
+
+
+def test_effective_attribute_cache_hits_until_invalidated():
+    player = _make_player()
+    player.speed = 80
+    Player.reset_attribute_cache_stats()
+
+    assert player.get_effective_attribute("speed") == 80
+    assert player.get_effective_attribute("speed") == 80
+    assert Player.attribute_cache_stats == {"hits": 1, "misses": 1}
+
+    player.active_injury_effects = {"speed": -5}
+    assert player.get_effective_attribute("speed") == 75
+    player.speed = 90
+    assert player.get_effective_attribute("speed") == 85
+    player.attributes.core["speed"] = 60
+    player.normalize_ratings()
+    assert player.get_effective_attribute("speed") == 55
+
+    version = player.attribute_version
+    player.injury_status = "out"
+    player.position = "RB"
+    assert player.attribute_version == version + 2
+    player.fatigue = 0.95
+    assert player.attribute_version == version + 2
+    assert player.get_effective_attribute("speed") == 55
+    assert player.get_effective_attribute("speed") == 55
+    # 5 effective-attribute misses plus the overall recomputed by normalize_ratings
+    assert Player.attribute_cache_stats == {"hits": 2, "misses": 6}
+
+
+def test_overall_is_memoized_between_rating_changes():
+    from gridiron_gm_pkg.simulation.systems.player.attribute_xp import add_xp, xp_at_value
+
+    player = _make_player()
+    Player.reset_attribute_cache_stats()
+    # normalize_ratings already computed it during construction
+    assert player._compute_overall() == player.overall
+    assert Player.attribute_cache_stats == {"hits": 1, "misses": 0}
+    player.invalidate_attribute_cache()
+    assert player._compute_overall() == player.overall
+    assert player._compute_overall() == player.overall
+    assert Player.attribute_cache_stats == {"hits": 2, "misses": 1}
+
+    player.attributes.core["speed"] = 50
+    player.attribute_xp["speed"] = xp_at_value(50)
+    add_xp(player, "speed", xp_at_value(99))
+    assert player.get_effective_attribute("speed") == player.speed > 50
+    assert player._compute_overall() == player.overall
@@ -0,0 +1,156 @@
+import datetime
+import json
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.prospect import Prospect
+from gridiron_gm_pkg.simulation.entities.team import Team
+from gridiron_gm_pkg.simulation.persistence.savegame import load_league, save_league
+from gridiron_gm_pkg.simulation.rules.transactions import draft_prospect
+from gridiron_gm_pkg.simulation.systems.player.injury_status import (
+    apply_simple_injury,
+    heal_league_players,
+    iter_league_players,
+)
+from gridiron_gm_pkg.simulation.systems.player.attribute_xp import apply_weekly_decay
+from gridiron_gm_pkg.simulation.systems.player.season_progression import apply_season_progression
+
+
+def _payload(name: str, position: str = "WR", age: int = 21) -> dict:
+    player = Player(
+        name=name,
+        position=position,
+        age=age,
+        dob=datetime.date(2004, 3, 3),
+        college="State",
+        birth_location="USA",
+        jersey_number=8,
+        overall=62,
+        is_college=True,
+    )
+    return player.to_dict()
+
+
+def test_prospect_round_trips_payload_and_packs_ratings():
+    payload = _payload("Prospect One", "QB")
+    payload["attributes"]["core"]["discipline"] = None
+    record = Prospect.from_dict(payload)
+
+    assert record._ratings is not None and record._mirror
+    assert json.dumps(record.to_dict()) == json.dumps(payload)
+    assert record.get_all_attributes() == {**payload["attributes"]["core"], **payload["attributes"]["position_specific"]}
+    assert not hasattr(record, "__dict__")
+    assert record._dna is None
+    assert record.dna.to_dict() == payload["dna"]
+
+    odd = dict(payload, attributes={"core": {"speed": 70.5}, "position_specific": {}})
+    assert Prospect.from_dict(odd).to_dict() == odd
+
+
+def test_league_loads_prospects_compactly_and_promotes_on_demand():
+    league = LeagueManager()
+    league.draft_prospects = [_payload("Draftee"), _payload("Other")]
+    league.college_db = [_payload("Sophomore", age=19)]
+    data = {
+        "teams": [],
+        "draft_prospects": league.draft_prospects,
+        "college_db": league.college_db,
+    }
+
+    loaded = LeagueManager.from_dict(data)
+    assert all(isinstance(p, Prospect) for p in loaded.draft_prospects + loaded.college_db)
+    assert list(iter_league_players(loaded)) == []
+    saved = loaded.to_dict()
+    assert saved["draft_prospects"] == data["draft_prospects"]
+    assert saved["college_db"] == data["college_db"]
+
+    record = loaded.draft_prospects[0]
+    player = loaded.promote_prospect(record.id)
+    assert isinstance(player, Player)
+    assert loaded.draft_prospects[0] is player
+    assert player.id == record.id and player.name == "Draftee"
+    assert player.get_all_attributes() == record.get_all_attributes()
+    assert list(iter_league_players(loaded)) == [player]
+
+    apply_season_progression(loaded, 2030)
+    assert player.age == 22
+    assert loaded.draft_prospects[1].age == 22
+    assert loaded.college_db[0].age == 20
+
+
+def test_reloaded_prospects_develop_like_fresh_ones(tmp_path):
+    fresh = LeagueManager()
+    fresh.base_seed = 17
+    fresh.draft_prospects = [
+        Player.from_dict(_payload(f"Draftee {idx}", position, age))
+        for idx, (position, age) in enumerate((("QB", 21), ("RB", 22), ("LB", 31)))
+    ]
+    fresh.college_db = [Player.from_dict(_payload("Freshman", "CB", 18))]
+    path = tmp_path / "league.json"
+    save_league(path, fresh)
+    loaded = load_league(path)
+    assert all(isinstance(p, Prospect) for p in loaded.draft_prospects + loaded.college_db)
+
+    def advance(league):
+        for week in range(1, 5):
+            apply_weekly_decay(league, 2030, week, datetime.date(2030, 9, week * 7))
+        apply_season_progression(league, 2031)
+        return [
+            (player.age, player.get_all_attributes(), player.attribute_xp, player.retired)
+            for player in league.draft_prospects + league.college_db
+        ]
+
+    before = [player.get_all_attributes() for player in fresh.draft_prospects + fresh.college_db]
+    expected = advance(fresh)
+    assert advance(loaded) == expected
+    assert [player.get_all_attributes() for player in fresh.draft_prospects + fresh.college_db] != before
+
+
+def test_injured_prospects_load_as_players_and_heal():
+    payload = _payload("Hurt")
+    payload.update(
+        injury_status="out",
+        injury_name="Sprain",
+        injury_start_date="2030-04-01",
+        injury_end_date="2030-04-10",
+    )
+    loaded = LeagueManager.from_dict({"teams": [], "draft_prospects": [payload, _payload("Fine")]})
+    hurt, fine = loaded.draft_prospects
+    assert isinstance(hurt, Player) and isinstance(fine, Prospect)
+
+    loaded.injury_index.rebuild(loaded)
+    assert heal_league_players(loaded, datetime.date(2030, 4, 11)) == 1
+    assert hurt.injury_status == "healthy"
+
+
+def test_drafted_prospect_joins_the_roster_and_heals():
+    start = datetime.date(2030, 4, 25)
+    payload = _payload("Injured Draftee")
+    carrier = Player.from_dict(payload)
+    apply_simple_injury(carrier, start, 10, "Hamstring")
+    league = LeagueManager.from_dict({"teams": [], "draft_prospects": [carrier.to_dict(), _payload("Other")]})
+    team = Team("Drafters", "City", "DRF")
+    league.add_team(team)
+    assert heal_league_players(league, start) == 0  # builds the injury index without the record
+
+    record = league.draft_prospects[0]
+    result = draft_prospect(league, team.id, record.id)
+    assert result["ok"] and result["transaction"]["action"] == "draft"
+    player = team.roster[-1]
+    assert isinstance(player, Player) and player.id == record.id
+    assert [p.name for p in league.draft_prospects] == ["Other"]
+    assert league.rating_index.players_at(team, ["WR"]) == [player]
+    assert player not in league.rating_index.healthy_players(team)
+
+    assert heal_league_players(league, start + datetime.timedelta(days=9)) == 0
+    assert heal_league_players(league, start + datetime.timedelta(days=10)) == 1
+    assert player.injury_status == "healthy"
+    assert league.injury_index.verify(league) == []
+
+
+def test_prospects_among_free_agents_are_promoted():
+    league = LeagueManager()
+    league.free_agents = [Prospect.from_dict(_payload("Walk-on"))]
+    players = list(iter_league_players(league))
+    assert len(players) == 1 and isinstance(players[0], Player)
+    assert league.free_agents[0] is players[0]
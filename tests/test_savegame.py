@@ -5,7 +5,20 @@ from pathlib import Path
 from gridiron_gm_pkg.simulation.entities.league import LeagueManager
 from gridiron_gm_pkg.simulation.entities.player import Player
 from gridiron_gm_pkg.simulation.entities.team import Team
-from gridiron_gm_pkg.simulation.persistence.savegame import load_league, save_league
+from gridiron_gm_pkg.simulation.persistence.binary_save import is_binary_save
+from gridiron_gm_pkg.simulation.persistence.compression import detect_compression
+from gridiron_gm_pkg.simulation.persistence.json_stream import StreamDict, StreamList, iter_json
+from gridiron_gm_pkg.simulation.persistence.savegame import (
+    _read_delta,
+    chunk_dir,
+    SCHEMA_VERSION,
+    convert_save,
+    load_league,
+    read_save_payload,
+    save_league,
+    team_chunk,
+)
+from gridiron_gm_pkg.simulation.utils.lazy_sections import has_pending_sections
 
 
 def _build_league():
@@ -115,3 +128,292 @@ def test_savegame_preserves_calendar_state_across_major_phases():
         assert loaded.calendar.season_year == league.calendar.season_year
         assert loaded.calendar.football_week == week
         assert loaded.calendar.season_phase == phase
+
+
+def _chunk_files(path):
+    return {p.name for p in chunk_dir(path).iterdir()}
+
+
+def test_delta_save_round_trips_like_a_full_save():
+    league = _build_league()
+    league.calendar.current_date = datetime.date(2028, 2, 29)
+    league.inboxes = {}
+    full_path = _local_test_path("full.json")
+    delta_path = _local_test_path("delta.json")
+    save_league(full_path, league)
+    save_league(delta_path, league, delta=True)
+
+    manifest = json.loads(delta_path.read_text())
+    assert manifest["format"] == "delta"
+    assert manifest["teams"] == [team_chunk(league.teams[0])]
+    full = json.loads(full_path.read_text())
+    assert _read_delta(delta_path, manifest) == full
+    assert load_league(delta_path).calendar.current_date == datetime.date(2028, 2, 29)
+
+
+def test_delta_save_rewrites_only_dirty_chunks():
+    league = _build_league()
+    second = Team("Others", "Town", "OTH")
+    league.add_team(second)
+    path = _local_test_path("delta_dirty.json")
+    save_league(path, league, delta=True)
+    before = _chunk_files(path)
+
+    league.teams[0].roster[0].jersey_number = 90
+    second.team_name = "Renamed"
+    league.mark_dirty(team_chunk(second))
+    save_league(path, league, delta=True)
+    after = _chunk_files(path)
+    changed = sorted(name.split(".")[0] for name in after - before)
+    assert changed == [team_chunk(second)]
+    assert len(after) == len(before)
+
+    loaded = load_league(path)
+    assert loaded.teams[1].team_name == "Renamed"
+    assert loaded.teams[0].roster[0].jersey_number == 12  # never marked dirty
+
+    league.mark_dirty()
+    save_league(path, league, delta=True)
+    assert load_league(path).teams[0].roster[0].jersey_number == 90
+    assert len(_chunk_files(path)) == len(before)
+
+
+def test_changes_mark_only_the_chunks_they_touch():
+    league = _build_league()
+    second = Team("Others", "Town", "OTH")
+    league.add_team(second)
+    path = _local_test_path("delta_marks.json")
+    save_league(path, league, delta=True)
+    assert league.dirty_chunks == set()
+
+    starter = league.teams[0].roster[0]
+    starter.jersey_number = 90
+    starter.attributes.core["speed"] = 91
+    starter.normalize_ratings()
+    assert league.dirty_chunks == {team_chunk(league.teams[0])}
+
+    save_league(path, league, delta=True)
+    signee = league.free_agents[0]
+    second.add_player(signee)
+    signee.normalize_ratings()
+    assert league.dirty_chunks == {team_chunk(second)}
+
+    save_league(path, league, delta=True)
+    loaded = load_league(path)
+    assert loaded.teams[0].roster[0].jersey_number == 90
+    assert [p.name for p in loaded.teams[1].roster] == ["Free Agent"]
+
+
+def test_delta_chunks_keep_similar_team_ids_apart():
+    league = _build_league()
+    twin = Team("Twins", "Town", "TWN")
+    league.add_team(twin)
+    league.teams[0].id, twin.id = "a/b", "ab"
+    assert team_chunk(league.teams[0]) != team_chunk(twin)
+
+    path = _local_test_path("delta_ids.json")
+    save_league(path, league, delta=True)
+    loaded = load_league(path)
+    assert [team.team_name for team in loaded.teams] == ["Testers", "Twins"]
+
+
+def test_full_save_removes_old_delta_chunks():
+    league = _build_league()
+    path = _local_test_path("delta_then_full.json")
+    save_league(path, league, delta=True)
+    assert chunk_dir(path).is_dir()
+
+    save_league(path, league)
+    assert not chunk_dir(path).exists()
+    assert load_league(path).teams[0].team_name == "Testers"
+
+
+def test_streamed_save_matches_json_dump():
+    league = _build_league()
+    league.results_by_week = {"1": [{"home": "TST", "score": [21, 14]}]}
+    expected = {"schema_version": SCHEMA_VERSION, "league": league.to_dict()}
+    path = _local_test_path("streamed.json")
+
+    save_league(path, league)
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, indent=2)
+    save_league(path, league, compact=True)
+    assert path.read_text(encoding="utf-8") == json.dumps(expected, separators=(",", ":"))
+
+    document = StreamDict([("empty", StreamList(())), ("rows", StreamList([{"a": [1, {}]}, StreamDict([])]))])
+    plain = {"empty": [], "rows": [{"a": [1, {}]}, {}]}
+    assert "".join(iter_json(document)) == json.dumps(plain, indent=2)
+    assert "".join(iter_json(document, indent=None)) == json.dumps(plain, separators=(",", ":"))
+
+
+def test_binary_save_converts_losslessly():
+    league = _build_league()
+    league.results_by_week = {"1": [{"home": "TST", "score": [21, 14]}]}
+    json_path = _local_test_path("convert.json")
+    binary_path = _local_test_path("convert.ggsave")
+    back_path = _local_test_path("convert_back.json")
+    save_league(json_path, league)
+
+    convert_save(json_path, binary_path)
+    convert_save(binary_path, back_path)
+    assert is_binary_save(binary_path) and not is_binary_save(json_path)
+    assert back_path.read_text(encoding="utf-8") == json_path.read_text(encoding="utf-8")
+
+    legacy_path = _local_test_path("convert_v0.json")
+    legacy_path.write_text(json.dumps({"teams": [], "free_agents": []}), encoding="utf-8")
+    convert_save(legacy_path, binary_path)
+    convert_save(binary_path, back_path)
+    assert json.loads(back_path.read_text(encoding="utf-8")) == {
+        "schema_version": 1,
+        "league": {"teams": [], "free_agents": []},
+    }
+
+
+def test_binary_save_loads_sections_lazily():
+    league = _build_league()
+    league.calendar.current_date = datetime.date(2028, 2, 29)
+    path = _local_test_path("lazy.ggsave")
+    save_league(path, league)
+
+    loaded = load_league(path)
+    team = loaded.teams[0]
+    assert loaded.calendar.current_date == datetime.date(2028, 2, 29)
+    assert team.team_name == "Testers"
+    assert has_pending_sections(team) and has_pending_sections(loaded)
+
+    # Saving what was never read copies it from the old save without building it.
+    resaved = _local_test_path("lazy_again.ggsave")
+    save_league(resaved, loaded)
+    assert has_pending_sections(team)
+
+    assert [player.name for player in team.roster] == ["Tester One"]
+    assert team.depth_chart["QB"][0] is team.roster[0]
+    assert not has_pending_sections(team)
+    assert [player.name for player in loaded.free_agents] == ["Free Agent"]
+
+    again = load_league(resaved)
+    assert [player.name for player in again.teams[0].roster] == ["Tester One"]
+    assert [player.name for player in again.free_agents] == ["Free Agent"]
+
+
+def test_results_journal_replays_and_compacts(monkeypatch, tmp_path):
+    from gridiron_gm_pkg.simulation.systems.core import data_loader
+
+    monkeypatch.setattr(data_loader, "_save_dir", lambda save_name: tmp_path / save_name)
+    save_name = "results_journal_test"
+    data_loader.save_results({}, save_name)
+    first = {"game_id": "1|A|B", "week": "1", "home_score": 21, "away_score": 17}
+    second = {"game_id": "1|C|D", "week": "1", "home_score": 10, "away_score": 13}
+    data_loader.append_result(first, save_name)
+    data_loader.append_result(second, save_name)
+    data_loader.flush_results_journal(save_name)
+    journal_path = data_loader._save_dir(save_name) / data_loader.RESULTS_JOURNAL_FILENAME
+    with journal_path.open("a") as f:
+        f.write('{"game_id": "1|E|F", "we')
+
+    _, results = data_loader.load_schedule_files(save_name)
+    assert [entry["game_id"] for entry in results["1"]] == ["1|A|B", "1|C|D"]
+
+    data_loader.flush_results_journal(save_name, results, compact=True)
+    assert not journal_path.exists()
+    snapshot = json.loads((data_loader._save_dir(save_name) / "results_by_week.json").read_text())
+    assert snapshot == results
+    data_loader.discard_results_journal(save_name)
+
+
+def test_results_journal_recovers_from_a_torn_write(monkeypatch, tmp_path):
+    from gridiron_gm_pkg.simulation.systems.core import data_loader
+
+    monkeypatch.setattr(data_loader, "_save_dir", lambda save_name: tmp_path / save_name)
+    save_name = "torn_journal_test"
+    journal_path = tmp_path / save_name / data_loader.RESULTS_JOURNAL_FILENAME
+    data_loader.append_result({"game_id": "a", "week": "1"}, save_name)
+    data_loader.flush_results_journal(save_name)
+    with journal_path.open("a") as f:
+        f.write('{"game_id": "b", "we')
+
+    # Appending straight after the torn line must not swallow the next result.
+    data_loader.append_result({"game_id": "c", "week": "1"}, save_name)
+    data_loader.flush_results_journal(save_name)
+    results = {}
+    data_loader.replay_results_journal(results, save_name)
+    assert [entry["game_id"] for entry in results["1"]] == ["a", "c"]
+
+    # Replay truncates a torn tail so later appends start on a fresh line.
+    with journal_path.open("a") as f:
+        f.write('{"game_id": "d", "we')
+    data_loader.replay_results_journal({}, save_name)
+    assert journal_path.read_text().endswith("\n")
+    data_loader.append_result({"game_id": "e", "week": "1"}, save_name)
+    data_loader.flush_results_journal(save_name)
+    results = {}
+    data_loader.replay_results_journal(results, save_name)
+    assert [entry["game_id"] for entry in results["1"]] == ["a", "c", "e"]
+
+
+def test_queued_results_are_flushed_when_the_league_is_saved(monkeypatch, tmp_path):
+    from gridiron_gm_pkg.simulation.systems.core import data_loader
+
+    monkeypatch.setattr(data_loader, "_save_dir", lambda save_name: tmp_path / save_name)
+    save_name = "queued_results_test"
+    data_loader.append_result({"game_id": "a", "week": "1"}, save_name)
+    data_loader.save_league_state(_build_league(), save_name)
+    assert save_name not in data_loader._pending_results
+    results = {}
+    data_loader.replay_results_journal(results, save_name)
+    assert [entry["game_id"] for entry in results["1"]] == ["a"]
+
+    data_loader.append_result({"game_id": "b", "week": "1"}, save_name)
+    data_loader.flush_all_results_journals()
+    results = {}
+    data_loader.replay_results_journal(results, save_name)
+    assert [entry["game_id"] for entry in results["1"]] == ["a", "b"]
+
+
+def test_compressed_saves_round_trip():
+    league = _build_league()
+    league.calendar.current_date = datetime.date(2028, 2, 29)
+    plain = _local_test_path("plain.json")
+    save_league(plain, league)
+    for name, codec in (("league.json.gz", "gzip"), ("league.json.bz2", "bz2"), ("league.json.xz", "lzma")):
+        path = _local_test_path(name)
+        save_league(path, league)
+        assert detect_compression(path) == codec
+        loaded = load_league(path)
+        assert loaded.calendar.current_date == datetime.date(2028, 2, 29)
+        assert [player.name for player in loaded.teams[0].roster] == ["Tester One"]
+
+    # Readers go by the file contents, not the name.
+    renamed = _local_test_path("renamed.json")
+    save_league(renamed, league, compression="gzip")
+    assert detect_compression(renamed) == "gzip"
+    assert read_save_payload(renamed) == read_save_payload(plain)
+
+
+def test_compressed_binary_and_delta_saves():
+    league = _build_league()
+    binary = _local_test_path("packed.ggsave")
+    save_league(binary, league, compression="lzma")
+    assert is_binary_save(binary)
+    loaded = load_league(binary)
+    assert has_pending_sections(loaded.teams[0])
+    assert [player.name for player in loaded.teams[0].roster] == ["Tester One"]
+
+    league.inboxes = {}
+    delta = _local_test_path("delta_gz.json")
+    save_league(delta, league, delta=True, compression="gzip")
+    assert detect_compression(delta) == "gzip"
+    assert all(name.endswith(".json.gz") for name in _chunk_files(delta))
+    assert [player.name for player in load_league(delta).free_agents] == ["Free Agent"]
+
+
+def test_results_snapshot_compression(tmp_path, monkeypatch):
+    from gridiron_gm_pkg.simulation.systems.core import data_loader
+
+    monkeypatch.setattr(data_loader, "_save_dir", lambda save_name: tmp_path / save_name)
+    save_name = "results_compression_test"
+    results = {"1": [{"game_id": "1|A|B", "week": "1", "home_score": 21, "away_score": 17}]}
+    data_loader.save_results(results, save_name, compression="bz2")
+    path = data_loader._save_dir(save_name) / "results_by_week.json"
+    assert detect_compression(path) == "bz2"
+    assert data_loader.load_schedule_files(save_name)[1] == results
+    data_loader.discard_results_journal(save_name)
@@ -1,3 +1,4 @@
+import copy
 import datetime
 
 from gridiron_gm_pkg.simulation.entities.league import LeagueManager
@@ -56,3 +57,31 @@ def test_season_progression_guard_survives_save_data():
 
     assert loaded.last_season_progression == "2030"
     assert apply_season_progression(loaded, 2030)["applied"] is False
+
+
+def test_season_progression_rolls_depend_only_on_player_and_year():
+    players = [_player(f"Prospect {idx}", 21 + idx % 4) for idx in range(12)]
+    players += [_player(f"Veteran {idx}", 36 + idx % 4) for idx in range(12)]
+    league = LeagueManager()
+    league.base_seed = 99
+    league.free_agents = players
+    shuffled = LeagueManager()
+    shuffled.base_seed = 99
+    shuffled.free_agents = list(reversed(copy.deepcopy(players)))
+    before = {player.id: player.get_all_attributes() for player in players}
+
+    result = apply_season_progression(league, 2031)
+    reversed_result = apply_season_progression(shuffled, 2031)
+
+    by_id = {entry["player_id"]: entry for entry in result["players"]}
+    assert by_id == {entry["player_id"]: entry for entry in reversed_result["players"]}
+    assert set(by_id) == {player.id for player in players}
+    assert any(entry["changes"] for entry in by_id.values())
+    for player in players:
+        changes = by_id[player.id]["changes"]
+        assert all(delta == 1 for delta in changes.values())
+        for attr, value in player.last_attribute_values.items():
+            assert value == before[player.id][attr] + changes.get(attr, 0)
+            assert player.no_growth_years[attr] == (0 if attr in changes else 1)
+        assert player.progress_history["2031"]["changes"] == changes
+        assert by_id[player.id]["retired"] == bool(getattr(player, "retired", False))
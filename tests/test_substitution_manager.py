@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+from gridiron_gm_pkg.simulation.systems.player.fatigue import FatigueSystem
+from gridiron_gm_pkg.simulation.systems.roster.substitution_manager import SubstitutionManagerV2
+
+
+def _player(name, position):
+    return SimpleNamespace(name=name, position=position, fatigue=0.0, stamina=80)
+
+
+def _depth_chart():
+    chart = {"QB": [_player("QB1", "QB")], "RB": [_player("RB1", "RB"), _player("RB2", "RB")]}
+    for position, count in SubstitutionManagerV2.DEFENSE_SCHEME.items():
+        chart[position] = [_player(f"{position}{i + 1}", position) for i in range(count)]
+    return chart
+
+
+def test_lineup_swaps_only_when_fatigue_crosses_threshold():
+    chart = _depth_chart()
+    starter, backup = chart["RB"]
+    manager = SubstitutionManagerV2(chart)
+    scheme = {"QB": 1, "RB": 1}
+    fatigue_system = FatigueSystem()
+    fatigue_log = []
+
+    lineup, bench_log = manager.get_active_lineup_with_bench_log({}, None, fatigue_log, scheme)
+    assert lineup["offense"] == [chart["QB"][0], starter]
+    assert len(lineup["defense"]) == 11
+    assert bench_log == []
+
+    while starter.fatigue < manager.fatigue_threshold:
+        fatigue_system.add_fatigue(starter, play_intensity=5)
+    lineup, bench_log = manager.get_active_lineup_with_bench_log({}, None, fatigue_log, scheme)
+    assert lineup["offense"][1] is backup
+    assert bench_log == ["RB: RB1 → RB2"]
+
+    # Still tired, but nothing crossed the threshold: no new log lines.
+    fatigue_system.add_fatigue(starter, play_intensity=1)
+    lineup, bench_log = manager.get_active_lineup_with_bench_log({}, None, fatigue_log, scheme)
+    assert lineup["offense"][1] is backup
+    assert bench_log == []
+    assert len(fatigue_log) == 1
+
+    fatigue_system.recover(starter, context="between_games")
+    lineup, bench_log = manager.get_active_lineup_with_bench_log({}, None, fatigue_log, scheme)
+    assert lineup["offense"][1] is starter
+    assert bench_log == ["RB: RB2 → RB1"]
+
+
+def test_invalidate_picks_up_direct_fatigue_changes():
+    chart = _depth_chart()
+    manager = SubstitutionManagerV2(chart)
+    scheme = {"RB": 1}
+    manager.get_active_lineup_with_bench_log({}, None, [], scheme)
+
+    chart["RB"][0].fatigue = 0.95
+    lineup, _ = manager.get_active_lineup_with_bench_log({}, None, [], scheme)
+    assert lineup["offense"] == [chart["RB"][0]]
+
+    manager.invalidate()
+    lineup, bench_log = manager.get_active_lineup_with_bench_log({}, None, [], scheme, record_log=False)
+    assert lineup["offense"] == [chart["RB"][1]]
+    assert bench_log == []
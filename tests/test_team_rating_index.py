@@ -0,0 +1,115 @@
+import copy
+import datetime
+import random
+
+from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
+from gridiron_gm_pkg.simulation.entities.team import Team
+from gridiron_gm_pkg.simulation.rules.transactions import release_player, sign_free_agent
+from gridiron_gm_pkg.simulation.systems.player.injury_status import (
+    apply_simple_injury,
+    assign_game_injuries,
+    clear_injury_fields,
+)
+from gridiron_gm_pkg.simulation.systems.roster.team_rating_index import notify_player_changed
+from gridiron_gm_pkg.simulation.systems.time_engine import _roster_strength
+from gridiron_gm_pkg.simulation.utils.box_score import _pick_player
+
+_POSITIONS = ("QB", "RB", "WR", "WR", "TE", "LT", "DE", "LB", "CB", "S")
+
+
+def _player(name, position, overall):
+    return Player(name, position, 26, datetime.date(2000, 1, 1), "U", "USA", 10, overall)
+
+
+def _league():
+    league = LeagueManager()
+    for abbr in ("AAA", "BBB"):
+        team = Team(f"{abbr} Team", "City", abbr)
+        for idx, position in enumerate(_POSITIONS):
+            team.add_player(_player(f"{abbr} {position}{idx}", position, 60 + idx * 3))
+        league.add_team(team)
+    return league
+
+
+def _scan_healthy(team):
+    return [p for p in team.roster if getattr(p, "injury_status", "healthy") == "healthy"]
+
+
+def test_index_tracks_roster_injury_and_rating_changes():
+    league = _league()
+    index = league.rating_index
+    team = league.teams[0]
+    assert index.strength(team) == _roster_strength(team)
+    assert index.starters(team) == team.get_starters()
+
+    rookie = _player("Rookie WR", "WR", 99)
+    team.add_player(rookie)
+    assert index.strength(team) == _roster_strength(team)
+    assert index.players_at(team, ["WR"])[-1] is rookie
+    assert index.starters(team) == team.get_starters()
+
+    injured = team.roster[2]
+    apply_simple_injury(injured, datetime.date(2027, 9, 1), 14, "Sprain")
+    assert injured not in index.healthy_players(team)
+    clear_injury_fields(injured)
+    assert index.healthy_players(team) == _scan_healthy(team)
+
+    rookie.attributes.core["speed"] = 0
+    rookie.normalize_ratings()
+    assert index.strength(team) == _roster_strength(team)
+
+    # A position change files the player in roster order under the new position.
+    moved = team.roster[0]
+    moved.position = "WR"
+    notify_player_changed(moved)
+    assert index.players_at(team, ["WR"]) == [p for p in team.roster if p.position == "WR"]
+    assert index.players_at(team, ["QB"]) == []
+    moved.position = "QB"
+    notify_player_changed(moved)
+
+    team.remove_player(rookie)
+    assert rookie not in index.players_at(team, ["WR"])
+    assert index.strength(team) == _roster_strength(team)
+
+    # Writes that bypass the hooks are caught by the roster-length check.
+    team.roster.append(rookie)
+    assert index.strength(team) == _roster_strength(team)
+
+
+def test_index_follows_transactions():
+    league = _league()
+    index = league.rating_index
+    team = league.teams[0]
+    index.strength(team)
+    team.salary_cap = 1_000_000
+    free_agent = _player("Free Agent", "RB", 90)
+    league.free_agents.append(free_agent)
+    contract = {"years": 1, "salary_per_year": 100_000, "guaranteed": 0}
+
+    assert sign_free_agent(league, team.id, free_agent.id, contract)["ok"] is True
+    assert index.players_at(team, ["RB"])[-1] is free_agent
+    assert index.strength(team) == _roster_strength(team)
+
+    assert release_player(league, team.id, free_agent.id)["ok"] is True
+    assert free_agent not in index.players_at(team, ["RB"])
+    assert index.strength(team) == _roster_strength(team)
+
+
+def test_indexed_game_day_draws_match_roster_scans():
+    league = _league()
+    home, away = league.teams
+    apply_simple_injury(home.roster[3], datetime.date(2027, 9, 1), 21, "Strain")
+    scanned_home, scanned_away = copy.deepcopy((home, away))
+    league.rating_index.strength(home)
+    league.rating_index.strength(away)
+
+    for seed in range(40):
+        picks = [_pick_player(home, {"WR", "TE", "RB"}, random.Random(seed))]
+        scanned = [_pick_player(scanned_home, {"WR", "TE", "RB"}, random.Random(seed))]
+        assert [p.name for p in picks] == [p.name for p in scanned]
+
+        # Both sides accumulate the same injuries, so the health lists stay comparable.
+        indexed = assign_game_injuries(home, away, datetime.date(2027, 9, 8), random.Random(seed))
+        expected = assign_game_injuries(scanned_home, scanned_away, datetime.date(2027, 9, 8), random.Random(seed))
+        assert [i["player_name"] for i in indexed] == [i["player_name"] for i in expected]
@@ -1,12 +1,19 @@
+import copy
 import datetime
 
 from gridiron_gm_pkg.simulation.entities.league import LeagueManager
+from gridiron_gm_pkg.simulation.entities.player import Player
 from gridiron_gm_pkg.simulation.entities.team import Team
 from gridiron_gm_pkg.simulation.systems.game.playoff_manager import advance_playoff_schedule
+from gridiron_gm_pkg.simulation.systems.player.injury_status import heal_league_players
 from gridiron_gm_pkg.simulation.systems.time_engine import (
+    EventQueue,
     InboxMessage,
+    ScheduleIndex,
     TimeEngine,
+    _GAME_POOLS,
     make_game_id,
+    shutdown_game_pools,
 )
 from gridiron_gm_pkg.simulation.utils.generate_schedule import add_nfl_style_playoff_schedule
 
@@ -187,6 +194,62 @@ def test_clock_serializes_current_time():
     assert payload["hour"] == 8
 
 
+def test_event_queue_orders_cancels_and_round_trips():
+    queue = EventQueue()
+    day = datetime.date(2025, 9, 1)
+    queue.schedule(day + datetime.timedelta(days=1), 9, "InboxCheck", priority=10)
+    queue.schedule(day, 13, "GameKickoff", {"game_id": "1|A|B"}, priority=40)
+    queue.schedule(day, 10, "TrainingSlot", priority=20)
+    queue.schedule(day, 10, "TrainingSlot", priority=5)
+    for hour in range(200):
+        queue.schedule(day, hour % 24, "Travel", priority=30)
+
+    queue.remove_matching(lambda event: event.type == "Travel")
+    assert len(queue) == 4
+    assert [(event.hour, event.priority) for event in queue.events()] == [
+        (10, 5),
+        (10, 20),
+        (13, 40),
+        (9, 10),
+    ]
+
+    restored = EventQueue.deserialize(queue.serialize())
+    assert restored.serialize() == queue.serialize()
+    assert queue.pop_next().priority == 5
+    queue.remove_matching(lambda event: event.type == "TrainingSlot")
+    assert queue.peek_next().type == "GameKickoff"
+    assert [event.type for event in iter(queue.pop_next, None)] == ["GameKickoff", "InboxCheck"]
+    assert queue.peek_next() is None
+
+
+def test_schedule_index_tracks_dates_and_filled_playoff_games():
+    sunday = datetime.date(2025, 9, 7)
+    playoff_game = {"home_id": "TBD-1", "away_id": "TBD-2", "date": "2026-01-10", "playoff": True}
+    schedule = {
+        "1": [
+            {"home_id": "A", "away_id": "B", "day": "Sunday", "kickoff": "1:00 PM"},
+            {"home_id": "C", "away_id": "D", "date": sunday.isoformat(), "kickoff": "4:00 PM"},
+            {"home_id": "E", "away_id": "F", "day": "Monday"},
+        ],
+        "19": [playoff_game],
+    }
+    index = ScheduleIndex(schedule)
+
+    assert [game["home_id"] for _, game, _, _ in index.games_on("1", sunday)] == ["A", "C"]
+    assert [game["home_id"] for _, game, _, _ in index.games_on("1", sunday + datetime.timedelta(days=1))] == ["E"]
+    assert index.find_game("1", "C", "D") is schedule["1"][1]
+
+    playoff_game["home_id"] = "A"
+    playoff_game["away_id"] = "C"
+    assert index.sync(schedule) is False
+    assert index.find_game("19", "A", "C") is playoff_game
+    assert index.find_game("19", "TBD-1", "TBD-2") is None
+
+    schedule["20"] = [{"home_id": "G", "away_id": "H", "day": "Sunday"}]
+    assert index.sync(schedule) is True
+    assert index.find_game("20", "G", "H") is schedule["20"][0]
+
+
 def test_advance_to_next_event_processes_next_timestamp():
     engine, _, _ = _make_engine(seed=19, away_tomorrow=True)
     result = engine.advance_to_next_event(max_hours=8)
@@ -224,6 +287,123 @@ def test_advance_one_week_reaches_target_timestamp_without_schedule():
     assert engine.clock.hour == 8
 
 
+def test_idle_hour_fast_forward_matches_hourly_stepping():
+    fast, _, _ = _make_engine(seed=77)
+    slow = copy.deepcopy(fast)
+    slow.FAST_FORWARD_IDLE_HOURS = False
+
+    fast_result = fast.advance_one_week()
+    slow_result = slow.advance_one_week()
+
+    assert fast_result["stop_reason"] == slow_result["stop_reason"] == "one_week"
+    assert fast_result["advanced_hours"] == slow_result["advanced_hours"]
+    assert fast_result["clock"] == slow_result["clock"]
+    assert fast_result["processed_events"] == slow_result["processed_events"]
+    assert fast.queue.serialize() == slow.queue.serialize()
+    assert fast.rng_streams.serialize() == slow.rng_streams.serialize()
+    assert fast.league.results_by_week == slow.league.results_by_week
+    assert fast.calendar.serialize() == slow.calendar.serialize()
+
+
+def _make_slate_engine(team_count=16, seed=17):
+    league = LeagueManager()
+    date = datetime.date(2025, 9, 7)
+    teams = []
+    for idx in range(team_count):
+        team = Team(f"Team{idx}", f"City{idx}", f"T{idx:02d}", conference="Nova", division="East")
+        team.id = f"team-{idx:02d}"
+        for slot, position in enumerate(("QB", "RB", "WR", "TE", "OL", "DL", "LB", "CB")):
+            team.add_player(
+                Player(
+                    name=f"P{idx}-{slot}",
+                    position=position,
+                    age=25,
+                    dob=datetime.date(2000, 1, 1),
+                    college="U",
+                    birth_location="USA",
+                    jersey_number=slot + 1,
+                    overall=60 + (idx * 7 + slot * 3) % 30,
+                )
+            )
+        league.add_team(team)
+        teams.append(team)
+    user_team = Team("Users", "Home", "USR", conference="Atlas", division="West")
+    league.add_team(user_team)
+    league.user_team_id = user_team.id
+    league.base_seed = seed
+    league.calendar.current_date = date
+    league.calendar.current_week = 1
+    schedule_by_week = {
+        "1": [
+            {
+                "home_id": teams[idx].id,
+                "away_id": teams[idx + 1].id,
+                "day": date.strftime("%A"),
+                "week": 1,
+                "kickoff": "1:00 PM",
+            }
+            for idx in range(0, team_count, 2)
+        ]
+    }
+    engine = TimeEngine(league, league.calendar, schedule_by_week=schedule_by_week)
+    engine.clock.hour = 8
+    engine.ensure_agenda_for_today()
+    return engine
+
+
+def test_parallel_slate_matches_serial_simulation():
+    serial = _make_slate_engine()
+    parallel = copy.deepcopy(serial)
+    parallel.PARALLEL_GAME_WORKERS = 2
+
+    def injuries(engine):
+        return [
+            (player.name, player.injury_status, player.injury_end_date, player.injury_severity)
+            for team in engine.league.teams
+            for player in team.roster
+        ]
+
+    try:
+        for _ in range(12):
+            serial.advance_hour()
+            parallel.advance_hour()
+        assert _GAME_POOLS
+    finally:
+        shutdown_game_pools()
+
+    assert len(serial.league.results_by_week["1"]) == 8
+    assert parallel.league.results_by_week == serial.league.results_by_week
+    assert parallel.league.standings == serial.league.standings
+    assert injuries(parallel) == injuries(serial)
+    assert any(status != "healthy" for _, status, _, _ in injuries(serial))
+    assert parallel._prepared_games == {}
+
+
+def test_parallel_slate_injuries_reach_the_injury_index():
+    engine = _make_slate_engine()
+    engine.PARALLEL_GAME_WORKERS = 2
+    try:
+        for _ in range(12):
+            engine.advance_hour()
+    finally:
+        shutdown_game_pools()
+
+    league = engine.league
+    injured = [
+        player
+        for team in league.teams
+        for player in team.roster
+        if player.injury_status != "healthy"
+    ]
+    assert injured
+    assert league.injury_index.verify(league) == []
+
+    last_day = max(player.injury_end_date for player in injured)
+    heal_league_players(league, last_day + datetime.timedelta(days=1))
+    assert all(player.injury_status == "healthy" for player in injured)
+    assert league.injury_index.verify(league) == []
+
+
 def test_continue_pauses_for_user_playoff_game_and_inbox_manual_sim():
     engine, team_a, team_b = _make_engine(seed=27)
     playoff_start = engine.calendar.phase_boundaries[engine.calendar.PHASE_PLAYOFFS][0]